@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Candle Archive Benchmark
+Un an de lumanari de 1m: scriere, citiri de interval prin memmap si cititori concurenti din alte procese
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.candle_archive import RECORD_DTYPE, CandleArchive
+
+MINUTE = 60
+YEAR_START = 1704067200  # 2024-01-01 UTC
+
+
+def synthetic_year(candles: int) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    records = np.empty(candles, dtype=RECORD_DTYPE)
+    records["timestamp"] = YEAR_START + np.arange(candles) * MINUTE
+    close = 40000 * np.exp(np.cumsum(rng.normal(0, 0.0005, candles)))
+    records["open"] = np.concatenate(([close[0]], close[:-1]))
+    records["high"] = np.maximum(records["open"], close) * 1.0005
+    records["low"] = np.minimum(records["open"], close) * 0.9995
+    records["close"] = close
+    records["volume"] = rng.uniform(1, 100, candles)
+    return records
+
+
+def read_in_process(root: str, start: int, end: int) -> tuple:
+    """Cititor independent: deschide arhiva si citeste intervalul"""
+    archive = CandleArchive(root)
+    started = time.perf_counter()
+    candles = archive.read("BTCUSDT", "1m", start, end)
+    close_sum = float(candles["close"].sum())
+    return len(candles), close_sum, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark arhiva de lumanari")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--readers", type=int, default=4, help="Procese care citesc concurent")
+    args = parser.parse_args()
+
+    candles = args.days * 24 * 60
+    records = synthetic_year(candles)
+
+    with tempfile.TemporaryDirectory() as root:
+        archive = CandleArchive(root)
+
+        started = time.perf_counter()
+        # Scriere in bucati de o zi, ca in functionare (append-only)
+        for offset in range(0, candles, 1440):
+            archive.append("BTCUSDT", "1m", records[offset:offset + 1440])
+        write_seconds = time.perf_counter() - started
+        size_mb = (Path(root) / "BTCUSDT" / "1m.candles").stat().st_size / 1e6
+
+        reader = CandleArchive(root)
+        year_end = YEAR_START + candles * MINUTE
+        ranges = {
+            "1 day": (year_end - 86400, year_end),
+            "1 month": (year_end - 30 * 86400, year_end),
+            f"{args.days} days": (YEAR_START, year_end),
+        }
+
+        print(f"{candles:,} x 1m candles, {size_mb:.1f} MB, append {write_seconds * 1000:.1f} ms")
+        reader.read("BTCUSDT", "1m", YEAR_START, YEAR_START + 1)  # maparea initiala
+        for label, (start, end) in ranges.items():
+            started = time.perf_counter()
+            view = reader.read("BTCUSDT", "1m", start, end)
+            seconds = time.perf_counter() - started
+            zero_copy = np.shares_memory(view, reader.read("BTCUSDT", "1m"))
+            print(f"  range {label:>9}: {len(view):>7,} candles in {seconds * 1000:7.3f} ms | zero-copy: {zero_copy}")
+            assert len(view) == (end - start) // MINUTE
+
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=args.readers) as pool:
+            results = list(pool.map(read_in_process, [root] * args.readers,
+                                    [YEAR_START] * args.readers, [year_end] * args.readers))
+        expected = float(records["close"].sum())
+        consistent = all(count == candles and np.isclose(total, expected) for count, total, _ in results)
+        print(f"  {args.readers} concurrent reader processes: {(time.perf_counter() - started) * 1000:.1f} ms total, "
+              f"max read {max(seconds for _, _, seconds in results) * 1000:.2f} ms | consistent: {consistent}")
+
+        if not consistent:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Indicators Benchmark
+Costul unui tick pe 500 de simboluri (motor incremental vs recalculare) si screen-ul vectorizat
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.indicators import TechnicalIndicators
+
+
+def random_walk(length: int, rng: random.Random) -> list:
+    closes = [rng.uniform(0.1, 50000)]
+    for _ in range(length - 1):
+        closes.append(closes[-1] * (1 + rng.gauss(0, 0.005)))
+    return closes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indicatori incrementali")
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--history", type=int, default=500, help="Lumanari inchise per simbol")
+    parser.add_argument("--ticks", type=int, default=20, help="Tick-uri live per simbol")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    symbols = [f"SYM{i}USDT" for i in range(args.symbols)]
+    history = {symbol: random_walk(args.history + 1, rng) for symbol in symbols}
+    indicators = TechnicalIndicators()
+
+    started = time.perf_counter()
+    for symbol in symbols:
+        indicators.warm_up(symbol, "5m", history[symbol][:-1])
+    warm_up = time.perf_counter() - started
+
+    # Tick-uri pe lumanarea live, apoi inchiderea ei
+    ticks = [[history[symbol][-1] * (1 + rng.gauss(0, 0.001)) for symbol in symbols] for _ in range(args.ticks)]
+    started = time.perf_counter()
+    for prices in ticks:
+        for symbol, price in zip(symbols, prices):
+            indicators.update(symbol, "5m", price, closed=False)
+    tick_seconds = (time.perf_counter() - started) / args.ticks
+
+    started = time.perf_counter()
+    closed = {symbol: indicators.update(symbol, "5m", history[symbol][-1]) for symbol in symbols}
+    close_seconds = time.perf_counter() - started
+
+    # Referinta: recalcularea batch pe tot istoricul, pentru fiecare simbol
+    started = time.perf_counter()
+    batch = {symbol: indicators.compute(history[symbol]) for symbol in symbols}
+    batch_seconds = time.perf_counter() - started
+
+    mismatches = [symbol for symbol in symbols if closed[symbol] != batch[symbol]]
+
+    # Screen pe tot universul: matrice (simboluri x timp), istorice de lungimi diferite
+    histories = [history[symbol][-rng.randint(10, args.history + 1):] for symbol in symbols]
+    closes, mask = indicators.stack_histories(histories)
+    started = time.perf_counter()
+    vectorized = indicators.compute_batch(closes, mask)
+    vectorized_seconds = time.perf_counter() - started
+
+    max_error = 0.0
+    for row, closes_row in enumerate(histories):
+        for name, value in indicators.compute(closes_row).items():
+            if value is None:
+                continue
+            max_error = max(max_error, abs(vectorized[name][row] - value) / max(abs(value), 1.0))
+
+    print(f"{args.symbols} symbols x {args.history} candles (warm-up {warm_up:.2f}s)")
+    print(f"  live tick, incremental : {tick_seconds * 1000:8.2f} ms per round | "
+          f"{tick_seconds / args.symbols * 1e6:6.1f} us per symbol")
+    print(f"  candle close, increm.  : {close_seconds * 1000:8.2f} ms per round | "
+          f"{close_seconds / args.symbols * 1e6:6.1f} us per symbol")
+    print(f"  batch recompute        : {batch_seconds * 1000:8.2f} ms per round | "
+          f"{batch_seconds / args.symbols * 1e6:6.1f} us per symbol")
+    print(f"  bit-identical to batch : {'yes' if not mismatches else f'NO ({len(mismatches)} symbols differ)'}")
+    print(f"  vectorized universe    : {vectorized_seconds * 1000:8.2f} ms for {closes.shape[0]} x {closes.shape[1]} "
+          f"(ragged) | max relative error vs batch {max_error:.1e}")
+
+    if mismatches or not np.isfinite(max_error) or max_error > 1e-9:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Response Parser Benchmark
+Compara parse_response cu cele sase scanari _extract_* folosite anterior si cu un parser
+care parcurge textul o singura data, cu un regex unic pentru toate cuvintele cheie si etichetele
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.response_parser import (_KEYWORD_RULES, _LEVEL_LABELS, _LEVEL_VALUE, ParsedResponse,
+                                      normalize_confidence, _to_float, parse_response)
+
+SAMPLE = """
+BTCUSDT arata un uptrend pe 1h si 4h, cu high volume pe ultimele lumanari.
+RSI este la 64, MACD a facut un bullish cross, pretul se afla langa banda superioara Bollinger.
+Support at 62,000 si resistance at 64,800. Recomandare: BUY.
+Entry: $63,250.50, stop loss: 61,800, take profit: 65,500. Confidence: 78%.
+Riscuri: news minor pe ETF, sentiment general optimistic.
+"""
+
+
+def legacy_parse(response: str) -> dict:
+    """Cele sase scanari separate pe textul lowercased (implementarea veche)"""
+    result = {}
+    for field, rules in [
+        ("sentiment", [("bullish", ["bullish", "positive", "optimistic", "green"]),
+                       ("bearish", ["bearish", "negative", "pessimistic", "red"])]),
+        ("trend", [("uptrend", ["uptrend", "up trend"]), ("downtrend", ["downtrend", "down trend"])]),
+        ("volume", [("high", ["high volume", "increased volume"]), ("low", ["low volume", "decreased volume"])]),
+        ("news", [("high", ["major news", "important", "significant"]), ("low", ["minor", "small impact"])]),
+        ("action", [("BUY", ["buy", "long"]), ("SELL", ["sell", "short"])]),
+        ("confidence", [(0.8, ["strong", "confident", "clear"]), (0.4, ["weak", "uncertain", "mixed"])]),
+    ]:
+        response_lower = response.lower()
+        result[field] = next((value for value, words in rules if any(w in response_lower for w in words)), None)
+    return result
+
+
+def _single_pass_scanner():
+    words = {word for _, rules, _ in _KEYWORD_RULES for _, group in rules for word in group}
+    words.update(label for label, _ in _LEVEL_LABELS)
+    ordered = sorted(words, key=len, reverse=True)
+    # Un cuvant care incepe in aceeasi pozitie cu unul mai lung ("confident" in "confidence")
+    prefixes = {word: [other for other in ordered if word.startswith(other)] for word in ordered}
+    # Lookahead: gaseste si aparitiile suprapuse, ca `in`
+    return re.compile("(?=(" + "|".join(re.escape(word) for word in ordered) + "))"), prefixes
+
+
+_SCANNER, _PREFIXES = _single_pass_scanner()
+_LABEL_FIELDS = dict(_LEVEL_LABELS)
+
+
+def single_pass_parse(response: str) -> ParsedResponse:
+    """Aceleasi campuri ca parse_response, dintr-o singura parcurgere a textului cu un regex unic"""
+    text = response.lower()
+    seen, values = set(), {}
+    for match in _SCANNER.finditer(text):
+        for word in _PREFIXES[match.group(1)]:
+            seen.add(word)
+            field = _LABEL_FIELDS.get(word)
+            if field is None or word in values:
+                continue
+            level = _LEVEL_VALUE.match(text, match.start() + len(word))
+            if not level:
+                continue
+            value, is_percent, scale = _to_float(level.group("value")), bool(level.group("pct")), level.group("scale")
+            if field == "confidence":
+                values[word] = normalize_confidence(value, is_percent, scale)
+            elif not (is_percent or scale):
+                values[word] = value
+
+    fields = {field: next((value for value, words in rules if any(word in seen for word in words)), default)
+              for field, rules, default in _KEYWORD_RULES}
+    levels = {}
+    for label, field in _LEVEL_LABELS:
+        if field not in levels and label in values:
+            levels[field] = values[label]
+
+    return ParsedResponse(
+        sentiment=fields["sentiment"], trend=fields["trend"], volume_status=fields["volume_status"],
+        news_impact=fields["news_impact"], action=fields["action"],
+        entry_price=levels.get("entry_price", 0.0), stop_loss=levels.get("stop_loss", 0.0),
+        take_profit=levels.get("take_profit", 0.0), support=levels.get("support", 0.0),
+        resistance=levels.get("resistance", 0.0), explicit_confidence=levels.get("confidence"),
+        strong_language=fields["tone"] == "strong", weak_language=fields["tone"] == "weak",
+    )
+
+
+# Cazul cel mai defavorabil: niciun cuvant cheie, fiecare scanare parcurge tot textul
+NO_KEYWORDS = "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor.\n"
+
+
+def main():
+    print("legacy: 6 x (lower + scanari `in`), fara nivele | parse_response: lower o data, cautari `in`/find per "
+          "cuvant si eticheta | single pass: un regex, o parcurgere (ambele extrag si nivelele)")
+    for label, sample in (("typical", SAMPLE), ("no keywords", NO_KEYWORDS)):
+        for multiplier in (1, 50, 500):
+            text = sample * multiplier
+            # Cele doua parsere complete trebuie sa extraga exact aceleasi campuri
+            assert single_pass_parse(text) == parse_response(text)
+            number = max(10, 2000 // multiplier)
+            legacy = timeit.timeit(lambda: legacy_parse(text), number=number) / number
+            parsed = timeit.timeit(lambda: parse_response(text), number=number) / number
+            single = timeit.timeit(lambda: single_pass_parse(text), number=number) / number
+            print(f"{label:>11} | {len(text):>9,} chars | legacy _extract_*: {legacy * 1e6:9.1f} us "
+                  f"| parse_response: {parsed * 1e6:9.1f} us | single pass: {single * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,15 +14,15 @@ from typing import Optional
 import subprocess
 import time
 
-# Add src to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+# Add project root to path (acelasi modul src.core.ai_agent ca API-ul, care ruleaza in acest proces)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
 
 from loguru import logger
 from dotenv import load_dotenv
 
 # Import our components
-from core.ai_agent import CryptoAIAgent
+from src.core.ai_agent import CryptoAIAgent
 
 # Load environment variables
 load_dotenv()
@@ -32,7 +32,8 @@ class CryptoAssistantLauncher:
     
     def __init__(self):
         self.agent: Optional[CryptoAIAgent] = None
-        self.api_process: Optional[subprocess.Popen] = None
+        self.api_server = None
+        self.api_task: Optional[asyncio.Task] = None
         self.dashboard_process: Optional[subprocess.Popen] = None
         self.running = False
         
@@ -112,6 +113,9 @@ class CryptoAssistantLauncher:
         try:
             logger.info("Starting Crypto AI Agent...")
             self.agent = CryptoAIAgent()
+            
+            # LLM, MCP si componentele de trading se initializeaza in fundal
+            self.agent.start_warm_up()
             logger.info("✅ Crypto AI Agent started successfully")
             return True
             
@@ -119,38 +123,41 @@ class CryptoAssistantLauncher:
             logger.error(f"❌ Failed to start AI Agent: {e}")
             return False
     
-    def start_api_server(self) -> bool:
-        """Porneste serverul FastAPI"""
+    async def start_api_server(self) -> bool:
+        """Porneste serverul FastAPI in acest proces, cu acelasi agent ca loop-ul de trading.
+        
+        API-ul si loop-ul impart astfel un singur LLMCapacityScheduler: request-urile interactive
+        au prioritate fata de scanari si raman in aceeasi limita concurrentServers/rateLimit.
+        """
         try:
             logger.info("Starting FastAPI server...")
+            import uvicorn
+            from web import api
             
             api_host = os.getenv("API_HOST", "127.0.0.1")
             api_port = int(os.getenv("API_PORT", "8000"))
             
-            cmd = [
-                sys.executable, "-m", "uvicorn",
-                "web.api:app",
-                "--host", api_host,
-                "--port", str(api_port),
-                "--reload" if os.getenv("DEVELOPMENT_MODE", "true").lower() == "true" else "--no-reload"
-            ]
+            class EmbeddedServer(uvicorn.Server):
+                def install_signal_handlers(self) -> None:
+                    # Semnalele raman la launcher (shutdown-ul opreste si serverul)
+                    pass
             
-            self.api_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            api.agent = self.agent
+            self.api_server = EmbeddedServer(uvicorn.Config(api.app, host=api_host, port=api_port, log_level="info"))
+            self.api_task = asyncio.create_task(self.api_server.serve())
             
             # Wait a bit to see if it starts successfully
-            time.sleep(3)
+            for _ in range(30):
+                if self.api_server.started or self.api_task.done():
+                    break
+                await asyncio.sleep(0.1)
             
-            if self.api_process.poll() is None:
+            if self.api_server.started:
                 logger.info(f"✅ FastAPI server started on http://{api_host}:{api_port}")
                 return True
             else:
-                stdout, stderr = self.api_process.communicate()
-                logger.error(f"❌ FastAPI server failed to start: {stderr}")
+                error = self.api_task.exception() if self.api_task.done() and not self.api_task.cancelled() else None
+                logger.error(f"❌ FastAPI server failed to start: {error or 'startup timeout'}")
                 return False
                 
         except Exception as e:
@@ -231,14 +238,13 @@ class CryptoAssistantLauncher:
                 logger.error(f"Error stopping trading session: {e}")
         
         # Stop API server
-        if self.api_process:
+        if self.api_task:
             try:
-                self.api_process.terminate()
-                self.api_process.wait(timeout=10)
+                self.api_server.should_exit = True
+                await asyncio.wait_for(self.api_task, timeout=10)
                 logger.info("✅ API server stopped")
-            except subprocess.TimeoutExpired:
-                self.api_process.kill()
-                logger.warning("API server forcefully killed")
+            except asyncio.TimeoutError:
+                logger.warning("API server forcefully stopped")
             except Exception as e:
                 logger.error(f"Error stopping API server: {e}")
         
@@ -276,7 +282,7 @@ class CryptoAssistantLauncher:
             success = False
         
         # 2. Start API Server
-        if success and not self.start_api_server():
+        if success and not await self.start_api_server():
             success = False
         
         # 3. Start Dashboard
@@ -371,7 +377,7 @@ class CryptoAssistantLauncher:
             return
         
         # Start API Server
-        if not self.start_api_server():
+        if not await self.start_api_server():
             logger.error("❌ Failed to start API server")
             await self.shutdown()
             return
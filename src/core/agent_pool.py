@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - MCP Agent Pool
+Pool de instante MCPAgent pre-initializate, reutilizate intre request-uri
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional
+
+from loguru import logger
+
+
+class MCPAgentPool:
+    """Pool cu semantica checkout/return pentru agentii MCP"""
+
+    def __init__(self, factory: Callable[[], Any], size: int = 4, metrics_window: int = 500):
+        if size < 1:
+            raise ValueError("Agent pool size must be at least 1")
+
+        self.factory = factory
+        self.size = size
+        self._idle: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._created = 0
+        self._create_lock = asyncio.Lock()
+
+        # Metrics
+        self._wait_times: Deque[float] = deque(maxlen=metrics_window)
+        self._checkouts = 0
+        self._in_use = 0
+
+    async def _create_agent(self) -> Any:
+        """Construieste un agent nou si descopera tool-urile MCP"""
+        agent = self.factory()
+        if hasattr(agent, "initialize"):
+            await agent.initialize()
+        return agent
+
+    async def warm_up(self, count: Optional[int] = None) -> None:
+        """Pre-creeaza agenti pentru ca primele request-uri sa nu astepte initializarea"""
+        target = min(self.size, count if count is not None else self.size)
+        while self._created < target:
+            async with self._create_lock:
+                if self._created >= target:
+                    break
+                self._created += 1
+            try:
+                self._idle.put_nowait(await self._create_agent())
+            except Exception as e:
+                self._created -= 1
+                logger.error(f"Error warming up MCP agent: {e}")
+                break
+        logger.info(f"MCP agent pool warmed up: {self._created}/{self.size} agents")
+
+    async def checkout(self) -> Any:
+        """Obtine un agent liber (creeaza unul nou daca pool-ul nu e plin)"""
+        started = time.monotonic()
+        try:
+            try:
+                agent = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                create = False
+                async with self._create_lock:
+                    if self._created < self.size:
+                        self._created += 1
+                        create = True
+                if create:
+                    try:
+                        agent = await self._create_agent()
+                    except Exception:
+                        self._created -= 1
+                        raise
+                else:
+                    agent = await self._idle.get()
+        finally:
+            self._wait_times.append(time.monotonic() - started)
+
+        self._checkouts += 1
+        self._in_use += 1
+        return agent
+
+    async def release(self, agent: Any) -> None:
+        """Returneaza agentul in pool, fara istoricul conversatiei curente"""
+        self._in_use -= 1
+        try:
+            if hasattr(agent, "clear_conversation_history"):
+                agent.clear_conversation_history()
+        except Exception as e:
+            # Agentul nu mai poate fi izolat sigur - il inlocuim cu unul nou
+            logger.error(f"Error resetting MCP agent memory, replacing agent: {e}")
+            try:
+                agent = await self._create_agent()
+            except Exception as create_error:
+                logger.error(f"Error replacing MCP agent: {create_error}")
+                self._created -= 1
+                return
+        self._idle.put_nowait(agent)
+
+    @asynccontextmanager
+    async def agent(self) -> AsyncIterator[Any]:
+        """Context manager: checkout la intrare, return la iesire"""
+        agent = await self.checkout()
+        try:
+            yield agent
+        finally:
+            await self.release(agent)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Metrici pentru dimensiunea pool-ului si timpul de asteptare"""
+        waits: List[float] = sorted(self._wait_times)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return waits[min(len(waits) - 1, int(p * len(waits)))]
+
+        return {
+            "size": self.size,
+            "created": self._created,
+            "idle": self._idle.qsize(),
+            "in_use": self._in_use,
+            "checkouts": self._checkouts,
+            "wait_time_p50_ms": round(percentile(0.50) * 1000, 2),
+            "wait_time_p95_ms": round(percentile(0.95) * 1000, 2),
+            "wait_time_max_ms": round((waits[-1] if waits else 0.0) * 1000, 2),
+        }
@@ -7,29 +7,46 @@ Agent principal pentru analiza crypto si generare semnale de trading
 import asyncio
 import os
 import json
+import time
 import yaml
-from typing import Dict, List, Optional, Any
+from functools import partial
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from dotenv import load_dotenv
-from langchain_groq import ChatGroq
-from langchain.memory import ConversationBufferMemory
-from langchain.schema import HumanMessage, AIMessage
-
-from mcp_use import MCPAgent, MCPClient
 from loguru import logger
 
 # Local imports
-from .market_analyzer import MarketAnalyzer
-from .risk_manager import RiskManager
-from ..trading.signal_generator import SignalGenerator
-from ..trading.portfolio_tracker import PortfolioTracker
-from ..notifications.discord_bot import DiscordNotifier
-from ..data.data_fetcher import DataFetcher
+from .lazy import LazyComponent, READY, FAILED
+from .llm_scheduler import BACKGROUND, INTERACTIVE, SIGNAL, LLMCapacityScheduler
+from .agent_pool import MCPAgentPool
+from .response_cache import AnalysisResponseCache
+from .single_flight import SingleFlight
+from .tool_cache import MCPToolCallCache
+from .pre_screen import QuantPreScreen
+from .response_parser import normalize_confidence, parse_response
+from .event_scheduler import MarketEventScheduler
+from .pipeline import AsyncStagePipeline
+from .symbol_registry import SymbolRegistry
+from .conversation_memory import BoundedConversationMemory, PromptTokenMetrics, SessionMemoryStore
+from .llm_metrics import LLMCallMetrics
+from .token_stream import RESET, TokenStream, stream_callback_handler
+from .model_router import DEEP, FAST, ModelRouter
+from .signal_store import SignalStore
+from .signal_dedup import SignalDedupIndex
+from ..data.timeframes import TIMEFRAME_SECONDS, timeframe_to_seconds
+
+if TYPE_CHECKING:
+    # Importurile grele (langchain, mcp_use) se fac la prima utilizare, nu la import
+    from langchain_groq import ChatGroq
+    from mcp_use import MCPAgent, MCPClient
 
 load_dotenv()
 
+# Timeframe-urile cerute intr-un singur prompt cand analiza multi-timeframe e dezactivata
+DEFAULT_SCAN_TIMEFRAMES = ["5m", "15m", "1h", "4h"]
+
 @dataclass
 class TradingSignal:
     """Clasa pentru semnalele de trading"""
@@ -48,32 +65,206 @@ class TradingSignal:
 class CryptoAIAgent:
     """Agent AI principal pentru trading crypto cu integrare MCP"""
     
-    def __init__(self, config_path: str = "config/trading_config.yaml"):
+    def __init__(self, config_path: str = "config/trading_config.yaml", llm_factory: Optional[Callable] = None):
         self.config = self._load_config(config_path)
-        self.symbols_config = self._load_symbols_config()
+        self.symbol_registry = SymbolRegistry("config/symbols.json")
+        self.mcp_config = self._load_mcp_config()
+        self.tool_cache = MCPToolCallCache.from_mcp_config(self.mcp_config)
+        
+        # Model mic pentru screening, modelul mare pentru analize; llm_factory inlocuieste API-ul in teste
+        self.model_router = ModelRouter.from_config(self.config, llm_factory=llm_factory)
         
-        # Initialize core components
-        self.llm = self._initialize_llm()
-        self.memory = ConversationBufferMemory(return_messages=True)
-        self.mcp_client = self._initialize_mcp_client()
+        # Componente initializate lazy, in etape (vezi warm_up)
+        self._components: Dict[str, LazyComponent] = {
+            # Etapa 1: componente locale
+            "market_analyzer": LazyComponent("market_analyzer", self._create_market_analyzer),
+            "risk_manager": LazyComponent("risk_manager", self._create_risk_manager),
+            "signal_generator": LazyComponent("signal_generator", self._create_signal_generator),
+            "portfolio_tracker": LazyComponent("portfolio_tracker", self._create_portfolio_tracker),
+            "data_fetcher": LazyComponent("data_fetcher", self._create_data_fetcher),
+            "discord_notifier": LazyComponent("discord_notifier", self._create_discord_notifier),
+            # Etapa 2: LLM si clientul MCP
+            "llm": LazyComponent("llm", partial(self._initialize_llm, DEEP)),
+            "mcp_client": LazyComponent("mcp_client", self._initialize_mcp_client),
+        }
+        if self.model_router.resolve(FAST) == FAST:
+            self._components["llm_fast"] = LazyComponent("llm_fast", partial(self._initialize_llm, FAST))
+        self._warmup_task: Optional[asyncio.Task] = None
         
-        # Initialize specialized components
-        self.market_analyzer = MarketAnalyzer()
-        self.risk_manager = RiskManager(self.config)
-        self.signal_generator = SignalGenerator(self.config)
-        self.portfolio_tracker = PortfolioTracker()
-        self.data_fetcher = DataFetcher()
+        # Memorie limitata: una pentru loop-ul de trading, cate una per sesiune de chat
+        memory_config = self.config.get('llm', {}).get('memory', {})
+        memory_kwargs = {
+            "max_tokens": memory_config.get('max_tokens', 3000),
+            "mode": memory_config.get('mode', 'window'),
+            "summary_tokens": memory_config.get('summary_tokens', 500)
+        }
+        self.memory = BoundedConversationMemory(**memory_kwargs)
+        self.chat_sessions = SessionMemoryStore(
+            max_sessions=memory_config.get('max_sessions', 500),
+            session_ttl=memory_config.get('session_ttl', 3600),
+            **memory_kwargs
+        )
+        self.prompt_metrics = PromptTokenMetrics()
+        self.llm_metrics = LLMCallMetrics.from_config(self.config)
+        
+        # Concurrency limits pentru apelurile LLM/MCP
+        self.max_concurrent_scans = self.mcp_config.get('serverConfigs', {}).get('concurrentServers', 1)
+        # Capacitatea LLM (sloturi + rate limit) e impartita prioritar intre API si loop-ul de trading
+        self.llm_scheduler = LLMCapacityScheduler.from_config(self.config, self.mcp_config)
         
-        # Initialize notifications
-        self.discord_notifier = DiscordNotifier() if self.config.get('notifications', {}).get('channels', {}).get('discord', {}).get('enabled') else None
+        # Pool de agenti MCP pentru analizele manuale (API/CLI) si scanarile concurente, cate unul per nivel de model
+        pool_size = int(os.getenv("MCP_AGENT_POOL_SIZE", self.mcp_config.get('serverConfigs', {}).get('agentPoolSize', 4)))
+        # Agentii se iau dupa admiterea in scheduler: cel putin un agent per slot, ca un request admis sa nu astepte
+        pool_size = max(pool_size, self.llm_scheduler.max_concurrent)
+        self.agent_pools: Dict[str, MCPAgentPool] = {
+            tier: MCPAgentPool(factory=partial(self._create_manual_agent, tier), size=pool_size)
+            for tier in self.model_router.active_tiers()
+        }
+        self._loop_agents: Dict[str, "MCPAgent"] = {}
+        
+        # Cache pentru analizele repetate in aceeasi lumanare
+        self.response_cache = AnalysisResponseCache(
+            max_entries=int(os.getenv("CACHE_SIZE", 1000)),
+            max_bytes=int(float(os.getenv("ANALYSIS_CACHE_MAX_MB", 16)) * 1024 * 1024)
+        )
+        self.single_flight = SingleFlight()
+        
+        # Analizele per timeframe de confirmare (15m/1h/4h) raman valide pana la inchiderea lumanarii
+        self.timeframe_cache = AnalysisResponseCache(
+            max_entries=int(os.getenv("CACHE_SIZE", 1000)),
+            max_bytes=int(float(os.getenv("ANALYSIS_CACHE_MAX_MB", 16)) * 1024 * 1024)
+        )
+        
+        # Pre-screen cantitativ local, inainte de escaladarea catre LLM
+        self.pre_screen = QuantPreScreen(self.config.get('analysis', {}).get('indicators', {}))
+        
+        # Scanari declansate de evenimente de piata (scan_interval ramane heartbeat)
+        self.event_scheduler = MarketEventScheduler.from_config(self.config)
+        self._event_feed_task: Optional[asyncio.Task] = None
+        # Pipeline-ul de semnale curent (sau ultimul), pentru metricile live din /health
+        self.signal_pipeline: Optional[AsyncStagePipeline] = None
         
         # Agent state
-        self.active_signals: List[TradingSignal] = []
+        self.signal_store = SignalStore.from_config(self.config)
+        self.signal_dedup = SignalDedupIndex.from_config(self.config)
         self.market_sentiment = "neutral"
         self.is_running = False
         
         logger.info("Crypto AI Agent initialized successfully")
     
+    # Lazy components
+    
+    @property
+    def llm(self) -> "ChatGroq":
+        return self._components["llm"].get()
+    
+    def _llm_component(self, tier: str) -> str:
+        return "llm_fast" if self.model_router.resolve(tier) == FAST else "llm"
+    
+    def _llm_for(self, tier: str) -> "ChatGroq":
+        """Modelul nivelului cerut (modelul mare daca rutarea e dezactivata)"""
+        return self._components[self._llm_component(tier)].get()
+    
+    def _agent_for(self, tier: str, default: "MCPAgent") -> "MCPAgent":
+        """Agentul loop-ului de trading pentru nivel, sau cel primit daca nu exista"""
+        return self._loop_agents.get(self.model_router.resolve(tier), default)
+    
+    @property
+    def mcp_client(self) -> "MCPClient":
+        return self._components["mcp_client"].get()
+    
+    @property
+    def market_analyzer(self):
+        return self._components["market_analyzer"].get()
+    
+    @property
+    def risk_manager(self):
+        return self._components["risk_manager"].get()
+    
+    @property
+    def signal_generator(self):
+        return self._components["signal_generator"].get()
+    
+    @property
+    def portfolio_tracker(self):
+        return self._components["portfolio_tracker"].get()
+    
+    @property
+    def data_fetcher(self):
+        return self._components["data_fetcher"].get()
+    
+    @property
+    def discord_notifier(self):
+        return self._components["discord_notifier"].get()
+    
+    def _create_market_analyzer(self):
+        from .market_analyzer import MarketAnalyzer
+        return MarketAnalyzer()
+    
+    def _create_risk_manager(self):
+        from .risk_manager import RiskManager
+        return RiskManager(self.config)
+    
+    def _create_signal_generator(self):
+        from ..trading.signal_generator import SignalGenerator
+        return SignalGenerator(self.config)
+    
+    def _create_portfolio_tracker(self):
+        from ..trading.portfolio_tracker import PortfolioTracker
+        return PortfolioTracker()
+    
+    def _create_data_fetcher(self):
+        from ..data.data_fetcher import DataFetcher
+        return DataFetcher(self.config)
+    
+    def _create_discord_notifier(self):
+        if not self.config.get('notifications', {}).get('channels', {}).get('discord', {}).get('enabled'):
+            return None
+        from ..notifications.discord_bot import DiscordNotifier
+        return DiscordNotifier()
+    
+    async def warm_up(self) -> None:
+        """Initializare in etape, in fundal: componente locale, LLM/MCP, apoi pool-ul de agenti"""
+        stages = [
+            ["market_analyzer", "risk_manager", "signal_generator", "portfolio_tracker", "data_fetcher", "discord_notifier"],
+            [name for name in self._components if name.startswith("llm")] + ["mcp_client"],
+        ]
+        for stage in stages:
+            await asyncio.gather(*(self._components[name].warm_up() for name in stage))
+        
+        if all(self._components[name].state == READY for name in stages[1]):
+            await asyncio.gather(*(pool.warm_up() for pool in self.agent_pools.values()))
+        
+        logger.info(f"Agent warm-up finished: {self.readiness()['status']}")
+    
+    async def ready_components(self, *names: str) -> List[Any]:
+        """Instantele componentelor cerute, asteptate fara sa blocheze event loop-ul.
+        
+        Proprietatile (self.llm, self.data_fetcher, ...) raman pentru codul sync; codul async
+        le apeleaza doar dupa ce componentele au fost asteptate aici.
+        """
+        return list(await asyncio.gather(*(self._components[name].aget() for name in names)))
+    
+    def start_warm_up(self) -> asyncio.Task:
+        """Porneste warm-up-ul in fundal (o singura data)"""
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self.warm_up())
+        return self._warmup_task
+    
+    def readiness(self) -> Dict[str, Any]:
+        """Starea de initializare a fiecarei componente"""
+        components = {name: component.status() for name, component in self._components.items()}
+        states = [component.state for component in self._components.values()]
+        
+        if all(state == READY for state in states):
+            status = "ready"
+        elif any(state == FAILED for state in states):
+            status = "degraded"
+        else:
+            status = "warming_up"
+        
+        return {"status": status, "components": components}
+    
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Incarca configuratia din fisierul YAML"""
         try:
@@ -83,54 +274,77 @@ class CryptoAIAgent:
             logger.error(f"Error loading config: {e}")
             return {}
     
-    def _load_symbols_config(self) -> Dict[str, Any]:
-        """Incarca configuratia simbolurilor"""
+    @property
+    def symbols_config(self) -> Dict[str, Any]:
+        """Configuratia simbolurilor (snapshot-ul curent din registry)"""
+        return self.symbol_registry.raw_config
+    
+    def _load_mcp_config(self) -> Dict[str, Any]:
+        """Incarca configuratia MCP (limite de concurenta si rate limiting)"""
+        mcp_config_path = os.getenv("MCP_CONFIG_PATH", "config/mcp_config.json")
         try:
-            with open("config/symbols.json", 'r') as f:
+            with open(mcp_config_path, 'r') as f:
                 return json.load(f)
         except Exception as e:
-            logger.error(f"Error loading symbols config: {e}")
+            logger.error(f"Error loading MCP config: {e}")
             return {}
     
-    def _initialize_llm(self) -> ChatGroq:
-        """Initializeaza modelul Groq LLM"""
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise ValueError("GROQ_API_KEY not found in environment variables")
-        
-        return ChatGroq(
-            model="llama-3.1-70b-versatile",  # Model mai performant pentru trading
-            api_key=api_key,
-            temperature=0.3,  # Lower temperature pentru decizii mai consistente
-            max_tokens=2000,
-            streaming=False
-        )
+    def _initialize_llm(self, tier: str = DEEP) -> "ChatGroq":
+        """Initializeaza modelul LLM pentru nivelul dat (Groq sau stub local)"""
+        callbacks = [handler for handler in (self.llm_metrics.callback_handler(), stream_callback_handler()) if handler]
+        return self.model_router.create_llm(tier, callbacks)
     
-    def _initialize_mcp_client(self) -> MCPClient:
+    def _initialize_mcp_client(self) -> "MCPClient":
         """Initializeaza clientul MCP cu serverele crypto"""
+        from mcp_use import MCPClient
+        
         mcp_config_path = os.getenv("MCP_CONFIG_PATH", "config/mcp_config.json")
         
         try:
             client = MCPClient.from_config_file(mcp_config_path)
+            if self.tool_cache:
+                self.tool_cache.install(client)
             logger.info("MCP Client initialized successfully")
             return client
         except Exception as e:
             logger.error(f"Error initializing MCP client: {e}")
             raise
     
+    def _create_manual_agent(self, tier: str = DEEP) -> "MCPAgent":
+        """Factory pentru agentii din pool-ul de analiza manuala"""
+        from mcp_use import MCPAgent
+        
+        return MCPAgent(
+            llm=self._llm_for(tier),
+            client=self.mcp_client,
+            max_steps=15,
+            memory_enabled=False  # Istoricul e gestionat de BoundedConversationMemory
+        )
+    
     async def start_trading_session(self) -> None:
         """Porneste o sesiune de trading"""
         self.is_running = True
         logger.info("Starting crypto trading session...")
         
         try:
-            # Initialize MCP agent
-            mcp_agent = MCPAgent(
-                llm=self.llm,
-                client=self.mcp_client,
-                max_steps=20,
-                memory_enabled=True
-            )
+            from mcp_use import MCPAgent
+            
+            # Componentele se initializeaza in thread-uri; cele esuate raman FAILED si sunt reincercate la acces
+            await self.start_warm_up()
+            tiers = self.model_router.active_tiers()
+            await self.ready_components(*{self._llm_component(tier) for tier in tiers}, "mcp_client")
+            
+            # Initialize MCP agents (cate unul per nivel de model)
+            self._loop_agents = {
+                tier: MCPAgent(
+                    llm=self._llm_for(tier),
+                    client=self.mcp_client,
+                    max_steps=20,
+                    memory_enabled=False  # Istoricul e gestionat de BoundedConversationMemory
+                )
+                for tier in tiers
+            }
+            mcp_agent = self._loop_agents[DEEP]
             
             # Start main trading loop
             await self._main_trading_loop(mcp_agent)
@@ -139,40 +353,92 @@ class CryptoAIAgent:
             logger.error(f"Error in trading session: {e}")
             await self.stop_trading_session()
     
-    async def _main_trading_loop(self, mcp_agent: MCPAgent) -> None:
+    async def _main_trading_loop(self, mcp_agent: "MCPAgent") -> None:
         """Loop principal de trading"""
+        event_config = self.config.get('analysis', {}).get('event_trigger', {})
+        if event_config.get('enabled', False):
+            self._event_feed_task = asyncio.create_task(self._feed_market_events())
+        
+        market_overview: Dict[str, Any] = {}
+        triggered_symbols: List[str] = []
+        
         while self.is_running:
             try:
-                # 1. Analiza piata generala
-                market_overview = await self._analyze_market_overview(mcp_agent)
-                
-                # 2. Scanare simboluri pentru oportunitati
-                opportunities = await self._scan_for_opportunities(mcp_agent)
-                
-                # 3. Generare semnale de trading
-                new_signals = await self._generate_trading_signals(mcp_agent, opportunities)
-                
-                # 4. Evaluare risc si management pozitii
-                filtered_signals = await self._evaluate_and_filter_signals(new_signals)
+                # 1. Analiza piata generala (doar la heartbeat; evenimentele reutilizeaza ultimul overview)
+                if not triggered_symbols:
+                    market_overview = await self._analyze_market_overview(mcp_agent)
                 
-                # 5. Executie semnale (daca auto-trading este activat)
-                if self.config.get('advanced', {}).get('auto_trading', False):
-                    await self._execute_signals(filtered_signals)
+                # 2-5, 7. Scanare -> semnale -> risc -> executie/notificari, pipelined per simbol
+                filtered_signals = await self._run_signal_pipeline(
+                    mcp_agent, triggered_symbols or None, market_overview
+                )
                 
                 # 6. Update portofoliu si pozitii
                 await self._update_portfolio_status()
                 
-                # 7. Trimite notificari
-                await self._send_notifications(filtered_signals, market_overview)
+                # Notificare pentru overview chiar si fara semnale noi
+                if not filtered_signals:
+                    await self._send_notifications([], market_overview)
                 
-                # 8. Wait for next iteration
-                await asyncio.sleep(self.config.get('analysis', {}).get('scan_interval', 300))  # 5 minutes default
+                # 8. Wait for next iteration: eveniment de piata sau heartbeat
+                triggered_symbols = await self._wait_for_next_scan()
                 
             except Exception as e:
                 logger.error(f"Error in main trading loop: {e}")
+                triggered_symbols = []
                 await asyncio.sleep(60)  # Wait 1 minute before retry
     
-    async def _analyze_market_overview(self, mcp_agent: MCPAgent) -> Dict[str, Any]:
+    async def _wait_for_next_scan(self) -> List[str]:
+        """Returneaza simbolurile declansate de evenimente, sau [] pentru scanare completa"""
+        heartbeat = self.config.get('analysis', {}).get('scan_interval', 300)  # 5 minutes default
+        
+        if self._event_feed_task is None:
+            await asyncio.sleep(heartbeat)
+            return []
+        
+        triggered = await self.event_scheduler.wait(heartbeat)
+        if triggered:
+            logger.info(f"Event-driven scan triggered for: {', '.join(triggered)}")
+        return triggered
+    
+    async def _feed_market_events(self) -> None:
+        """Alimenteaza scheduler-ul cu pretul/volumul curent al simbolurilor urmarite"""
+        event_config = self.config.get('analysis', {}).get('event_trigger', {})
+        poll_interval = event_config.get('poll_interval', 5)
+        timeframe = event_config.get('timeframe', '1m')
+        candle_seconds = timeframe_to_seconds(timeframe)
+        
+        async def poll(symbol: str) -> None:
+            try:
+                data_fetcher = (await self.ready_components("data_fetcher"))[0]
+                data = await data_fetcher.get_symbol_data(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    indicators=["price", "volume"]
+                )
+                closes, volumes = data.get("close", []), data.get("volume", [])
+                timestamps = data.get("timestamp", [])
+                if closes:
+                    # Ultima lumanare este inca deschisa: volumul ei e partial
+                    candle_open = timestamps[-1] if timestamps else None
+                    progress = (time.time() - candle_open) / candle_seconds if candle_open else None
+                    reason = self.event_scheduler.on_tick(
+                        symbol, closes[-1],
+                        volume=volumes[-1] if volumes else None,
+                        closed_volume=volumes[-2] if len(volumes) > 1 else None,
+                        candle_open=timestamps[-2] if len(timestamps) > 1 else None,
+                        candle_progress=progress
+                    )
+                    if reason:
+                        logger.info(f"Market event on {symbol}: {reason}")
+            except Exception as e:
+                logger.debug(f"Error polling market data for {symbol}: {e}")
+        
+        while self.is_running:
+            await asyncio.gather(*(poll(symbol) for symbol in self._get_priority_symbols()))
+            await asyncio.sleep(poll_interval)
+    
+    async def _analyze_market_overview(self, mcp_agent: "MCPAgent") -> Dict[str, Any]:
         """Analizeaza starea generala a pietei"""
         try:
             # Folosim MCP pentru a obtine date de piata
@@ -187,15 +453,18 @@ class CryptoAIAgent:
             Concentreaza-te pe BTCUSDT, ETHUSDT si EGLDUSDT ca simboluri principale.
             """
             
-            response = await mcp_agent.run(query)
+            # Overview-ul e un task de screening - ruleaza pe modelul rapid
+            response = await self._run_agent(self._agent_for(FAST, mcp_agent), query, self.memory,
+                                             stage="market_overview", tier=FAST, priority=BACKGROUND)
             
             # Parse response si extrage informatii importante
+            parsed = parse_response(response)
             market_data = {
                 "timestamp": datetime.now(),
-                "sentiment": self._extract_sentiment_from_response(response),
-                "trend": self._extract_trend_from_response(response),
-                "volume_status": self._extract_volume_status(response),
-                "news_impact": self._extract_news_impact(response),
+                "sentiment": parsed.sentiment,
+                "trend": parsed.trend,
+                "volume_status": parsed.volume_status,
+                "news_impact": parsed.news_impact,
                 "raw_analysis": response
             }
             
@@ -208,108 +477,462 @@ class CryptoAIAgent:
             logger.error(f"Error analyzing market overview: {e}")
             return {"error": str(e), "timestamp": datetime.now()}
     
-    async def _scan_for_opportunities(self, mcp_agent: MCPAgent) -> List[Dict[str, Any]]:
-        """Scaneaza simbolurile pentru oportunitati de trading"""
-        opportunities = []
+    async def _iter_opportunities(self, mcp_agent: "MCPAgent",
+                                  symbols: Optional[List[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Produce oportunitatile pe masura ce fiecare simbol (sau batch) termina analiza.
         
-        # Get symbols to scan based on priority and enabled status
-        symbols_to_scan = self._get_priority_symbols()
+        `symbols` vin de la MarketEventScheduler si sunt scanate direct; pre-screen-ul cantitativ
+        filtreaza doar scanarea completa de la heartbeat.
+        """
+        if symbols:
+            # Trigger-ul de momentum/volum este deja semnalul: pre-screen-ul ar putea pierde evenimentul
+            symbols_to_scan = symbols
+        else:
+            # Get symbols to scan based on priority and enabled status
+            symbols_to_scan = await self._pre_screen_symbols(self._get_priority_symbols())
+        if not symbols_to_scan:
+            logger.info("No symbols passed the quantitative pre-screen, skipping LLM scan")
+            return
         
-        for symbol in symbols_to_scan:
+        # Fan-out limitat de concurrentServers; ritmul vine din rate limiter, nu din sleep-uri fixe
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_scans))
+        
+        async def scan_batch(batch: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._scan_symbol_batch(mcp_agent, batch)
+        
+        async def scan(symbol: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return [await self._scan_symbol(mcp_agent, symbol)]
+                except Exception as e:
+                    logger.error(f"Error scanning {symbol}: {e}")
+                    return []
+        
+        if self.config.get('analysis', {}).get('multi_timeframe', {}).get('enabled', False):
+            async for opportunity in self._iter_multi_timeframe_opportunities(mcp_agent, symbols_to_scan, semaphore):
+                yield opportunity
+            return
+        
+        batch_config = self.config.get('analysis', {}).get('batch_scan', {})
+        if batch_config.get('enabled', False):
+            batches = await self._split_symbol_batches(symbols_to_scan)
+            logger.info(f"Scanning {len(symbols_to_scan)} symbols in {len(batches)} batch prompt(s)")
+            tasks = [asyncio.ensure_future(scan_batch(batch)) for batch in batches]
+        else:
+            tasks = [asyncio.ensure_future(scan(symbol)) for symbol in symbols_to_scan]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for opportunity in await next_done:
+                    yield opportunity
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _iter_multi_timeframe_opportunities(self, mcp_agent: "MCPAgent", symbols: List[str],
+                                                  semaphore: asyncio.Semaphore) -> AsyncIterator[Dict[str, Any]]:
+        """Cate o analiza per timeframe, calculate concurent si combinate per simbol.
+        
+        Timeframe-ul primar se recalculeaza la fiecare iteratie; cele de confirmare vin din
+        cache pana la inchiderea lumanarii lor.
+        """
+        timeframes_config = self.config.get('analysis', {}).get('timeframes', {})
+        primary = timeframes_config.get('primary', '5m')
+        confirmation = [tf for tf in timeframes_config.get('confirmation', []) if tf != primary]
+        batch_enabled = self.config.get('analysis', {}).get('batch_scan', {}).get('enabled', False)
+        
+        async def scan_batch(batch: List[str], timeframe: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._scan_symbol_batch(mcp_agent, batch, [timeframe])
+        
+        async def scan(symbol: str, timeframe: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return [await self._scan_symbol(mcp_agent, symbol, [timeframe])]
+                except Exception as e:
+                    logger.error(f"Error scanning {symbol} on {timeframe}: {e}")
+                    return []
+        
+        async def timeframe_views(timeframe: str, use_cache: bool) -> Dict[str, Dict[str, Any]]:
+            # Cheile se calculeaza o singura data, ca rezultatul sa ramana in lumanarea in care a fost cerut
+            keys = {symbol: self.timeframe_cache.make_key("scan_timeframe", symbol, timeframe) for symbol in symbols}
+            views: Dict[str, Dict[str, Any]] = {}
+            missing = []
+            for symbol in symbols:
+                cached = self.timeframe_cache.get(keys[symbol]) if use_cache else None
+                if cached is not None:
+                    views[symbol] = cached
+                else:
+                    missing.append(symbol)
+            
+            if not missing:
+                return views
+            
+            if batch_enabled:
+                batches = await self._split_symbol_batches(missing)
+                results = await asyncio.gather(*(scan_batch(batch, timeframe) for batch in batches))
+            else:
+                results = await asyncio.gather(*(scan(symbol, timeframe) for symbol in missing))
+            
+            for opportunity in (opp for result in results for opp in result):
+                opportunity["timeframe"] = timeframe
+                views[opportunity["symbol"]] = opportunity
+                if use_cache:
+                    self.timeframe_cache.set(keys[opportunity["symbol"]], opportunity)
+            return views
+        
+        primary_views, *confirmation_views = await asyncio.gather(
+            timeframe_views(primary, use_cache=False),
+            *(timeframe_views(timeframe, use_cache=True) for timeframe in confirmation)
+        )
+        logger.debug(f"Timeframe cache: {self.timeframe_cache.get_metrics()}")
+        
+        for symbol in symbols:
+            if symbol not in primary_views:
+                continue
+            confirmations = {
+                timeframe: views[symbol]
+                for timeframe, views in zip(confirmation, confirmation_views)
+                if symbol in views
+            }
+            yield self._combine_timeframe_views(primary_views[symbol], confirmations)
+    
+    def _combine_timeframe_views(self, primary_view: Dict[str, Any],
+                                 confirmations: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Ajusteaza confidence-ul timeframe-ului primar dupa acordul timeframe-urilor de confirmare"""
+        mtf_config = self.config.get('analysis', {}).get('multi_timeframe', {})
+        opportunity = dict(primary_view)
+        action = opportunity["action"]
+        
+        agreeing = [tf for tf, view in confirmations.items() if view["action"] == action]
+        conflicting = [tf for tf, view in confirmations.items() if view["action"] not in (action, "HOLD")]
+        
+        if action != "HOLD":
+            confidence = (opportunity["confidence"]
+                          + mtf_config.get('agreement_bonus', 0.05) * len(agreeing)
+                          - mtf_config.get('conflict_penalty', 0.1) * len(conflicting))
+            opportunity["confidence"] = max(0.0, min(confidence, 1.0))
+        
+        opportunity["timeframe_views"] = {
+            tf: {"action": view["action"], "confidence": view["confidence"]}
+            for tf, view in [(primary_view.get("timeframe"), primary_view), *confirmations.items()]
+        }
+        opportunity["confirmations"] = {"agreeing": agreeing, "conflicting": conflicting}
+        return opportunity
+    
+    async def _pre_screen_symbols(self, symbols: List[str]) -> List[str]:
+        """Pastreaza doar simbolurile care trec pragurile din analysis.indicators"""
+        pre_screen_config = self.config.get('analysis', {}).get('pre_screen', {})
+        if not pre_screen_config.get('enabled', False):
+            return symbols
+        
+        timeframe = pre_screen_config.get('timeframe', self.config.get('analysis', {}).get('timeframes', {}).get('primary', '5m'))
+        candle_seconds = timeframe_to_seconds(timeframe)
+        
+        try:
+            data_fetcher = (await self.ready_components("data_fetcher"))[0]
+        except Exception as e:
+            # Fara date locale nu putem filtra - escaladam toate simbolurile catre LLM
+            logger.warning(f"Pre-screen unavailable, escalating all symbols: {e}")
+            return symbols
+        
+        async def screen(symbol: str) -> bool:
             try:
-                # Analiza tehnica pentru fiecare simbol
-                query = f"""
-                Analizeaza {symbol} pentru oportunitati de trading:
-                1. Analiza tehnica pe timeframes 5m, 15m, 1h, 4h
-                2. Indicatori: RSI, MACD, Bollinger Bands, EMA
-                3. Support si resistance levels
-                4. Pattern recognition
-                5. Volume analysis
-                6. Momentum si trend strength
-                
-                Genereaza o evaluare clara: BUY/SELL/HOLD cu confidence score.
-                """
-                
-                response = await mcp_agent.run(query)
-                
-                opportunity = {
-                    "symbol": symbol,
-                    "analysis": response,
-                    "timestamp": datetime.now(),
-                    "action": self._extract_action_from_response(response),
-                    "confidence": self._extract_confidence_from_response(response),
-                    "price_levels": self._extract_price_levels(response)
-                }
-                
-                opportunities.append(opportunity)
-                
-                # Rate limiting
-                await asyncio.sleep(2)
-                
+                data = await data_fetcher.get_symbol_data(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    indicators=["price", "volume"]
+                )
+                # Ultima lumanare e inca deschisa: volumul ei partial e proiectat pe progresul lumanarii
+                timestamps = data.get("timestamp", [])
+                progress = (time.time() - timestamps[-1]) / candle_seconds if timestamps else None
+                result = self.pre_screen.evaluate(symbol, data.get("close", []), data.get("volume", []),
+                                                  candle_progress=progress)
+            except Exception as e:
+                # Fara date locale nu putem filtra - escaladam catre LLM
+                logger.warning(f"Pre-screen unavailable for {symbol}, escalating: {e}")
+                return True
+            
+            if result.passed:
+                logger.debug(f"Pre-screen passed {symbol}: {', '.join(result.triggers)}")
+            return result.passed
+        
+        passed = await asyncio.gather(*(screen(symbol) for symbol in symbols))
+        escalated = [symbol for symbol, ok in zip(symbols, passed) if ok]
+        
+        logger.info(f"Pre-screen escalated {len(escalated)}/{len(symbols)} symbols to LLM analysis")
+        return escalated
+    
+    async def _split_symbol_batches(self, symbols: List[str]) -> List[List[str]]:
+        """Imparte simbolurile in batch-uri care incap in bugetul de tokeni al LLM-ului"""
+        batch_config = self.config.get('analysis', {}).get('batch_scan', {})
+        max_symbols = max(1, batch_config.get('max_symbols_per_batch', 10))
+        tokens_per_symbol = batch_config.get('output_tokens_per_symbol', 150)
+        
+        # Raspunsul JSON trebuie sa incapa in max_tokens al modelului
+        llm = (await self.ready_components(self._llm_component(FAST)))[0]
+        max_output_tokens = getattr(llm, 'max_tokens', None) or 2000
+        max_symbols = max(1, min(max_symbols, max_output_tokens // tokens_per_symbol))
+        
+        return [symbols[i:i + max_symbols] for i in range(0, len(symbols), max_symbols)]
+    
+    async def _scan_symbol_batch(self, mcp_agent: "MCPAgent", symbols: List[str],
+                                 timeframes: Optional[List[str]] = None, tier: str = FAST) -> List[Dict[str, Any]]:
+        """Analiza tehnica pentru mai multe simboluri intr-un singur prompt, cu raspuns JSON"""
+        timeframes = timeframes or DEFAULT_SCAN_TIMEFRAMES
+        query = f"""
+        Analizeaza urmatoarele simboluri pentru oportunitati de trading: {", ".join(symbols)}
+        Pentru fiecare simbol foloseste:
+        1. Analiza tehnica pe timeframes {", ".join(timeframes)}
+        2. Indicatori: RSI, MACD, Bollinger Bands, EMA
+        3. Support si resistance levels
+        4. Volume, momentum si trend strength
+        
+        Raspunde DOAR cu un array JSON, cate un obiect pentru fiecare simbol, fara alt text:
+        [{{"symbol": "BTCUSDT", "action": "BUY|SELL|HOLD", "confidence": 0.0-1.0,
+          "entry": 0.0, "stop": 0.0, "target": 0.0, "reasoning": "..."}}]
+        """
+        
+        try:
+            response = await self._run_scan(query, tier)
+        except Exception as e:
+            if len(symbols) > 1 and self._is_token_limit_error(e):
+                # Batch prea mare pentru contextul modelului - il impartim in doua
+                middle = len(symbols) // 2
+                logger.warning(f"Token limit exceeded for batch of {len(symbols)} symbols, splitting")
+                first, second = await asyncio.gather(
+                    self._scan_symbol_batch(mcp_agent, symbols[:middle], timeframes, tier),
+                    self._scan_symbol_batch(mcp_agent, symbols[middle:], timeframes, tier)
+                )
+                return first + second
+            logger.error(f"Error scanning batch {symbols}: {e}")
+            return []
+        
+        opportunities = await self._escalate_borderline(
+            mcp_agent, self._parse_batch_response(response, symbols), timeframes, tier
+        )
+        
+        # Simbolurile lipsa din raspuns sunt rescanate individual
+        parsed = {opp["symbol"] for opp in opportunities}
+        missing = [symbol for symbol in symbols if symbol not in parsed]
+        for symbol in missing:
+            logger.warning(f"{symbol} missing from batch response, scanning individually")
+            try:
+                opportunities.append(await self._scan_symbol(mcp_agent, symbol, timeframes, tier))
             except Exception as e:
                 logger.error(f"Error scanning {symbol}: {e}")
-                continue
         
-        logger.info(f"Scanned {len(opportunities)} symbols for opportunities")
         return opportunities
     
-    async def _generate_trading_signals(self, mcp_agent: MCPAgent, opportunities: List[Dict]) -> List[TradingSignal]:
-        """Genereaza semnale de trading pe baza oportunitatilor"""
-        signals = []
+    async def _escalate_borderline(self, mcp_agent: "MCPAgent", opportunities: List[Dict[str, Any]],
+                                   timeframes: Optional[List[str]], tier: str) -> List[Dict[str, Any]]:
+        """Reanalizeaza pe modelul mare oportunitatile modelului rapid cu confidence la limita"""
+        if tier == DEEP:
+            return opportunities
         
-        for opp in opportunities:
-            if opp["confidence"] < 0.6:  # Skip low confidence opportunities
-                continue
-            
+        async def escalate(opportunity: Dict[str, Any]) -> Dict[str, Any]:
+            if not self.model_router.should_escalate(opportunity["action"], opportunity["confidence"]):
+                return opportunity
             try:
-                # Folosim signal generator pentru a crea semnale structurate
-                signal = await self.signal_generator.generate_signal(
-                    symbol=opp["symbol"],
-                    market_data=opp,
-                    market_sentiment=self.market_sentiment
-                )
-                
-                if signal:
-                    signals.append(signal)
-                    
+                deep = await self._scan_symbol(mcp_agent, opportunity["symbol"], timeframes, DEEP)
             except Exception as e:
-                logger.error(f"Error generating signal for {opp['symbol']}: {e}")
+                logger.error(f"Error escalating {opportunity['symbol']} to {DEEP} model: {e}")
+                return opportunity
+            self.model_router.record_escalation(opportunity["action"], deep["action"])
+            deep["escalated_from"] = {"action": opportunity["action"], "confidence": opportunity["confidence"]}
+            return deep
+        
+        return list(await asyncio.gather(*(escalate(opportunity) for opportunity in opportunities)))
+    
+    @staticmethod
+    def _is_token_limit_error(error: Exception) -> bool:
+        message = str(error).lower()
+        return any(marker in message for marker in [
+            "context_length_exceeded", "maximum context length", "too many tokens",
+            "request too large", "413"
+        ])
+    
+    def _parse_batch_response(self, response: str, symbols: List[str]) -> List[Dict[str, Any]]:
+        """Parseaza array-ul JSON din raspunsul batch"""
+        start, end = response.find("["), response.rfind("]")
+        if start == -1 or end <= start:
+            logger.error("Batch scan response does not contain a JSON array")
+            return []
+        
+        try:
+            items = json.loads(response[start:end + 1])
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in batch scan response: {e}")
+            return []
+        
+        opportunities = []
+        requested = set(symbols)
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            symbol = str(item.get("symbol", "")).upper()
+            if symbol not in requested:
                 continue
+            
+            action = str(item.get("action", "HOLD")).upper()
+            try:
+                confidence = float(item.get("confidence", 0.0))
+            except (TypeError, ValueError):
+                confidence = 0.0
+            opportunities.append({
+                "symbol": symbol,
+                "analysis": item.get("reasoning", ""),
+                "timestamp": datetime.now(),
+                "action": action if action in ("BUY", "SELL", "HOLD") else "HOLD",
+                "confidence": normalize_confidence(confidence),
+                "price_levels": {
+                    "entry": self._to_float(item.get("entry")),
+                    "stop_loss": self._to_float(item.get("stop")),
+                    "take_profit": self._to_float(item.get("target")),
+                    "support": self._to_float(item.get("support")),
+                    "resistance": self._to_float(item.get("resistance"))
+                }
+            })
+            requested.discard(symbol)
+        
+        return opportunities
+    
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
+    
+    async def _scan_symbol(self, mcp_agent: "MCPAgent", symbol: str,
+                           timeframes: Optional[List[str]] = None, tier: str = FAST) -> Dict[str, Any]:
+        """Analiza tehnica pentru un singur simbol"""
+        timeframes = timeframes or DEFAULT_SCAN_TIMEFRAMES
+        query = f"""
+        Analizeaza {symbol} pentru oportunitati de trading:
+        1. Analiza tehnica pe timeframes {", ".join(timeframes)}
+        2. Indicatori: RSI, MACD, Bollinger Bands, EMA
+        3. Support si resistance levels
+        4. Pattern recognition
+        5. Volume analysis
+        6. Momentum si trend strength
+        
+        Genereaza o evaluare clara: BUY/SELL/HOLD cu confidence score.
+        """
+        
+        response = await self._run_scan(query, tier)
+        parsed = parse_response(response)
+        
+        opportunity = {
+            "symbol": symbol,
+            "analysis": response,
+            "timestamp": datetime.now(),
+            "action": parsed.action,
+            "confidence": parsed.confidence,
+            "price_levels": {
+                "entry": parsed.entry_price,
+                "stop_loss": parsed.stop_loss,
+                "take_profit": parsed.take_profit,
+                "support": parsed.support,
+                "resistance": parsed.resistance
+            }
+        }
+        return (await self._escalate_borderline(mcp_agent, [opportunity], timeframes, tier))[0]
+    
+    async def _run_signal_pipeline(self, mcp_agent: "MCPAgent", symbols: Optional[List[str]],
+                                   market_overview: Dict[str, Any]) -> List[TradingSignal]:
+        """Scanare, generare, evaluare risc si notificari ca etape suprapuse.
+        
+        Fiecare simbol avanseaza imediat ce analiza lui e gata, fara sa astepte restul scanarii.
+        """
+        pipeline_config = self.config.get('analysis', {}).get('pipeline', {})
+        auto_trading = self.config.get('advanced', {}).get('auto_trading', False)
         
-        logger.info(f"Generated {len(signals)} trading signals")
+        async def generate(opportunity: Dict[str, Any]) -> Optional[TradingSignal]:
+            return await self._generate_signal(opportunity)
+        
+        async def evaluate(signal: TradingSignal) -> Optional[TradingSignal]:
+            approved = await self._evaluate_signal(signal)
+            if approved:
+                self.signal_store.add(approved)
+                if auto_trading:
+                    await self._execute_signals([approved])
+            return approved
+        
+        async def notify(signal: TradingSignal) -> TradingSignal:
+            await self._send_notifications([signal], market_overview)
+            return signal
+        
+        pipeline = (
+            AsyncStagePipeline(queue_size=pipeline_config.get('queue_size', 10))
+            .add_stage("generate", generate, workers=pipeline_config.get('generate_workers', 2))
+            .add_stage("evaluate", evaluate, workers=pipeline_config.get('evaluate_workers', 1))
+            .add_stage("notify", notify, workers=pipeline_config.get('notify_workers', 1))
+        )
+        
+        self.signal_pipeline = pipeline
+        signals = await pipeline.run(self._iter_opportunities(mcp_agent, symbols))
+        
+        logger.info(f"Pipeline produced {len(signals)} approved signals")
+        logger.debug(f"Pipeline stage metrics: {pipeline.get_metrics()}")
         return signals
     
-    async def _evaluate_and_filter_signals(self, signals: List[TradingSignal]) -> List[TradingSignal]:
-        """Evalueaza si filtreaza semnalele pe baza risk management"""
-        filtered_signals = []
+    async def _generate_signal(self, opp: Dict[str, Any]) -> Optional[TradingSignal]:
+        """Genereaza semnalul pentru o singura oportunitate"""
+        if opp["confidence"] < 0.6:  # Skip low confidence opportunities
+            return None
         
-        for signal in signals:
-            try:
-                # Risk evaluation
-                risk_assessment = await self.risk_manager.evaluate_signal_risk(signal)
-                
-                if risk_assessment["approved"]:
-                    # Calculate position size
-                    position_size = await self.risk_manager.calculate_position_size(
-                        signal.symbol,
-                        signal.entry_price,
-                        signal.stop_loss
-                    )
-                    
-                    signal.position_size_usd = position_size
-                    signal.risk_score = risk_assessment["risk_score"]
-                    filtered_signals.append(signal)
-                    
-                    logger.info(f"Signal approved: {signal.symbol} {signal.action} @ {signal.entry_price}")
-                else:
-                    logger.info(f"Signal rejected: {signal.symbol} - {risk_assessment['reason']}")
-                    
-            except Exception as e:
-                logger.error(f"Error evaluating signal {signal.symbol}: {e}")
-                continue
+        try:
+            # Folosim signal generator pentru a crea semnale structurate
+            signal_generator = (await self.ready_components("signal_generator"))[0]
+            return await signal_generator.generate_signal(
+                symbol=opp["symbol"],
+                market_data=opp,
+                market_sentiment=self.market_sentiment
+            )
+            
+        except Exception as e:
+            logger.error(f"Error generating signal for {opp['symbol']}: {e}")
+            return None
+    
+    async def _evaluate_signal(self, signal: TradingSignal) -> Optional[TradingSignal]:
+        """Evaluare de risc si dimensionare pozitie pentru un semnal"""
+        # Semnalele neschimbate din cooldown nu mai trec prin risk management si notificari
+        if self.signal_dedup.is_duplicate(signal):
+            logger.debug(f"Duplicate signal suppressed: {signal.symbol} {signal.action} @ {signal.entry_price}")
+            return None
         
-        self.active_signals.extend(filtered_signals)
-        return filtered_signals
+        try:
+            # Risk evaluation
+            risk_manager = (await self.ready_components("risk_manager"))[0]
+            risk_assessment = await risk_manager.evaluate_signal_risk(signal)
+            
+            if not risk_assessment["approved"]:
+                logger.info(f"Signal rejected: {signal.symbol} - {risk_assessment['reason']}")
+                return None
+            
+            # Calculate position size
+            position_size = await risk_manager.calculate_position_size(
+                signal.symbol,
+                signal.entry_price,
+                signal.stop_loss
+            )
+            
+            # Limita per simbol din symbols.json
+            max_position_usd = self.symbol_registry.max_position_usd(signal.symbol)
+            if max_position_usd > 0:
+                position_size = min(position_size, max_position_usd)
+            
+            signal.position_size_usd = position_size
+            signal.risk_score = risk_assessment["risk_score"]
+            
+            logger.info(f"Signal approved: {signal.symbol} {signal.action} @ {signal.entry_price}")
+            return signal
+            
+        except Exception as e:
+            logger.error(f"Error evaluating signal {signal.symbol}: {e}")
+            return None
     
     async def _execute_signals(self, signals: List[TradingSignal]) -> None:
         """Executa semnalele de trading (doar daca auto-trading este activat)"""
@@ -329,8 +952,9 @@ class CryptoAIAgent:
     async def _update_portfolio_status(self) -> None:
         """Actualizeaza statusul portofoliului"""
         try:
-            await self.portfolio_tracker.update_positions()
-            portfolio_status = await self.portfolio_tracker.get_portfolio_summary()
+            portfolio_tracker = (await self.ready_components("portfolio_tracker"))[0]
+            await portfolio_tracker.update_positions()
+            portfolio_status = await portfolio_tracker.get_portfolio_summary()
             logger.info(f"Portfolio updated: {portfolio_status.get('total_value_usd', 0):.2f} USD")
             
         except Exception as e:
@@ -342,144 +966,194 @@ class CryptoAIAgent:
             return
         
         try:
-            if self.discord_notifier:
-                await self.discord_notifier.send_trading_update(signals, market_overview)
+            discord_notifier = (await self.ready_components("discord_notifier"))[0]
+            if discord_notifier:
+                await discord_notifier.send_trading_update(signals, market_overview)
                 
         except Exception as e:
             logger.error(f"Error sending notifications: {e}")
     
     def _get_priority_symbols(self) -> List[str]:
         """Obtine lista de simboluri prioritare pentru scanare"""
-        symbols = []
-        
-        # Add major pairs first
-        major_pairs = self.symbols_config.get("crypto_symbols", {}).get("major_pairs", {})
-        for symbol, config in major_pairs.items():
-            if config.get("enabled", False):
-                symbols.append(symbol)
+        self.symbol_registry.maybe_reload()
         
-        # Add enabled altcoins
-        altcoins = self.symbols_config.get("crypto_symbols", {}).get("altcoins", {})
-        for symbol, config in altcoins.items():
-            if config.get("enabled", False):
-                symbols.append(symbol)
-        
-        # Sort by priority
-        symbols.sort(key=lambda x: self._get_symbol_priority(x))
-        
-        return symbols[:10]  # Limit to top 10 for performance
+        # Major pairs si altcoins active, deja sortate dupa prioritate in registry
+        return self.symbol_registry.enabled_symbols(
+            groups=("major_pairs", "altcoins"),
+            limit=10  # Limit to top 10 for performance
+        )
     
     def _get_symbol_priority(self, symbol: str) -> int:
         """Obtine prioritatea unui simbol"""
-        all_symbols = {**self.symbols_config.get("crypto_symbols", {}).get("major_pairs", {}),
-                      **self.symbols_config.get("crypto_symbols", {}).get("altcoins", {})}
-        
-        return all_symbols.get(symbol, {}).get("priority", 999)
-    
-    def _extract_sentiment_from_response(self, response: str) -> str:
-        """Extrage sentiment din raspunsul AI"""
-        response_lower = response.lower()
-        if any(word in response_lower for word in ["bullish", "positive", "optimistic", "green"]):
-            return "bullish"
-        elif any(word in response_lower for word in ["bearish", "negative", "pessimistic", "red"]):
-            return "bearish"
-        else:
-            return "neutral"
-    
-    def _extract_trend_from_response(self, response: str) -> str:
-        """Extrage trend din raspunsul AI"""
-        response_lower = response.lower()
-        if "uptrend" in response_lower or "up trend" in response_lower:
-            return "uptrend"
-        elif "downtrend" in response_lower or "down trend" in response_lower:
-            return "downtrend"
-        else:
-            return "sideways"
-    
-    def _extract_volume_status(self, response: str) -> str:
-        """Extrage statusul volumului"""
-        response_lower = response.lower()
-        if "high volume" in response_lower or "increased volume" in response_lower:
-            return "high"
-        elif "low volume" in response_lower or "decreased volume" in response_lower:
-            return "low"
-        else:
-            return "normal"
-    
-    def _extract_news_impact(self, response: str) -> str:
-        """Extrage impactul news-urilor"""
-        response_lower = response.lower()
-        if any(word in response_lower for word in ["major news", "important", "significant"]):
-            return "high"
-        elif any(word in response_lower for word in ["minor", "small impact"]):
-            return "low"
-        else:
-            return "neutral"
-    
-    def _extract_action_from_response(self, response: str) -> str:
-        """Extrage actiunea recomandata"""
-        response_lower = response.lower()
-        if "buy" in response_lower or "long" in response_lower:
-            return "BUY"
-        elif "sell" in response_lower or "short" in response_lower:
-            return "SELL"
-        else:
-            return "HOLD"
-    
-    def _extract_confidence_from_response(self, response: str) -> float:
-        """Extrage confidence score din raspuns"""
-        # Simple heuristic based on keywords
-        response_lower = response.lower()
-        if any(word in response_lower for word in ["strong", "confident", "clear"]):
-            return 0.8
-        elif any(word in response_lower for word in ["weak", "uncertain", "mixed"]):
-            return 0.4
-        else:
-            return 0.6
-    
-    def _extract_price_levels(self, response: str) -> Dict[str, float]:
-        """Extrage nivelurile de pret din raspuns"""
-        # This would need more sophisticated parsing
-        # For now, return empty dict
-        return {"support": 0, "resistance": 0}
+        return self.symbol_registry.priority(symbol)
     
     async def stop_trading_session(self) -> None:
         """Opreste sesiunea de trading"""
         self.is_running = False
         
+        if self._event_feed_task:
+            self._event_feed_task.cancel()
+            self._event_feed_task = None
+        
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        
         try:
-            if self.mcp_client and hasattr(self.mcp_client, 'sessions'):
-                await self.mcp_client.close_all_sessions()
+            # Nu initializam clientul MCP doar ca sa il inchidem
+            mcp_client = self._components["mcp_client"].peek()
+            if mcp_client and hasattr(mcp_client, 'sessions'):
+                await mcp_client.close_all_sessions()
                 logger.info("MCP sessions closed")
         except Exception as e:
             logger.error(f"Error closing MCP sessions: {e}")
         
+        data_fetcher = self._components["data_fetcher"].peek()
+        if data_fetcher:
+            await data_fetcher.close()
+        
         logger.info("Trading session stopped")
     
     async def get_portfolio_summary(self) -> Dict[str, Any]:
         """Obtine sumar portofoliu"""
-        return await self.portfolio_tracker.get_portfolio_summary()
+        portfolio_tracker = (await self.ready_components("portfolio_tracker"))[0]
+        return await portfolio_tracker.get_portfolio_summary()
     
-    async def get_active_signals(self) -> List[TradingSignal]:
-        """Obtine semnalele active"""
-        return self.active_signals
+    async def get_active_signals(self, symbol: Optional[str] = None, action: Optional[str] = None,
+                                 min_confidence: Optional[float] = None) -> List[TradingSignal]:
+        """Obtine semnalele active (cele mai noi primele)"""
+        signals, _ = self.signal_store.query(symbol=symbol, action=action, min_confidence=min_confidence)
+        return signals
     
-    async def manual_analysis(self, query: str) -> str:
-        """Analiza manuala cu MCP agent"""
+    async def manual_analysis(self, query: str, session_id: Optional[str] = None) -> str:
+        """Analiza manuala cu MCP agent (cu istoric propriu daca e data o sesiune)"""
         try:
-            mcp_agent = MCPAgent(
-                llm=self.llm,
-                client=self.mcp_client,
-                max_steps=15,
-                memory_enabled=True
-            )
+            memory = self.chat_sessions.get(session_id) if session_id else None
+            return await self._run_manual_analysis(query, memory)
             
-            response = await mcp_agent.run(query)
+        except Exception as e:
+            logger.error(f"Error in manual analysis: {e}")
+            return f"Error: {str(e)}"
+    
+    async def stream_analysis(self, query: str, session_id: Optional[str] = None) -> AsyncIterator[Tuple[str, str]]:
+        """Analiza manuala in evenimente: ("token", text) pe masura ce vine raspunsul final,
+        ("reset", "") daca textul trimis apartinea unui pas intermediar, ("done", raspuns final)"""
+        memory = self.chat_sessions.get(session_id) if session_id else None
+        stream = TokenStream()
+        
+        async def run() -> str:
+            stream.activate()
+            try:
+                return await self._run_manual_analysis(query, memory)
+            finally:
+                stream.close()
+        
+        task = asyncio.create_task(run())
+        try:
+            async for token in stream:
+                yield ("reset", "") if token is RESET else ("token", token)
+            # Raspunsul final al agentului (propaga si eroarea analizei, daca a existat)
+            yield "done", await task
+        finally:
+            # Clientul s-a deconectat - agentul se intoarce in pool
+            if not task.done():
+                task.cancel()
+    
+    async def cached_analysis(self, query: str, template: str, symbol: str, timeframe: str,
+                              force_refresh: bool = False, tier: str = DEEP, escalate: bool = False) -> str:
+        """Analiza manuala reutilizata pana la inchiderea lumanarii curente.
+        
+        `escalate` (doar pentru semnale) reanalizeaza pe modelul mare raspunsurile modelului rapid
+        cu BUY/SELL si confidence la limita; analizele informative raman pe nivelul cerut.
+        """
+        if timeframe in TIMEFRAME_SECONDS:
+            key = self.response_cache.make_key(template, symbol, timeframe)
+        else:
+            # Fara durata lumanarii nu exista cheie de cache: analiza ruleaza necache-uita
+            logger.warning(f"Unsupported timeframe {timeframe!r} for {template}, skipping analysis cache")
+            key = None
+        
+        if key is not None and not force_refresh:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                logger.debug(f"Analysis cache hit: {template} {symbol} {timeframe}")
+                return cached
+        
+        async def run_and_cache() -> str:
+            response = await self._run_manual_analysis(query, tier=tier)
+            if escalate and self.model_router.resolve(tier) == FAST:
+                parsed = parse_response(response)
+                if self.model_router.should_escalate(parsed.action, parsed.confidence):
+                    deep_response = await self._run_manual_analysis(query, tier=DEEP)
+                    self.model_router.record_escalation(parsed.action, parse_response(deep_response).action)
+                    response = deep_response
+            if key is not None:
+                self.response_cache.set(key, response)
             return response
-            
+        
+        try:
+            if key is None:
+                return await run_and_cache()
+            # Request-urile identice aflate in executie impart acelasi apel LLM/MCP
+            return await self.single_flight.do(key, run_and_cache)
         except Exception as e:
             logger.error(f"Error in manual analysis: {e}")
             return f"Error: {str(e)}"
+    
+    async def _run_manual_analysis(self, query: str,
+                                   memory: Optional[BoundedConversationMemory] = None,
+                                   tier: str = DEEP) -> str:
+        """Ruleaza query-ul pe un agent din pool-ul nivelului de model"""
+        return await self._run_pooled(query, memory, stage="manual_analysis", tier=tier, priority=INTERACTIVE)
+    
+    async def _run_scan(self, query: str, tier: str = FAST) -> str:
+        """Scanare pe un agent din pool, fara istoric: scanarile concurente nu impart agentul sau memoria"""
+        return await self._run_pooled(query, stage="scan", tier=tier, priority=SIGNAL)
+    
+    async def _run_pooled(self, query: str, memory: Optional[BoundedConversationMemory] = None,
+                          stage: str = "default", tier: str = DEEP, priority: str = INTERACTIVE) -> str:
+        """Admitere prioritara, apoi checkout din pool.
+        
+        Agentul se ia doar dupa admitere: o scanare care asteapta un slot nu tine ocupat un agent,
+        iar pool-ul are cel putin cate un agent per slot, deci un request admis nu asteapta checkout-ul.
+        """
+        tier = self.model_router.resolve(tier)
+        # Factory-ul pool-ului foloseste LLM-ul si clientul MCP prin proprietatile sync
+        await self.ready_components(self._llm_component(tier), "mcp_client")
+        
+        # Admitere prioritara (poate ridica DeadlineExceeded daca nu exista capacitate la timp)
+        async with self.llm_scheduler.slot(priority) as admission_seconds:
+            started = time.monotonic()
+            async with self.agent_pools[tier].agent() as mcp_agent:
+                return await self._call_agent(mcp_agent, query, memory, stage,
+                                              admission_seconds + time.monotonic() - started, tier)
+    
+    async def _run_agent(self, mcp_agent: "MCPAgent", query: str,
+                         memory: Optional[BoundedConversationMemory] = None,
+                         stage: str = "default", tier: str = DEEP, priority: str = INTERACTIVE) -> str:
+        """Ruleaza query-ul pe un agent dedicat (loop-ul de trading), dupa admiterea prioritara"""
+        async with self.llm_scheduler.slot(priority) as admission_seconds:
+            return await self._call_agent(mcp_agent, query, memory, stage, admission_seconds, tier)
+    
+    async def _call_agent(self, mcp_agent: "MCPAgent", query: str,
+                          memory: Optional[BoundedConversationMemory], stage: str,
+                          queue_seconds: float, tier: str) -> str:
+        """Ruleaza query-ul cu istoricul limitat al memoriei date si inregistreaza metricile apelului"""
+        prompt = memory.build_prompt(query) if memory else query
+        self.prompt_metrics.record(prompt)
+        
+        started = time.monotonic()
+        try:
+            async with self.llm_metrics.track(stage, queue_seconds) as call:
+                response = await mcp_agent.run(prompt)
+                call.estimate(prompt, response)
+        except Exception:
+            self.model_router.record(tier, time.monotonic() - started, ok=False)
+            raise
+        self.model_router.record(tier, time.monotonic() - started)
+        
+        if memory:
+            memory.add_exchange(query, response)
+        return response
 
 if __name__ == "__main__":
     # Test run
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Conversation Memory
+Memorie de conversatie limitata la un buget de tokeni, cu izolare per sesiune
+"""
+
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+
+WINDOW = "window"
+SUMMARY = "summary"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimare rapida (~4 caractere per token pentru modelele Llama)"""
+    return max(1, len(text) // 4)
+
+
+@dataclass
+class _Message:
+    role: str
+    content: str
+    tokens: int
+
+
+class BoundedConversationMemory:
+    """Istoric limitat la `max_tokens`.
+
+    In modul `window` mesajele vechi sunt eliminate; in modul `summary` sunt
+    condensate intr-un rezumat extractiv limitat la `summary_tokens`.
+    """
+
+    def __init__(self, max_tokens: int = 3000, mode: str = WINDOW,
+                 summary_tokens: int = 500, summary_chars_per_message: int = 200):
+        if mode not in (WINDOW, SUMMARY):
+            raise ValueError(f"Unknown memory mode: {mode}")
+
+        self.max_tokens = max_tokens
+        self.mode = mode
+        self.summary_tokens = summary_tokens
+        self.summary_chars_per_message = summary_chars_per_message
+
+        self._messages: Deque[_Message] = deque()
+        self._tokens = 0
+        self._summary: Deque[str] = deque()
+        self._summary_tokens = 0
+        self.last_used = time.monotonic()
+
+    def add_exchange(self, query: str, response: str) -> None:
+        """Adauga o pereche intrebare/raspuns si aplica bugetul de tokeni"""
+        for role, content in (("user", query.strip()), ("assistant", response.strip())):
+            message = _Message(role, content, estimate_tokens(content))
+            self._messages.append(message)
+            self._tokens += message.tokens
+        self.last_used = time.monotonic()
+        self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        while self._messages and self._tokens > self.max_tokens:
+            message = self._messages.popleft()
+            self._tokens -= message.tokens
+            if self.mode == SUMMARY:
+                self._summarize(message)
+
+    def _summarize(self, message: _Message) -> None:
+        line = f"{message.role}: {' '.join(message.content.split())[:self.summary_chars_per_message]}"
+        self._summary.append(line)
+        self._summary_tokens += estimate_tokens(line)
+        while self._summary and self._summary_tokens > self.summary_tokens:
+            self._summary_tokens -= estimate_tokens(self._summary.popleft())
+
+    def build_prompt(self, query: str) -> str:
+        """Prompt-ul final: rezumat + istoric recent + intrebarea curenta"""
+        self.last_used = time.monotonic()
+        if not self._messages and not self._summary:
+            return query
+
+        parts = []
+        if self._summary:
+            parts.append("Rezumatul conversatiei anterioare:\n" + "\n".join(self._summary))
+        if self._messages:
+            parts.append("Conversatia recenta:\n" + "\n".join(f"{m.role}: {m.content}" for m in self._messages))
+        parts.append(f"Intrebarea curenta:\n{query}")
+        return "\n\n".join(parts)
+
+    @property
+    def tokens(self) -> int:
+        return self._tokens + self._summary_tokens
+
+    def clear(self) -> None:
+        self._messages.clear()
+        self._summary.clear()
+        self._tokens = 0
+        self._summary_tokens = 0
+
+
+class SessionMemoryStore:
+    """O memorie separata pentru fiecare sesiune de chat, cu limita de sesiuni si TTL"""
+
+    def __init__(self, max_sessions: int = 500, session_ttl: float = 3600, **memory_kwargs: Any):
+        self.max_sessions = max_sessions
+        self.session_ttl = session_ttl
+        self.memory_kwargs = memory_kwargs
+        self._sessions: "OrderedDict[str, BoundedConversationMemory]" = OrderedDict()
+
+    def get(self, session_id: str) -> BoundedConversationMemory:
+        """Memoria sesiunii (creata la prima utilizare)"""
+        self._expire()
+        memory = self._sessions.get(session_id)
+        if memory is None:
+            memory = BoundedConversationMemory(**self.memory_kwargs)
+            self._sessions[session_id] = memory
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+        return memory
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.session_ttl
+        while self._sessions:
+            session_id, memory = next(iter(self._sessions.items()))
+            if memory.last_used >= cutoff:
+                break
+            del self._sessions[session_id]
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class PromptTokenMetrics:
+    """Tokenii de prompt per apel LLM"""
+
+    def __init__(self):
+        self.calls = 0
+        self.total_tokens = 0
+        self.max_tokens = 0
+        self.last_tokens = 0
+
+    def record(self, prompt: str) -> int:
+        tokens = estimate_tokens(prompt)
+        self.calls += 1
+        self.total_tokens += tokens
+        self.max_tokens = max(self.max_tokens, tokens)
+        self.last_tokens = tokens
+        return tokens
+
+    def get_metrics(self) -> Dict[str, Optional[float]]:
+        return {
+            "calls": self.calls,
+            "avg_prompt_tokens": round(self.total_tokens / self.calls, 1) if self.calls else None,
+            "max_prompt_tokens": self.max_tokens,
+            "last_prompt_tokens": self.last_tokens,
+        }
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Market Event Scheduler
+Declanseaza scanari per simbol cand pretul/volumul depasesc pragurile configurate
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+@dataclass
+class _SymbolState:
+    prices: Deque[Tuple[float, float]] = field(default_factory=deque)  # (timestamp, price)
+    volume_baseline: Optional[float] = None
+    baseline_candle: Optional[float] = None  # deschiderea ultimei lumanari inchise din baseline
+    last_trigger: float = 0.0
+
+
+class MarketEventScheduler:
+    """Scheduler event-driven; intervalul fix ramane doar ca heartbeat"""
+
+    def __init__(self, volume_multiplier: float = 1.5, min_momentum_pct: float = 0.5,
+                 momentum_window: float = 60.0, cooldown: float = 60.0, volume_smoothing: float = 0.1,
+                 min_candle_progress: float = 0.2):
+        self.volume_multiplier = volume_multiplier
+        self.min_momentum_pct = min_momentum_pct
+        self.momentum_window = momentum_window
+        self.cooldown = cooldown
+        self.volume_smoothing = volume_smoothing
+        self.min_candle_progress = min_candle_progress
+
+        self._states: Dict[str, _SymbolState] = {}
+        self._pending: Dict[str, str] = {}  # symbol -> motivul declansarii
+        self._wakeup = asyncio.Event()
+
+        # Metrics
+        self.triggers = 0
+        self.heartbeats = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "MarketEventScheduler":
+        """Praguri din analysis.indicators.volume si strategies.momentum_scalping"""
+        analysis = config.get('analysis', {})
+        event_config = analysis.get('event_trigger', {})
+        return cls(
+            volume_multiplier=analysis.get('indicators', {}).get('volume', {}).get('threshold_multiplier', 1.5),
+            min_momentum_pct=config.get('strategies', {}).get('momentum_scalping', {}).get('min_momentum', 0.5),
+            momentum_window=event_config.get('momentum_window', 60),
+            cooldown=event_config.get('cooldown', 60)
+        )
+
+    def on_tick(self, symbol: str, price: float, volume: Optional[float] = None,
+                timestamp: Optional[float] = None, closed_volume: Optional[float] = None,
+                candle_open: Optional[float] = None, candle_progress: Optional[float] = None) -> Optional[str]:
+        """Proceseaza un tick de pret/volum; returneaza motivul daca simbolul a fost declansat.
+
+        `volume` este volumul lumanarii live, acumulat pana la `candle_progress` (0..1) din durata ei;
+        baseline-ul se construieste doar din `closed_volume` (lumanarea inchisa anterioara, deschisa
+        la `candle_open`). Fara `candle_progress`, `volume` este tratat ca volumul unei lumanari inchise.
+        """
+        now = time.monotonic() if timestamp is None else timestamp
+        state = self._states.setdefault(symbol, _SymbolState())
+
+        reason = None
+
+        # Momentum: variatia procentuala fata de cel mai vechi pret din fereastra
+        state.prices.append((now, price))
+        while state.prices and now - state.prices[0][0] > self.momentum_window:
+            state.prices.popleft()
+        reference = state.prices[0][1]
+        if reference > 0:
+            momentum = (price - reference) / reference * 100
+            if abs(momentum) >= self.min_momentum_pct:
+                reason = f"momentum {momentum:+.2f}%"
+
+        # Baseline: media exponentiala doar peste volumele lumanarilor inchise, o data per lumanare
+        if closed_volume is not None and (candle_open is None or candle_open != state.baseline_candle):
+            self._update_baseline(state, closed_volume)
+            state.baseline_candle = candle_open
+
+        # Volum anormal: volumul partial e proiectat pe toata durata lumanarii inainte de comparatie
+        if volume is not None:
+            baseline = state.volume_baseline
+            projected = volume if candle_progress is None else (
+                volume / max(min(candle_progress, 1.0), self.min_candle_progress)
+            )
+            if reason is None and baseline and projected >= self.volume_multiplier * baseline:
+                reason = f"volume {projected / baseline:.1f}x"
+            if candle_progress is None:
+                self._update_baseline(state, volume)
+
+        if reason is None or now - state.last_trigger < self.cooldown:
+            return None
+
+        state.last_trigger = now
+        # Referinta noua pentru momentum, altfel acelasi move ar declansa din nou
+        state.prices.clear()
+        state.prices.append((now, price))
+
+        self._pending[symbol] = reason
+        self.triggers += 1
+        self._wakeup.set()
+        return reason
+
+    def _update_baseline(self, state: _SymbolState, volume: float) -> None:
+        baseline = state.volume_baseline
+        state.volume_baseline = volume if baseline is None else (
+            self.volume_smoothing * volume + (1 - self.volume_smoothing) * baseline
+        )
+
+    async def wait(self, heartbeat: float) -> List[str]:
+        """Asteapta simboluri declansate; lista goala inseamna heartbeat (scanare completa)"""
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                self.heartbeats += 1
+                return []
+
+        symbols = list(self._pending)
+        self._pending.clear()
+        self._wakeup.clear()
+        return symbols
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "tracked_symbols": len(self._states),
+            "pending": len(self._pending),
+            "triggers": self.triggers,
+            "heartbeats": self.heartbeats,
+        }
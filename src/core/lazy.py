@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Lazy Components
+Componente initializate la prima utilizare sau de warm-up-ul din fundal
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+PENDING = "pending"
+INITIALIZING = "initializing"
+READY = "ready"
+FAILED = "failed"
+
+
+class LazyComponent:
+    """Wrapper thread-safe in jurul unui factory costisitor.
+
+    `get` e pentru codul sync (blocheaza pe lock cat dureaza initializarea); din event loop
+    se foloseste `aget`, care asteapta aceeasi initializare rulata intr-un thread.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        self.name = name
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._init_task: Optional[asyncio.Future] = None
+        self._instance: Any = None
+        self.state = PENDING
+        self.error: Optional[str] = None
+        self.init_seconds: Optional[float] = None
+
+    def get(self) -> Any:
+        """Returneaza instanta, creand-o la primul apel"""
+        if self.state == READY:
+            return self._instance
+
+        with self._lock:
+            if self.state == READY:
+                return self._instance
+
+            self.state = INITIALIZING
+            started = time.perf_counter()
+            try:
+                self._instance = self._factory()
+            except Exception as e:
+                self.state = FAILED
+                self.error = str(e)
+                logger.error(f"Error initializing {self.name}: {e}")
+                raise
+            self.init_seconds = time.perf_counter() - started
+            self.state = READY
+            self.error = None
+            logger.debug(f"{self.name} initialized in {self.init_seconds * 1000:.0f} ms")
+            return self._instance
+
+    def peek(self) -> Any:
+        """Instanta daca a fost deja creata, fara sa declanseze initializarea"""
+        return self._instance if self.state == READY else None
+
+    async def aget(self) -> Any:
+        """Returneaza instanta fara sa blocheze event loop-ul; apelurile concurente asteapta aceeasi initializare"""
+        if self.state == READY:
+            return self._instance
+
+        if self._init_task is None or self._init_task.done():
+            self._init_task = asyncio.ensure_future(asyncio.to_thread(self.get))
+        # Anularea unui apelant nu opreste initializarea asteptata si de ceilalti
+        return await asyncio.shield(self._init_task)
+
+    async def warm_up(self) -> bool:
+        """Initializeaza intr-un thread, fara sa blocheze event loop-ul"""
+        try:
+            await self.aget()
+            return True
+        except Exception:
+            return False
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "init_ms": round(self.init_seconds * 1000, 1) if self.init_seconds is not None else None,
+            "error": self.error,
+        }
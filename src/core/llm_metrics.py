@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - LLM Call Metrics
+Latenta, timp de asteptare, tokeni, pasi MCP si cost per apel si per etapa, exportate in Prometheus
+"""
+
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+from loguru import logger
+
+from .conversation_memory import estimate_tokens
+
+try:
+    from prometheus_client import Counter, Histogram
+except ImportError:
+    # prometheus-client face parte din extras "monitoring"
+    Counter = Histogram = None
+
+UNTRACKED_STAGE = "untracked"
+
+
+def _create_prometheus_metrics() -> Optional[Dict[str, Any]]:
+    """Metricile se inregistreaza o singura data per proces (registry-ul implicit nu accepta duplicate)"""
+    if Counter is None:
+        return None
+
+    return {
+        "calls": Counter(
+            "crypto_llm_calls_total", "MCPAgent.run calls", ["stage", "status"]
+        ),
+        "duration": Histogram(
+            "crypto_llm_call_duration_seconds", "Wall time of MCPAgent.run calls", ["stage"],
+            buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120)
+        ),
+        "queue": Histogram(
+            "crypto_llm_queue_seconds", "Time spent waiting for rate limiter or agent pool", ["stage"],
+            buckets=(0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30)
+        ),
+        "steps": Histogram(
+            "crypto_llm_mcp_steps", "LLM steps per MCPAgent.run call", ["stage"],
+            buckets=(1, 2, 3, 5, 8, 10, 15, 20)
+        ),
+        "requests": Counter(
+            "crypto_llm_requests_total", "Individual ChatGroq requests", ["stage"]
+        ),
+        "request_duration": Histogram(
+            "crypto_llm_request_duration_seconds", "Wall time of individual ChatGroq requests", ["stage"],
+            buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30)
+        ),
+        "tokens": Counter(
+            "crypto_llm_tokens_total", "LLM tokens", ["stage", "type"]
+        ),
+        "cost": Counter(
+            "crypto_llm_cost_usd_total", "Estimated LLM cost in USD", ["stage"]
+        ),
+    }
+
+
+_PROMETHEUS = _create_prometheus_metrics()
+
+
+@dataclass
+class LLMCall:
+    """Acumulatorul unui apel MCPAgent.run, completat de callback-urile LangChain"""
+    stage: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    llm_requests: int = 0
+    reported_usage: bool = False
+    estimated_prompt_tokens: int = 0
+    estimated_completion_tokens: int = 0
+
+    def estimate(self, prompt: str, response: str) -> None:
+        """Estimare folosita doar daca LLM-ul nu raporteaza token_usage"""
+        self.estimated_prompt_tokens = estimate_tokens(prompt)
+        self.estimated_completion_tokens = estimate_tokens(response)
+
+
+_current_call: ContextVar[Optional[LLMCall]] = ContextVar("current_llm_call", default=None)
+
+
+class LLMCallMetrics:
+    """Agregate per etapa (market_overview, scan, manual_analysis) plus export Prometheus"""
+
+    def __init__(self, prompt_cost_per_million: float = 0.0, completion_cost_per_million: float = 0.0):
+        self.prompt_cost_per_million = prompt_cost_per_million
+        self.completion_cost_per_million = completion_cost_per_million
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._request_started: Dict[Any, float] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "LLMCallMetrics":
+        pricing = config.get('llm', {}).get('pricing', {})
+        return cls(
+            prompt_cost_per_million=pricing.get('prompt_per_million', 0.0),
+            completion_cost_per_million=pricing.get('completion_per_million', 0.0)
+        )
+
+    @asynccontextmanager
+    async def track(self, stage: str, queue_seconds: float = 0.0) -> AsyncIterator[LLMCall]:
+        """Masoara un apel MCPAgent.run; tokenii vin din callback-urile ChatGroq din acelasi context"""
+        call = LLMCall(stage=stage)
+        token = _current_call.set(call)
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            yield call
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            _current_call.reset(token)
+            self._record_call(call, time.perf_counter() - started, queue_seconds, status)
+
+    def _record_call(self, call: LLMCall, wall_seconds: float, queue_seconds: float, status: str) -> None:
+        if not call.reported_usage:
+            call.prompt_tokens = call.estimated_prompt_tokens
+            call.completion_tokens = call.estimated_completion_tokens
+            self._record_tokens(call.stage, call.prompt_tokens, call.completion_tokens)
+
+        stats = self._stage_stats(call.stage)
+        stats["calls"] += 1
+        stats["errors"] += status == "error"
+        stats["wall_seconds"] += wall_seconds
+        stats["queue_seconds"] += queue_seconds
+        stats["llm_requests"] += call.llm_requests
+
+        if _PROMETHEUS:
+            _PROMETHEUS["calls"].labels(call.stage, status).inc()
+            _PROMETHEUS["duration"].labels(call.stage).observe(wall_seconds)
+            _PROMETHEUS["queue"].labels(call.stage).observe(queue_seconds)
+            if call.llm_requests:
+                _PROMETHEUS["steps"].labels(call.stage).observe(call.llm_requests)
+
+        logger.debug(
+            f"LLM call [{call.stage}] {status}: wall={wall_seconds:.2f}s queue={queue_seconds:.2f}s "
+            f"tokens={call.prompt_tokens}/{call.completion_tokens} steps={call.llm_requests}"
+        )
+
+    def _record_tokens(self, stage: str, prompt_tokens: int, completion_tokens: int) -> None:
+        cost = (prompt_tokens * self.prompt_cost_per_million
+                + completion_tokens * self.completion_cost_per_million) / 1_000_000
+        stats = self._stage_stats(stage)
+        stats["prompt_tokens"] += prompt_tokens
+        stats["completion_tokens"] += completion_tokens
+        stats["cost_usd"] += cost
+
+        if _PROMETHEUS:
+            _PROMETHEUS["tokens"].labels(stage, "prompt").inc(prompt_tokens)
+            _PROMETHEUS["tokens"].labels(stage, "completion").inc(completion_tokens)
+            _PROMETHEUS["cost"].labels(stage).inc(cost)
+
+    def _stage_stats(self, stage: str) -> Dict[str, float]:
+        return self._stages.setdefault(stage, {
+            "calls": 0, "errors": 0, "wall_seconds": 0.0, "queue_seconds": 0.0,
+            "prompt_tokens": 0, "completion_tokens": 0, "llm_requests": 0, "cost_usd": 0.0,
+        })
+
+    # Evenimente ChatGroq (apelate din callback handler)
+
+    def on_request_start(self, run_id: Any) -> None:
+        self._request_started[run_id] = time.perf_counter()
+
+    def on_request_end(self, run_id: Any, usage: Dict[str, Any]) -> None:
+        started = self._request_started.pop(run_id, None)
+        call = _current_call.get()
+        stage = call.stage if call else UNTRACKED_STAGE
+
+        prompt_tokens = int(usage.get("prompt_tokens", 0) or 0)
+        completion_tokens = int(usage.get("completion_tokens", 0) or 0)
+        if call:
+            call.llm_requests += 1
+            if usage:
+                call.reported_usage = True
+                call.prompt_tokens += prompt_tokens
+                call.completion_tokens += completion_tokens
+        if usage:
+            self._record_tokens(stage, prompt_tokens, completion_tokens)
+
+        if _PROMETHEUS:
+            _PROMETHEUS["requests"].labels(stage).inc()
+            if started is not None:
+                _PROMETHEUS["request_duration"].labels(stage).observe(time.perf_counter() - started)
+
+    def on_request_error(self, run_id: Any) -> None:
+        self._request_started.pop(run_id, None)
+
+    def callback_handler(self) -> Optional[Any]:
+        """Callback LangChain care trimite timpii si token_usage fiecarei cereri ChatGroq"""
+        try:
+            from langchain_core.callbacks import AsyncCallbackHandler
+        except ImportError:
+            logger.warning("langchain_core not available, per-request LLM token metrics disabled")
+            return None
+
+        metrics = self
+
+        class _LLMMetricsCallback(AsyncCallbackHandler):
+            async def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs) -> None:
+                metrics.on_request_start(run_id)
+
+            async def on_llm_start(self, serialized, prompts, *, run_id, **kwargs) -> None:
+                metrics.on_request_start(run_id)
+
+            async def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+                usage = (getattr(response, "llm_output", None) or {}).get("token_usage") or {}
+                metrics.on_request_end(run_id, usage)
+
+            async def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+                metrics.on_request_error(run_id)
+
+        return _LLMMetricsCallback()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Sumar per etapa pentru /health"""
+        summary = {}
+        for stage, stats in self._stages.items():
+            calls = stats["calls"]
+            summary[stage] = {
+                "calls": calls,
+                "errors": stats["errors"],
+                "avg_wall_ms": round(stats["wall_seconds"] / calls * 1000, 1) if calls else None,
+                "avg_queue_ms": round(stats["queue_seconds"] / calls * 1000, 1) if calls else None,
+                "avg_steps": round(stats["llm_requests"] / calls, 2) if calls else None,
+                "prompt_tokens": stats["prompt_tokens"],
+                "completion_tokens": stats["completion_tokens"],
+                "cost_usd": round(stats["cost_usd"], 6),
+            }
+        return summary
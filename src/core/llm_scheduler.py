@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - LLM Capacity Scheduler
+Admitere prioritara la capacitatea LLM partajata de API si loop-ul de trading, cu deadline-uri
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+from loguru import logger
+
+from .rate_limiter import TokenBucketRateLimiter
+
+INTERACTIVE = "interactive"
+SIGNAL = "signal"
+BACKGROUND = "background"
+
+PRIORITIES = {INTERACTIVE: 0, SIGNAL: 1, BACKGROUND: 2}
+
+
+class DeadlineExceeded(Exception):
+    """Request-ul nu a putut fi admis inainte de deadline"""
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    deadline: float
+    seq: int
+    priority_class: str = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: "asyncio.Future[None]" = field(compare=False)
+
+
+class LLMCapacityScheduler:
+    """Coada cu prioritati (interactive > signal > background), EDF in cadrul aceleiasi clase.
+
+    Un request este admis cand exista un slot liber si rate limiter-ul are token-uri;
+    `reserved_interactive` sloturi raman disponibile doar pentru request-urile interactive.
+    """
+
+    def __init__(self, max_concurrent: int = 5, rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 reserved_interactive: int = 1, deadlines: Optional[Dict[str, float]] = None,
+                 metrics_window: int = 500):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+        self.max_concurrent = max_concurrent
+        self.rate_limiter = rate_limiter
+        self.reserved_interactive = min(reserved_interactive, max_concurrent - 1)
+        self.deadlines = deadlines or {}
+        self._heap: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        # Metrics per clasa
+        self._wait_times: Dict[str, Deque[float]] = {name: deque(maxlen=metrics_window) for name in PRIORITIES}
+        self._admitted: Dict[str, int] = {name: 0 for name in PRIORITIES}
+        self._expired: Dict[str, int] = {name: 0 for name in PRIORITIES}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], mcp_config: Dict[str, Any]) -> "LLMCapacityScheduler":
+        """Sloturi din serverConfigs.concurrentServers, rata din features.rateLimit, deadline-uri din llm.scheduler"""
+        scheduler_config = config.get('llm', {}).get('scheduler', {})
+        return cls(
+            max_concurrent=mcp_config.get('serverConfigs', {}).get('concurrentServers', 5),
+            rate_limiter=TokenBucketRateLimiter.from_mcp_config(mcp_config),
+            reserved_interactive=scheduler_config.get('reserved_interactive_slots', 1),
+            deadlines=scheduler_config.get('deadlines', {})
+        )
+
+    @asynccontextmanager
+    async def slot(self, priority_class: str, deadline: Optional[float] = None) -> AsyncIterator[float]:
+        """Context manager: asteapta admiterea, elibereaza slotul la iesire; produce timpul de asteptare"""
+        wait_seconds = await self.acquire(priority_class, deadline)
+        try:
+            yield wait_seconds
+        finally:
+            self.release()
+
+    async def acquire(self, priority_class: str, deadline: Optional[float] = None) -> float:
+        """Asteapta admiterea; `deadline` = secunde maxime de asteptare (implicit cel al clasei)"""
+        if priority_class not in PRIORITIES:
+            raise ValueError(f"Unknown priority class: {priority_class}")
+
+        timeout = deadline if deadline is not None else self.deadlines.get(priority_class)
+        now = time.monotonic()
+        waiter = _Waiter(
+            priority=PRIORITIES[priority_class],
+            deadline=now + timeout if timeout else math.inf,
+            seq=next(self._seq),
+            priority_class=priority_class,
+            enqueued_at=now,
+            future=asyncio.get_running_loop().create_future()
+        )
+        heapq.heappush(self._heap, waiter)
+        self._ensure_dispatcher()
+        self._wakeup.set()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # Admis chiar inainte de anulare - slotul trebuie eliberat
+            if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+                self.release()
+            raise
+
+        return time.monotonic() - now
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wakeup.set()
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    def _expire(self, now: float) -> None:
+        """Respinge request-urile anulate sau care si-au depasit deadline-ul de admitere"""
+        alive = []
+        for waiter in self._heap:
+            if waiter.future.done():
+                continue
+            if waiter.deadline <= now:
+                self._expired[waiter.priority_class] += 1
+                waiter.future.set_exception(DeadlineExceeded(
+                    f"{waiter.priority_class} request not admitted within {now - waiter.enqueued_at:.1f}s"
+                ))
+                continue
+            alive.append(waiter)
+        if len(alive) != len(self._heap):
+            heapq.heapify(alive)
+            self._heap = alive
+
+    def _can_admit(self, waiter: _Waiter) -> bool:
+        if waiter.priority_class == INTERACTIVE:
+            return self._in_flight < self.max_concurrent
+        return self._in_flight < self.max_concurrent - self.reserved_interactive
+
+    async def _dispatch(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._expire(now)
+            next_deadline = min((waiter.deadline for waiter in self._heap), default=math.inf)
+            timeout = None if next_deadline == math.inf else max(0.0, next_deadline - now)
+
+            # Prima pozitie din heap are prioritatea maxima; daca ea nu poate fi admisa, nici restul
+            if not self._heap or not self._can_admit(self._heap[0]):
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            rate_wait = self.rate_limiter.try_acquire() if self.rate_limiter else 0.0
+            if rate_wait > 0:
+                await asyncio.sleep(rate_wait if timeout is None else min(rate_wait, timeout))
+                continue
+
+            waiter = heapq.heappop(self._heap)
+            self._in_flight += 1
+            self._admitted[waiter.priority_class] += 1
+            self._wait_times[waiter.priority_class].append(now - waiter.enqueued_at)
+            waiter.future.set_result(None)
+            logger.debug(f"Admitted {waiter.priority_class} LLM request after {now - waiter.enqueued_at:.2f}s")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        classes = {}
+        for name in PRIORITIES:
+            waits = sorted(self._wait_times[name])
+
+            def percentile(p: float) -> float:
+                if not waits:
+                    return 0.0
+                return waits[min(len(waits) - 1, int(p * len(waits)))]
+
+            classes[name] = {
+                "waiting": sum(1 for waiter in self._heap if waiter.priority_class == name and not waiter.future.done()),
+                "admitted": self._admitted[name],
+                "expired": self._expired[name],
+                "wait_p50_ms": round(percentile(0.50) * 1000, 2),
+                "wait_p95_ms": round(percentile(0.95) * 1000, 2),
+            }
+
+        return {
+            "in_flight": self._in_flight,
+            "max_concurrent": self.max_concurrent,
+            "reserved_interactive": self.reserved_interactive,
+            "classes": classes,
+        }
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Model Router
+Rutare pe niveluri de model: model mic si rapid pentru screening, escaladare la modelul mare
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+FAST = "fast"
+DEEP = "deep"
+
+STUB_RESPONSE = "HOLD - no clear setup. Confidence: 0.5 (stub LLM response)"
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    """Modelul si parametrii de generare pentru un nivel"""
+    name: str
+    model: str
+    max_tokens: int = 2000
+    temperature: float = 0.3
+
+
+class ModelRouter:
+    """Alege nivelul de model per task si decide escaladarea pentru raspunsurile la limita"""
+
+    def __init__(self, tiers: Dict[str, ModelTier], enabled: bool = True,
+                 escalation_band: Tuple[float, float] = (0.5, 0.75), provider: str = "groq",
+                 llm_factory: Optional[Callable[[ModelTier, List[Any]], Any]] = None):
+        if DEEP not in tiers:
+            raise ValueError("Model router requires a 'deep' tier")
+
+        self.tiers = tiers
+        self.enabled = enabled
+        self.escalation_band = escalation_band
+        self.provider = provider
+        self.llm_factory = llm_factory
+
+        # Metrics per nivel
+        self._stats: Dict[str, Dict[str, float]] = {
+            name: {"calls": 0, "errors": 0, "seconds": 0.0} for name in tiers
+        }
+        self.escalations = 0
+        self.escalation_agreements = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any],
+                    llm_factory: Optional[Callable[[ModelTier, List[Any]], Any]] = None) -> "ModelRouter":
+        router_config = config.get('llm', {}).get('router', {})
+        tiers_config = router_config.get('tiers', {})
+        tiers = {
+            name: ModelTier(
+                name=name,
+                model=tier.get('model', 'llama-3.1-70b-versatile'),
+                max_tokens=tier.get('max_tokens', 2000),
+                temperature=tier.get('temperature', 0.3)
+            )
+            for name, tier in tiers_config.items()
+        }
+        # Fara configuratie: un singur nivel, modelul folosit pana acum
+        tiers.setdefault(DEEP, ModelTier(name=DEEP, model="llama-3.1-70b-versatile", max_tokens=2000, temperature=0.3))
+
+        escalation = router_config.get('escalation', {})
+        return cls(
+            tiers=tiers,
+            enabled=router_config.get('enabled', False),
+            escalation_band=(escalation.get('min_confidence', 0.5), escalation.get('max_confidence', 0.75)),
+            provider=os.getenv("LLM_PROVIDER", router_config.get('provider', 'groq')),
+            llm_factory=llm_factory
+        )
+
+    def resolve(self, tier: str) -> str:
+        """Nivelul efectiv: modelul mare daca rutarea e dezactivata sau nivelul nu exista"""
+        if not self.enabled or tier not in self.tiers:
+            return DEEP
+        return tier
+
+    def active_tiers(self) -> List[str]:
+        return sorted({self.resolve(name) for name in self.tiers})
+
+    def should_escalate(self, action: str, confidence: float) -> bool:
+        """Escaladam doar semnalele BUY/SELL cu confidence la limita pragului de decizie"""
+        low, high = self.escalation_band
+        return self.enabled and self.resolve(FAST) == FAST and action != "HOLD" and low <= confidence < high
+
+    def create_llm(self, tier: str, callbacks: Optional[List[Any]] = None) -> Any:
+        """Construieste modelul pentru nivel (Groq, stub local sau factory injectat)"""
+        model_tier = self.tiers[self.resolve(tier)]
+        callbacks = callbacks or []
+
+        if self.llm_factory is not None:
+            return self.llm_factory(model_tier, callbacks)
+
+        if self.provider == "stub":
+            from langchain_core.language_models.fake_chat_models import FakeListChatModel
+            logger.warning(f"Using stub LLM for tier '{model_tier.name}'")
+            return FakeListChatModel(responses=[STUB_RESPONSE], callbacks=callbacks or None)
+
+        from langchain_groq import ChatGroq
+
+        api_key = os.getenv("GROQ_API_KEY")
+        if not api_key:
+            raise ValueError("GROQ_API_KEY not found in environment variables")
+
+        # Streaming: tokenii ajung la request-urile de chat pe masura ce sunt generati
+        return ChatGroq(
+            model=model_tier.model,
+            api_key=api_key,
+            temperature=model_tier.temperature,
+            max_tokens=model_tier.max_tokens,
+            streaming=True,
+            callbacks=callbacks or None
+        )
+
+    def record(self, tier: str, seconds: float, ok: bool = True) -> None:
+        stats = self._stats[self.resolve(tier)]
+        stats["calls"] += 1
+        stats["errors"] += not ok
+        stats["seconds"] += seconds
+
+    def record_escalation(self, fast_action: str, deep_action: str) -> None:
+        """Acordul dintre niveluri pe cazurile escaladate (proxy pentru acuratetea modelului mic)"""
+        self.escalations += 1
+        self.escalation_agreements += fast_action == deep_action
+
+    def get_metrics(self) -> Dict[str, Any]:
+        tiers = {}
+        for name, stats in self._stats.items():
+            calls = stats["calls"]
+            tiers[name] = {
+                "model": self.tiers[name].model,
+                "calls": calls,
+                "errors": stats["errors"],
+                "avg_latency_ms": round(stats["seconds"] / calls * 1000, 1) if calls else None,
+            }
+
+        fast_calls = self._stats.get(FAST, {}).get("calls", 0)
+        return {
+            "enabled": self.enabled,
+            "provider": self.provider,
+            "tiers": tiers,
+            "escalations": self.escalations,
+            "escalation_rate": round(self.escalations / fast_calls, 4) if fast_calls else 0.0,
+            "fast_deep_agreement": (
+                round(self.escalation_agreements / self.escalations, 4) if self.escalations else None
+            ),
+        }
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Stage Pipeline
+Pipeline asyncio cu cozi limitate intre etape, pentru procesare per simbol
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+_DONE = object()
+
+
+@dataclass
+class _Stage:
+    name: str
+    handler: Callable[[Any], Awaitable[Optional[Any]]]
+    workers: int
+    queue: "asyncio.Queue[Any]"
+    processed: int = 0
+    dropped: int = 0
+    errors: int = 0
+    max_depth: int = 0
+    busy_seconds: float = 0.0
+
+
+class AsyncStagePipeline:
+    """Etapele ruleaza in paralel; fiecare element trece mai departe imediat ce e gata"""
+
+    def __init__(self, queue_size: int = 10):
+        self.queue_size = queue_size
+        self._stages: List[_Stage] = []
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def add_stage(self, name: str, handler: Callable[[Any], Awaitable[Optional[Any]]],
+                  workers: int = 1) -> "AsyncStagePipeline":
+        """Handler-ul returneaza elementul pentru etapa urmatoare sau None ca sa il opreasca"""
+        self._stages.append(_Stage(
+            name=name,
+            handler=handler,
+            workers=max(1, workers),
+            queue=asyncio.Queue(maxsize=self.queue_size)
+        ))
+        return self
+
+    async def run(self, source: AsyncIterable[Any]) -> List[Any]:
+        """Proceseaza toate elementele din sursa; returneaza iesirile ultimei etape"""
+        if not self._stages:
+            return [item async for item in source]
+
+        results: List[Any] = []
+        self.started_at, self.finished_at = time.monotonic(), None
+
+        async def feed() -> None:
+            first = self._stages[0]
+            async for item in source:
+                await first.queue.put(item)
+                first.max_depth = max(first.max_depth, first.queue.qsize())
+            for _ in range(first.workers):
+                await first.queue.put(_DONE)
+
+        async def work(index: int) -> None:
+            stage = self._stages[index]
+            next_stage = self._stages[index + 1] if index + 1 < len(self._stages) else None
+            while True:
+                item = await stage.queue.get()
+                if item is _DONE:
+                    return
+                started = time.monotonic()
+                try:
+                    output = await stage.handler(item)
+                except Exception as e:
+                    # Un element esuat nu opreste pipeline-ul; ceilalti workeri continua
+                    logger.error(f"Error in pipeline stage {stage.name}: {e}")
+                    stage.errors += 1
+                    output = None
+                stage.busy_seconds += time.monotonic() - started
+                stage.processed += 1
+                if output is None:
+                    stage.dropped += 1
+                elif next_stage is None:
+                    results.append(output)
+                else:
+                    await next_stage.queue.put(output)
+                    next_stage.max_depth = max(next_stage.max_depth, next_stage.queue.qsize())
+
+        async def run_stage(index: int) -> None:
+            await asyncio.gather(*(work(index) for _ in range(self._stages[index].workers)))
+            # Toti workerii au terminat - semnalam sfarsitul etapei urmatoare
+            if index + 1 < len(self._stages):
+                for _ in range(self._stages[index + 1].workers):
+                    await self._stages[index + 1].queue.put(_DONE)
+
+        tasks = [asyncio.ensure_future(feed())]
+        tasks += [asyncio.ensure_future(run_stage(i)) for i in range(len(self._stages))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Eroare in sursa (sau anulare): oprim toate etapele si propagam eroarea
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            self.finished_at = time.monotonic()
+        return results
+
+    @property
+    def running(self) -> bool:
+        return self.started_at is not None and self.finished_at is None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Adancimea cozilor si throughput per etapa; citibil si in timpul rularii"""
+        if self.started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        return {
+            "running": self.running,
+            "elapsed_seconds": round(elapsed, 3),
+            "stages": {
+                stage.name: {
+                    "queue_depth": stage.queue.qsize(),
+                    "max_queue_depth": stage.max_depth,
+                    "processed": stage.processed,
+                    "dropped": stage.dropped,
+                    "errors": stage.errors,
+                    "busy_seconds": round(stage.busy_seconds, 3),
+                    "throughput_per_second": round(stage.processed / elapsed, 3) if elapsed > 0 else 0.0,
+                }
+                for stage in self._stages
+            }
+        }
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Quantitative Pre-Screen
+Filtru determinist (RSI/MACD/Bollinger/volum) rulat local inainte de LLM
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..data.indicators import TechnicalIndicators
+
+
+@dataclass
+class PreScreenResult:
+    """Rezultatul pre-screen-ului pentru un simbol"""
+    symbol: str
+    passed: bool
+    triggers: List[str] = field(default_factory=list)
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+
+class QuantPreScreen:
+    """Decide ce simboluri merita escaladate catre MCP/LLM"""
+
+    def __init__(self, indicators_config: Dict[str, Any], min_candle_progress: float = 0.2):
+        # Aceleasi formule si perioade ca motorul de indicatori (src/data/indicators.py)
+        self.indicators = TechnicalIndicators(indicators_config)
+        settings = self.indicators.settings
+        rsi = indicators_config.get("rsi", {})
+        volume = indicators_config.get("volume", {})
+
+        self.rsi_period = settings.rsi_period
+        self.rsi_overbought = rsi.get("overbought", 70)
+        self.rsi_oversold = rsi.get("oversold", 30)
+        self.macd_fast = settings.macd_fast
+        self.macd_slow = settings.macd_slow
+        self.macd_signal = settings.macd_signal
+        self.bb_period = settings.bb_period
+        self.bb_std_dev = settings.bb_std_dev
+        self.volume_multiplier = volume.get("threshold_multiplier", 1.5)
+        self.volume_period = volume.get("period", self.bb_period)
+        self.min_candle_progress = min_candle_progress
+
+    @property
+    def min_history(self) -> int:
+        """Numarul minim de lumanari necesare pentru toti indicatorii"""
+        return max(self.rsi_period + 1, self.macd_slow + self.macd_signal, self.bb_period, self.volume_period + 1)
+
+    def evaluate(self, symbol: str, closes: Sequence[float],
+                 volumes: Optional[Sequence[float]] = None,
+                 candle_progress: Optional[float] = None) -> PreScreenResult:
+        """Aplica pragurile din analysis.indicators pe seria de preturi.
+
+        `candle_progress` (0..1) este progresul ultimei lumanari daca e inca deschisa: volumul ei
+        partial e proiectat pe toata durata lumanarii, ca in MarketEventScheduler.
+        """
+        if len(closes) < self.min_history:
+            # Istoric insuficient - nu putem exclude simbolul, il lasam sa treaca
+            return PreScreenResult(symbol=symbol, passed=True, triggers=["insufficient_history"])
+
+        triggers = []
+        metrics = {}
+        indicators = self.indicators
+
+        # RSI in zona de supra-cumparare / supra-vanzare
+        rsi = indicators.rsi(closes, self.rsi_period)
+        metrics["rsi"] = rsi
+        if rsi >= self.rsi_overbought:
+            triggers.append("rsi_overbought")
+        elif rsi <= self.rsi_oversold:
+            triggers.append("rsi_oversold")
+
+        # MACD cross pe ultima lumanare
+        _, _, histogram_prev = indicators.macd(closes[:-1], self.macd_fast, self.macd_slow, self.macd_signal)
+        _, _, histogram = indicators.macd(closes, self.macd_fast, self.macd_slow, self.macd_signal)
+        metrics["macd_histogram"] = histogram
+        if histogram_prev <= 0 < histogram:
+            triggers.append("macd_bullish_cross")
+        elif histogram_prev >= 0 > histogram:
+            triggers.append("macd_bearish_cross")
+
+        # Pretul in afara benzilor Bollinger
+        upper, _, lower = indicators.bollinger_bands(closes, self.bb_period, self.bb_std_dev)
+        metrics["bb_upper"], metrics["bb_lower"] = upper, lower
+        if closes[-1] > upper:
+            triggers.append("bb_upper_break")
+        elif closes[-1] < lower:
+            triggers.append("bb_lower_break")
+
+        # Volum anormal fata de media lumanarilor inchise anterioare
+        if volumes and len(volumes) > self.volume_period:
+            baseline = sum(volumes[-self.volume_period - 1:-1]) / self.volume_period
+            volume = volumes[-1]
+            if candle_progress is not None:
+                volume /= max(min(candle_progress, 1.0), self.min_candle_progress)
+            ratio = volume / baseline if baseline > 0 else 0.0
+            metrics["volume_ratio"] = ratio
+            if ratio >= self.volume_multiplier:
+                triggers.append("volume_spike")
+
+        return PreScreenResult(symbol=symbol, passed=bool(triggers), triggers=triggers, metrics=metrics)
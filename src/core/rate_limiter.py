@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Rate Limiter
+Token bucket asincron pentru limitarea apelurilor LLM/MCP
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+
+class TokenBucketRateLimiter:
+    """Token bucket partajat intre task-uri asyncio"""
+
+    def __init__(self, requests_per_minute: float = 60, burst: Optional[int] = None):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self.rate = requests_per_minute / 60.0  # tokens per second
+        self.capacity = float(max(1, burst or 1))
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_mcp_config(cls, mcp_config: Dict[str, Any]) -> Optional["TokenBucketRateLimiter"]:
+        """Construieste limiter-ul din sectiunile features/serverConfigs din mcp_config.json"""
+        rate_limit = mcp_config.get("features", {}).get("rateLimit", {})
+        if not rate_limit.get("enabled", False):
+            return None
+
+        burst = mcp_config.get("serverConfigs", {}).get("concurrentServers", 1)
+        return cls(
+            requests_per_minute=rate_limit.get("requestsPerMinute", 60),
+            burst=burst
+        )
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Asteapta pana cand sunt disponibile token-uri; returneaza timpul de asteptare"""
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens, capacity is {self.capacity}")
+
+        started = time.monotonic()
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return time.monotonic() - started
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Consuma token-uri fara sa astepte; returneaza 0 la succes, altfel secundele pana devin disponibile"""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+    async def __aenter__(self) -> "TokenBucketRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
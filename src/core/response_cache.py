@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Analysis Response Cache
+Cache LRU pentru analizele LLM, cu expirare aliniata la inchiderea lumanarii
+"""
+
+import heapq
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..data.timeframes import candle_close_time, candle_open_time
+
+CacheKey = Tuple[str, str, str, int]
+
+
+class AnalysisResponseCache:
+    """Cache keyed pe (template, symbol, timeframe, candle bucket)"""
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        # Heap (expires_at, key): intrarile scoase sau rescrise raman in heap si sunt ignorate la pop
+        self._expiry: List[Tuple[float, CacheKey]] = []
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(template: str, symbol: str, timeframe: str, timestamp: Optional[float] = None) -> CacheKey:
+        """Cheia de cache pentru lumanarea curenta a timeframe-ului"""
+        return (template, symbol.upper(), timeframe, candle_open_time(timeframe, timestamp))
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Returneaza raspunsul din cache daca lumanarea nu s-a inchis inca"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at, _ = entry
+        if time.time() >= expires_at:
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: CacheKey, value: Any, size: Optional[int] = None) -> None:
+        """Salveaza valoarea pana la inchiderea lumanarii din cheie (size estimat daca lipseste)"""
+        _, _, timeframe, bucket = key
+        expires_at = candle_close_time(timeframe, bucket)
+        if size is None:
+            size = sys.getsizeof(value if isinstance(value, str) else repr(value))
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (value, expires_at, size)
+        self._bytes += size
+        heapq.heappush(self._expiry, (expires_at, key))
+        self._evict()
+
+    def _remove(self, key: CacheKey) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        """Elimina intrarile expirate (din varful heap-ului), apoi cele mai vechi (LRU) peste limite"""
+        now = time.time()
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(expiry)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == expires_at:
+                self._remove(key)
+
+        # Reconstruim heap-ul cand intrarile moarte le depasesc pe cele vii (cost amortizat O(1) per set)
+        if len(expiry) > 2 * len(self._entries) + 64:
+            self._expiry = [(expires_at, key) for key, (_, expires_at, _) in self._entries.items()]
+            heapq.heapify(self._expiry)
+
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._expiry.clear()
+        self._bytes = 0
+
+    def get_metrics(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
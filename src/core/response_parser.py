@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Response Parser
+Parser unic pentru raspunsurile LLM (sentiment, trend, actiune, nivele de pret)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+_NUMBER = r"\d[\d,]*(?:\.\d+)?"
+
+# Valoarea numerica de dupa o eticheta: "entry: $63,250.5", "stop loss la 61800", "confidence score 78%", "8/10"
+_LEVEL_VALUE = re.compile(
+    rf"[a-z_ -]{{0,12}}?\s*[:=]?\s*(?:at\s+|of\s+|is\s+|la\s+)?\$?(?P<value>{_NUMBER})"
+    rf"\s*(?:(?P<pct>%)|/\s*(?P<scale>10|100)\b)?"
+)
+
+# Format ACTION|ENTRY_PRICE|STOP_LOSS|TAKE_PROFIT|CONFIDENCE
+_PIPE_SIGNAL = re.compile(
+    rf"(?P<action>buy|sell|hold)\s*\|\s*\$?(?P<entry>{_NUMBER})\s*\|\s*\$?(?P<stop>{_NUMBER})"
+    rf"\s*\|\s*\$?(?P<target>{_NUMBER})\s*\|\s*(?P<confidence>{_NUMBER})\s*(?P<pct>%)?"
+)
+
+# (camp, ((valoare, cuvinte cheie), ...), valoare implicita) - prima regula care se potriveste castiga
+_KEYWORD_RULES = (
+    ("sentiment", (("bullish", ("bullish", "positive", "optimistic", "green")),
+                   ("bearish", ("bearish", "negative", "pessimistic", "red"))), "neutral"),
+    ("trend", (("uptrend", ("uptrend", "up trend")),
+               ("downtrend", ("downtrend", "down trend"))), "sideways"),
+    ("volume_status", (("high", ("high volume", "increased volume")),
+                       ("low", ("low volume", "decreased volume"))), "normal"),
+    ("news_impact", (("high", ("major news", "important", "significant")),
+                     ("low", ("minor", "small impact"))), "neutral"),
+    ("action", (("BUY", ("buy", "long")),
+                ("SELL", ("sell", "short"))), "HOLD"),
+    ("tone", (("strong", ("strong", "confident", "clear")),
+              ("weak", ("weak", "uncertain", "mixed"))), "neutral"),
+)
+
+# Eticheta din text -> campul numeric
+_LEVEL_LABELS = (
+    ("entry", "entry_price"),
+    ("stop loss", "stop_loss"),
+    ("stop_loss", "stop_loss"),
+    ("stop-loss", "stop_loss"),
+    ("take profit", "take_profit"),
+    ("take_profit", "take_profit"),
+    ("take-profit", "take_profit"),
+    ("target", "take_profit"),
+    ("support", "support"),
+    ("resistance", "resistance"),
+    ("confidence", "confidence"),
+)
+
+
+@dataclass
+class ParsedResponse:
+    """Campurile extrase dintr-un raspuns LLM"""
+    sentiment: str = "neutral"
+    trend: str = "sideways"
+    volume_status: str = "normal"
+    news_impact: str = "neutral"
+    action: str = "HOLD"
+    entry_price: float = 0.0
+    stop_loss: float = 0.0
+    take_profit: float = 0.0
+    support: float = 0.0
+    resistance: float = 0.0
+    explicit_confidence: Optional[float] = None  # 0.0 - 1.0, daca raspunsul contine un scor numeric
+    strong_language: bool = False
+    weak_language: bool = False
+
+    @property
+    def confidence(self) -> float:
+        """Scorul numeric daca exista, altfel euristica pe cuvinte cheie"""
+        if self.explicit_confidence is not None:
+            return self.explicit_confidence
+        if self.strong_language:
+            return 0.8
+        if self.weak_language:
+            return 0.4
+        return 0.6
+
+
+def _to_float(value: str) -> float:
+    return float(value.replace(",", ""))
+
+
+def normalize_confidence(value: float, is_percent: bool = False, scale: Optional[str] = None) -> float:
+    """Confidence in 0..1: fara scala explicita, 1-10 e pe scala de 10 ("8.5" -> 0.85), peste 10 procent"""
+    if scale:
+        value /= float(scale)
+    elif is_percent or value > 10.0:
+        value /= 100.0
+    elif value > 1.0:
+        value /= 10.0
+    return max(0.0, min(value, 1.0))
+
+
+def _first_level(text: str, label: str, is_price: bool) -> Optional[float]:
+    """Prima valoare numerica care urmeaza imediat dupa eticheta.
+
+    Pentru preturi, valorile relative ("stop loss at 5%", "8/10") sunt ignorate si cautarea continua.
+    """
+    index = text.find(label)
+    while index != -1:
+        match = _LEVEL_VALUE.match(text, index + len(label))
+        if match:
+            value, is_percent, scale = _to_float(match.group("value")), bool(match.group("pct")), match.group("scale")
+            if not is_price:
+                return normalize_confidence(value, is_percent, scale)
+            if not (is_percent or scale):
+                return value
+        index = text.find(label, index + len(label))
+    return None
+
+
+def parse_response(response: str) -> ParsedResponse:
+    """Extrage toate campurile dintr-o singura copie lowercased a raspunsului.
+
+    Textul e lowercased o singura data, dar nu e parcurs o singura data: fiecare cuvant cheie
+    e cautat cu `in` si fiecare eticheta cu `str.find` (cautari in C, cu oprire la prima
+    potrivire), iar valoarea etichetei e citita cu un regex ancorat imediat dupa ea. Un regex
+    unic cu toate cuvintele, care parcurge textul o data, e de cateva ori mai lent
+    (vezi scripts/benchmark_response_parser.py).
+    """
+    text = response.lower()
+
+    fields: Dict[str, str] = {}
+    for field, rules, default in _KEYWORD_RULES:
+        fields[field] = next(
+            (value for value, words in rules if any(word in text for word in words)),
+            default
+        )
+
+    levels: Dict[str, float] = {}
+    for label, field in _LEVEL_LABELS:
+        if field in levels:
+            continue
+        value = _first_level(text, label, is_price=field != "confidence")
+        if value is not None:
+            levels[field] = value
+
+    parsed = ParsedResponse(
+        sentiment=fields["sentiment"],
+        trend=fields["trend"],
+        volume_status=fields["volume_status"],
+        news_impact=fields["news_impact"],
+        action=fields["action"],
+        entry_price=levels.get("entry_price", 0.0),
+        stop_loss=levels.get("stop_loss", 0.0),
+        take_profit=levels.get("take_profit", 0.0),
+        support=levels.get("support", 0.0),
+        resistance=levels.get("resistance", 0.0),
+        explicit_confidence=levels.get("confidence"),
+        strong_language=fields["tone"] == "strong",
+        weak_language=fields["tone"] == "weak",
+    )
+
+    if "|" in text:
+        pipe = _PIPE_SIGNAL.search(text)
+        if pipe:
+            # Formatul structurat are prioritate fata de textul liber
+            parsed.action = pipe.group("action").upper()
+            parsed.entry_price = _to_float(pipe.group("entry"))
+            parsed.stop_loss = _to_float(pipe.group("stop"))
+            parsed.take_profit = _to_float(pipe.group("target"))
+            parsed.explicit_confidence = normalize_confidence(
+                _to_float(pipe.group("confidence")), bool(pipe.group("pct"))
+            )
+
+    return parsed
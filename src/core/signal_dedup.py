@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Signal Deduplication
+Index de cooldown pentru semnale similare (simbol, actiune, banda de pret, timeframe)
+"""
+
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DedupKey = Tuple[str, str, int, str]
+
+
+class SignalDedupIndex:
+    """Suprima semnalele identice ca simbol/actiune/timeframe si cu pret in aceeasi banda, pe durata cooldown-ului"""
+
+    def __init__(self, cooldown: float = 300, price_band_pct: float = 0.5):
+        if price_band_pct <= 0:
+            raise ValueError("price_band_pct must be positive")
+
+        self.cooldown = cooldown
+        self.price_band_pct = price_band_pct
+        self._log_band = math.log1p(price_band_pct / 100.0)
+        self._seen: "OrderedDict[DedupKey, float]" = OrderedDict()
+
+        # Metrics
+        self.checked = 0
+        self.suppressed = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SignalDedupIndex":
+        rate_limits = config.get('notifications', {}).get('rate_limits', {})
+        return cls(
+            cooldown=rate_limits.get('cooldown_similar_alerts', 300),
+            price_band_pct=rate_limits.get('similar_price_band_pct', 0.5)
+        )
+
+    def price_band(self, price: float) -> int:
+        """Benzi logaritmice: latimea relativa a fiecarei benzi este price_band_pct"""
+        if price <= 0:
+            return 0
+        return math.floor(math.log(price) / self._log_band)
+
+    def make_key(self, signal: Any) -> DedupKey:
+        return (
+            signal.symbol.upper(),
+            signal.action,
+            self.price_band(signal.entry_price),
+            getattr(signal, "timeframe", "") or "",
+        )
+
+    def _purge(self, now: float) -> None:
+        # Intrarile sunt in ordinea ultimei aparitii - cele expirate sunt la inceput
+        while self._seen:
+            key, seen_at = next(iter(self._seen.items()))
+            if now - seen_at < self.cooldown:
+                break
+            del self._seen[key]
+
+    def is_duplicate(self, signal: Any, now: Optional[float] = None) -> bool:
+        """True daca un semnal similar a fost vazut in cooldown; altfel il inregistreaza"""
+        now = time.time() if now is None else now
+        self._purge(now)
+        self.checked += 1
+
+        symbol, action, band, timeframe = self.make_key(signal)
+        # Si benzile vecine: un pret care oscileaza pe granita nu trebuie sa para semnal nou
+        for neighbour in (band, band - 1, band + 1):
+            if (symbol, action, neighbour, timeframe) in self._seen:
+                self.suppressed += 1
+                return True
+
+        key = (symbol, action, band, timeframe)
+        self._seen[key] = now
+        return False
+
+    def clear(self) -> None:
+        self._seen.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "tracked": len(self._seen),
+            "checked": self.checked,
+            "suppressed": self.suppressed,
+            "cooldown_seconds": self.cooldown,
+        }
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Signal Store
+Semnalele active, indexate pe simbol si timestamp, cu expirare si limita de memorie
+"""
+
+import heapq
+import itertools
+import time
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..data.timeframes import TIMEFRAME_SECONDS
+
+IndexEntry = Tuple[float, int]  # (timestamp epoch, signal id)
+
+
+@dataclass
+class _StoredSignal:
+    signal: Any
+    symbol: str
+    timestamp: float
+    expires_at: float
+
+
+class SignalStore:
+    """Index pe timestamp (global si per simbol) cu liste sortate: cautare de interval O(log n)"""
+
+    def __init__(self, max_signals: int = 1000, default_ttl: float = 3600,
+                 timeframe_ttls: Optional[Dict[str, float]] = None, default_hold_candles: int = 12):
+        self.max_signals = max_signals
+        self.default_ttl = default_ttl
+        self.timeframe_ttls = timeframe_ttls or {}
+        self.default_hold_candles = default_hold_candles
+
+        self._signals: Dict[int, _StoredSignal] = {}
+        self._by_time: List[IndexEntry] = []
+        self._by_symbol: Dict[str, List[IndexEntry]] = {}
+        self._expiry: List[Tuple[float, int]] = []
+        self._ids = itertools.count(1)
+
+        # Metrics
+        self.added = 0
+        self.expired = 0
+        self.evicted = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SignalStore":
+        """TTL per timeframe din strategies.*.max_hold_time; restul expira dupa default_hold_candles lumanari"""
+        store_config = config.get('trading', {}).get('signals', {})
+
+        timeframe_ttls: Dict[str, float] = {}
+        for strategy in config.get('strategies', {}).values():
+            if not isinstance(strategy, dict) or 'max_hold_time' not in strategy:
+                continue
+            for timeframe in strategy.get('timeframes', []):
+                timeframe_ttls[timeframe] = max(timeframe_ttls.get(timeframe, 0), strategy['max_hold_time'])
+
+        return cls(
+            max_signals=store_config.get('max_active_signals', 1000),
+            default_ttl=store_config.get('default_ttl', 3600),
+            timeframe_ttls=timeframe_ttls,
+            default_hold_candles=store_config.get('default_hold_candles', 12)
+        )
+
+    def ttl_for(self, timeframe: Optional[str]) -> float:
+        if timeframe in self.timeframe_ttls:
+            return self.timeframe_ttls[timeframe]
+        if timeframe in TIMEFRAME_SECONDS:
+            return TIMEFRAME_SECONDS[timeframe] * self.default_hold_candles
+        return self.default_ttl
+
+    @staticmethod
+    def _timestamp(signal: Any) -> float:
+        value = getattr(signal, "timestamp", None)
+        if isinstance(value, datetime):
+            return value.timestamp()
+        return time.time()
+
+    def add(self, signal: Any) -> int:
+        """Adauga semnalul; returneaza id-ul lui"""
+        self.expire()
+
+        signal_id = next(self._ids)
+        timestamp = self._timestamp(signal)
+        expires_at = time.time() + self.ttl_for(getattr(signal, "timeframe", None))
+        symbol = signal.symbol.upper()
+        self._signals[signal_id] = _StoredSignal(signal, symbol, timestamp, expires_at)
+
+        entry = (timestamp, signal_id)
+        insort(self._by_time, entry)
+        insort(self._by_symbol.setdefault(symbol, []), entry)
+        heapq.heappush(self._expiry, (expires_at, signal_id))
+        self.added += 1
+
+        # Limita de memorie: eliminam cele mai vechi semnale
+        while len(self._signals) > self.max_signals:
+            _, oldest_id = self._by_time[0]
+            self._remove(oldest_id)
+            self.evicted += 1
+
+        return signal_id
+
+    def _remove(self, signal_id: int) -> None:
+        stored = self._signals.pop(signal_id, None)
+        if stored is None:
+            return
+        entry = (stored.timestamp, signal_id)
+        for index in (self._by_time, self._by_symbol.get(stored.symbol, [])):
+            position = bisect_left(index, entry)
+            if position < len(index) and index[position] == entry:
+                del index[position]
+        if not self._by_symbol.get(stored.symbol):
+            self._by_symbol.pop(stored.symbol, None)
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Elimina semnalele expirate; intrarile din heap pentru semnale deja sterse sunt ignorate"""
+        now = time.time() if now is None else now
+        removed = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            _, signal_id = heapq.heappop(self._expiry)
+            if signal_id in self._signals:
+                self._remove(signal_id)
+                removed += 1
+        self.expired += removed
+        return removed
+
+    def query(self, symbol: Optional[str] = None, action: Optional[str] = None,
+              min_confidence: Optional[float] = None, since: Optional[float] = None,
+              until: Optional[float] = None, offset: int = 0, limit: Optional[int] = None,
+              newest_first: bool = True) -> Tuple[List[Any], int]:
+        """Semnalele active din intervalul [since, until], filtrate si paginate; returneaza (pagina, total)"""
+        self.expire()
+
+        index = self._by_time if symbol is None else self._by_symbol.get(symbol.upper(), [])
+        start = bisect_left(index, (since, 0)) if since is not None else 0
+        end = bisect_right(index, (until, float("inf"))) if until is not None else len(index)
+        entries = index[start:end]
+        if newest_first:
+            entries.reverse()
+
+        signals = (self._signals[signal_id].signal for _, signal_id in entries)
+        if action is not None:
+            action = action.upper()
+            signals = (signal for signal in signals if signal.action == action)
+        if min_confidence is not None:
+            signals = (signal for signal in signals if signal.confidence >= min_confidence)
+
+        matched = list(signals)
+        page = matched[offset:offset + limit] if limit is not None else matched[offset:]
+        return page, len(matched)
+
+    def latest(self, symbol: str) -> Optional[Any]:
+        """Cel mai recent semnal activ pentru simbol"""
+        self.expire()
+        index = self._by_symbol.get(symbol.upper())
+        return self._signals[index[-1][1]].signal if index else None
+
+    def all(self) -> List[Any]:
+        return self.query()[0]
+
+    def clear(self) -> None:
+        self._signals.clear()
+        self._by_time.clear()
+        self._by_symbol.clear()
+        self._expiry.clear()
+
+    def __len__(self) -> int:
+        return len(self._signals)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "active": len(self._signals),
+            "symbols": len(self._by_symbol),
+            "max_signals": self.max_signals,
+            "added": self.added,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Single Flight
+Deduplicare pentru request-uri identice aflate in executie simultan
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Request-urile concurente cu aceeasi cheie asteapta un singur future comun"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+        # Metrics
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Executa `fn` o singura data per cheie; ceilalti apelanti primesc acelasi rezultat"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+        # shield: un client deconectat nu anuleaza executia pentru ceilalti
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Marcheaza exceptia ca fiind preluata chiar daca toti apelantii au renuntat
+            task.exception()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._inflight),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
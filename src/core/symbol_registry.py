@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Symbol Registry
+Index compilat al simbolurilor din config/symbols.json, cu hot-reload atomic
+"""
+
+import json
+import math
+import os
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+DEFAULT_PRIORITY = 999
+
+
+@dataclass(frozen=True)
+class SymbolInfo:
+    """Vedere read-only asupra unui simbol din registry"""
+    symbol: str
+    name: str
+    group: str
+    category: str
+    priority: int
+    tick_size: float
+    step_size: float
+    min_notional: float
+    max_position_usd: float
+    leverage_max: int
+    enabled: bool
+
+
+class _Snapshot:
+    """Tabelele compilate; nu se modifica dupa constructie"""
+
+    def __init__(self, raw: Dict[str, Any]):
+        groups = raw.get("crypto_symbols", {})
+        entries = [(symbol.upper(), group, config)
+                   for group, symbols in groups.items()
+                   for symbol, config in symbols.items()]
+
+        self.raw = raw
+        self.symbols: Tuple[str, ...] = tuple(symbol for symbol, _, _ in entries)
+        self.ids: Dict[str, int] = {symbol: index for index, symbol in enumerate(self.symbols)}
+        self.names = tuple(config.get("name", symbol) for symbol, _, config in entries)
+        self.groups = tuple(group for _, group, _ in entries)
+        self.categories = tuple(config.get("category", group) for _, group, config in entries)
+        self.priority = array("i", (int(config.get("priority", DEFAULT_PRIORITY)) for _, _, config in entries))
+        self.tick_size = array("d", (float(config.get("tick_size", 0.0)) for _, _, config in entries))
+        self.step_size = array("d", (float(config.get("step_size", 0.0)) for _, _, config in entries))
+        self.min_notional = array("d", (float(config.get("min_notional", 0.0)) for _, _, config in entries))
+        self.max_position_usd = array("d", (float(config.get("max_position_usd", 0.0)) for _, _, config in entries))
+        self.leverage_max = array("i", (int(config.get("leverage_max", 1)) for _, _, config in entries))
+        self.enabled = array("b", (bool(config.get("enabled", False)) for _, _, config in entries))
+
+        # Simbolurile active, pre-sortate dupa prioritate
+        self.by_priority: Tuple[int, ...] = tuple(sorted(
+            (index for index in range(len(self.symbols)) if self.enabled[index]),
+            key=lambda index: self.priority[index]
+        ))
+
+
+class SymbolRegistry:
+    """Lookup O(1) pentru prioritate, tick/step size, limite si flag-ul enabled"""
+
+    def __init__(self, path: str = "config/symbols.json", reload_check_interval: float = 5.0):
+        self.path = path
+        self.reload_check_interval = reload_check_interval
+        self._snapshot = _Snapshot({})
+        self._file_signature: Optional[Tuple[int, int]] = None
+        self._next_check = 0.0
+        self.reload()
+
+    def _signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def reload(self) -> bool:
+        """Recompileaza registry-ul; snapshot-ul vechi ramane activ daca fisierul e invalid"""
+        signature = self._signature()
+        try:
+            with open(self.path, 'r') as f:
+                snapshot = _Snapshot(json.load(f))
+        except Exception as e:
+            logger.error(f"Error loading symbols config: {e}")
+            return False
+
+        # O singura atribuire: cititorii vad fie snapshot-ul vechi, fie pe cel nou
+        self._snapshot = snapshot
+        self._file_signature = signature
+        logger.info(f"Symbol registry loaded: {len(snapshot.symbols)} symbols, {len(snapshot.by_priority)} enabled")
+        return True
+
+    def maybe_reload(self) -> bool:
+        """Reincarca daca symbols.json s-a schimbat (verificare limitata in timp)"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        self._next_check = now + self.reload_check_interval
+
+        signature = self._signature()
+        if signature is None or signature == self._file_signature:
+            return False
+        return self.reload()
+
+    @property
+    def raw_config(self) -> Dict[str, Any]:
+        return self._snapshot.raw
+
+    def id_of(self, symbol: str) -> Optional[int]:
+        return self._snapshot.ids.get(symbol.upper())
+
+    def is_known(self, symbol: str) -> bool:
+        return symbol.upper() in self._snapshot.ids
+
+    def is_enabled(self, symbol: str) -> bool:
+        snapshot = self._snapshot
+        index = snapshot.ids.get(symbol.upper())
+        return index is not None and bool(snapshot.enabled[index])
+
+    def priority(self, symbol: str) -> int:
+        snapshot = self._snapshot
+        index = snapshot.ids.get(symbol.upper())
+        return DEFAULT_PRIORITY if index is None else snapshot.priority[index]
+
+    def max_position_usd(self, symbol: str) -> float:
+        snapshot = self._snapshot
+        index = snapshot.ids.get(symbol.upper())
+        return 0.0 if index is None else snapshot.max_position_usd[index]
+
+    def info(self, symbol: str) -> Optional[SymbolInfo]:
+        snapshot = self._snapshot
+        index = snapshot.ids.get(symbol.upper())
+        if index is None:
+            return None
+        return SymbolInfo(
+            symbol=snapshot.symbols[index],
+            name=snapshot.names[index],
+            group=snapshot.groups[index],
+            category=snapshot.categories[index],
+            priority=snapshot.priority[index],
+            tick_size=snapshot.tick_size[index],
+            step_size=snapshot.step_size[index],
+            min_notional=snapshot.min_notional[index],
+            max_position_usd=snapshot.max_position_usd[index],
+            leverage_max=snapshot.leverage_max[index],
+            enabled=bool(snapshot.enabled[index])
+        )
+
+    def enabled_symbols(self, groups: Optional[Iterable[str]] = None, limit: Optional[int] = None) -> List[str]:
+        """Simbolurile active sortate dupa prioritate, optional filtrate pe grupuri din symbols.json"""
+        snapshot = self._snapshot
+        allowed = set(groups) if groups is not None else None
+        result = []
+        for index in snapshot.by_priority:
+            if allowed is None or snapshot.groups[index] in allowed:
+                result.append(snapshot.symbols[index])
+                if limit is not None and len(result) >= limit:
+                    break
+        return result
+
+    def round_price(self, symbol: str, price: float) -> float:
+        """Rotunjeste pretul la tick size-ul simbolului"""
+        snapshot = self._snapshot
+        index = snapshot.ids.get(symbol.upper())
+        tick = snapshot.tick_size[index] if index is not None else 0.0
+        return round(round(price / tick) * tick, 12) if tick > 0 else price
+
+    def round_quantity(self, symbol: str, quantity: float) -> float:
+        """Rotunjeste cantitatea in jos la step size-ul simbolului"""
+        snapshot = self._snapshot
+        index = snapshot.ids.get(symbol.upper())
+        step = snapshot.step_size[index] if index is not None else 0.0
+        return round(math.floor(quantity / step + 1e-9) * step, 12) if step > 0 else quantity
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Token Stream
+Transmite tokenii raspunsului final generati de ChatGroq catre request-ul de chat care i-a cerut
+"""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from loguru import logger
+
+_END = object()
+
+# Marcaj in stream: textul trimis pana acum apartinea unui pas cu tool call si trebuie sters
+RESET = object()
+
+_current_stream: ContextVar[Optional["TokenStream"]] = ContextVar("current_token_stream", default=None)
+
+
+class _Run:
+    def __init__(self):
+        self.pending: List[str] = []
+        self.pending_chars = 0
+        self.streaming = False
+        self.tool_call = False
+
+
+class TokenStream:
+    """Coada de tokeni pentru un singur request; alimentata din callback-ul LLM.
+
+    Un agent MCP face mai multe apeluri LLM (pasi cu tool call, apoi raspunsul final).
+    Tokenii fiecarui apel sunt retinuti pana la `hold_chars` caractere; daca apelul se
+    dovedeste a fi un tool call, sunt aruncati (iar daca au fost deja trimisi, se trimite RESET).
+    """
+
+    def __init__(self, hold_chars: int = 80):
+        self.hold_chars = hold_chars
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._runs: Dict[Any, _Run] = {}
+
+    def activate(self) -> None:
+        """Leaga stream-ul de contextul task-ului curent (fiecare task are copia lui de context)"""
+        _current_stream.set(self)
+
+    def push(self, token: str, run_id: Any = None, tool_call: bool = False) -> None:
+        run = self._runs.setdefault(run_id, _Run())
+        if tool_call:
+            self.discard_run(run_id)
+            return
+        if run.tool_call or not token:
+            return
+        if run.streaming:
+            self._queue.put_nowait(token)
+            return
+
+        run.pending.append(token)
+        run.pending_chars += len(token)
+        if run.pending_chars >= self.hold_chars:
+            self._flush(run)
+
+    def _flush(self, run: _Run) -> None:
+        for token in run.pending:
+            self._queue.put_nowait(token)
+        run.pending.clear()
+        run.streaming = True
+
+    def finish_run(self, run_id: Any = None, tool_call: bool = False) -> None:
+        """Apelul LLM s-a terminat: trimite restul tokenilor sau ii arunca daca a fost tool call"""
+        if tool_call:
+            self.discard_run(run_id)
+            return
+        run = self._runs.get(run_id)
+        if run is not None and not run.tool_call:
+            self._flush(run)
+
+    def discard_run(self, run_id: Any = None) -> None:
+        run = self._runs.setdefault(run_id, _Run())
+        if run.streaming:
+            self._queue.put_nowait(RESET)
+        run.pending.clear()
+        run.streaming = False
+        run.tool_call = True
+
+    def close(self) -> None:
+        self._queue.put_nowait(_END)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        """Produce tokeni (str) si marcajul RESET"""
+        while True:
+            token = await self._queue.get()
+            if token is _END:
+                return
+            yield token
+
+
+def _has_tool_calls(message: Any) -> bool:
+    return bool(getattr(message, "tool_call_chunks", None) or getattr(message, "tool_calls", None))
+
+
+def stream_callback_handler() -> Optional[Any]:
+    """Callback LangChain care trimite tokenii raspunsului final catre stream-ul request-ului curent"""
+    try:
+        from langchain_core.callbacks import AsyncCallbackHandler
+    except ImportError:
+        logger.warning("langchain_core not available, token streaming disabled")
+        return None
+
+    class _TokenStreamCallback(AsyncCallbackHandler):
+        async def on_llm_new_token(self, token: str, *, chunk: Any = None, run_id: Any = None, **kwargs) -> None:
+            stream = _current_stream.get()
+            if stream is not None:
+                stream.push(token, run_id, tool_call=_has_tool_calls(getattr(chunk, "message", None)))
+
+        async def on_llm_end(self, response: Any, *, run_id: Any = None, **kwargs) -> None:
+            stream = _current_stream.get()
+            if stream is None:
+                return
+            generations = getattr(response, "generations", None) or [[]]
+            message = getattr(generations[0][0], "message", None) if generations[0] else None
+            stream.finish_run(run_id, tool_call=_has_tool_calls(message))
+
+    return _TokenStreamCallback()
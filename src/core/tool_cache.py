@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - MCP Tool Call Cache
+Cache pentru rezultatele tool-urilor MCP, cu TTL per server/tool si limita de dimensiune
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from .single_flight import SingleFlight
+
+ToolCallKey = Tuple[str, str, str]
+
+
+class MCPToolCallCache:
+    """Cache LRU keyed pe (server, tool, argumente), cu expirare dupa TTL-ul serverului"""
+
+    def __init__(self, server_ttls: Optional[Dict[str, float]] = None,
+                 tool_ttls: Optional[Dict[str, Dict[str, float]]] = None,
+                 default_ttl: float = 0.0, max_entries: int = 1000):
+        self.server_ttls = server_ttls or {}
+        self.tool_ttls = tool_ttls or {}
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[ToolCallKey, Tuple[Any, float]]" = OrderedDict()
+        self._single_flight = SingleFlight()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+        self._server_stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_mcp_config(cls, mcp_config: Dict[str, Any]) -> Optional["MCPToolCallCache"]:
+        """Construieste cache-ul din features.caching si cacheTtl/cacheToolTtls din mcpServers"""
+        if not mcp_config.get("features", {}).get("caching", False):
+            return None
+
+        servers = mcp_config.get("mcpServers", {})
+        return cls(
+            server_ttls={name: float(server.get("cacheTtl", 0)) for name, server in servers.items()},
+            tool_ttls={name: server["cacheToolTtls"] for name, server in servers.items() if "cacheToolTtls" in server},
+            default_ttl=float(mcp_config.get("serverConfigs", {}).get("cacheDefaultTtl", 0)),
+            max_entries=int(mcp_config.get("serverConfigs", {}).get("cacheMaxEntries", 1000))
+        )
+
+    def ttl_for(self, server: str, tool: str) -> float:
+        """TTL-ul tool-ului daca e configurat, altfel cel al serverului (0 = fara cache)"""
+        tool_ttl = self.tool_ttls.get(server, {}).get(tool)
+        if tool_ttl is not None:
+            return float(tool_ttl)
+        return self.server_ttls.get(server, self.default_ttl)
+
+    @staticmethod
+    def make_key(server: str, tool: str, arguments: Optional[Dict[str, Any]]) -> ToolCallKey:
+        return (server, tool, json.dumps(arguments or {}, sort_keys=True, default=str))
+
+    async def call(self, server: str, tool: str, arguments: Optional[Dict[str, Any]],
+                   fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Returneaza rezultatul din cache sau executa apelul (o singura data pentru apeluri identice)"""
+        ttl = self.ttl_for(server, tool)
+        if ttl <= 0:
+            self.bypassed += 1
+            return await fn()
+
+        stats = self._server_stats.setdefault(server, {"hits": 0, "misses": 0})
+        key = self.make_key(server, tool, arguments)
+        entry = self._entries.get(key)
+        if entry is not None:
+            result, expires_at = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                stats["hits"] += 1
+                return result
+            del self._entries[key]
+
+        async def execute() -> Any:
+            # Apelurile identice aflate deja in executie sunt numarate ca "coalesced", nu ca miss
+            self.misses += 1
+            stats["misses"] += 1
+            result = await fn()
+            # Erorile tool-ului nu se pastreaza - urmatorul apel reincearca
+            if not getattr(result, "isError", False):
+                self._store(key, result, ttl)
+            return result
+
+        return await self._single_flight.do(key, execute)
+
+    def _store(self, key: ToolCallKey, result: Any, ttl: float) -> None:
+        self._entries[key] = (result, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def wrap_session(self, server: str, session: Any) -> None:
+        """Inlocuieste call_tool pe connector-ul sesiunii cu varianta cu cache"""
+        connector = getattr(session, "connector", None)
+        if connector is None or getattr(connector, "_tool_cache_installed", False):
+            return
+
+        original_call_tool = connector.call_tool
+
+        async def call_tool(name: str, arguments: Optional[Dict[str, Any]] = None, *args, **kwargs) -> Any:
+            return await self.call(
+                server, name, arguments,
+                lambda: original_call_tool(name, arguments, *args, **kwargs)
+            )
+
+        connector.call_tool = call_tool
+        connector._tool_cache_installed = True
+
+    def install(self, client: Any) -> None:
+        """Activeaza cache-ul pentru sesiunile existente si pentru cele create ulterior de client"""
+        for server, session in getattr(client, "sessions", {}).items():
+            self.wrap_session(server, session)
+
+        create_session = getattr(client, "create_session", None)
+        if create_session is None:
+            logger.warning("MCP client does not expose create_session, tool call cache covers existing sessions only")
+            return
+
+        async def create_session_with_cache(server_name: str, *args, **kwargs) -> Any:
+            session = await create_session(server_name, *args, **kwargs)
+            self.wrap_session(server_name, session)
+            return session
+
+        client.create_session = create_session_with_cache
+        logger.info(f"MCP tool call cache enabled (max {self.max_entries} entries)")
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bypassed": self.bypassed,
+            "coalesced": self._single_flight.coalesced,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "servers": {server: dict(stats) for server, stats in self._server_stats.items()},
+        }
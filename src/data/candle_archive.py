@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Candle Archive
+Istoric OHLCV pe disc: fisiere append-only cu inregistrari de lungime fixa, citite prin numpy.memmap
+"""
+
+import os
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .timeframes import timeframe_to_seconds
+
+try:
+    import fcntl
+except ImportError:  # Windows: fara lock intre procese - un singur proces trebuie sa scrie arhiva
+    fcntl = None
+
+MAGIC = b"CMACNDL1"
+HEADER_SIZE = 64
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("volume", "<f8"),
+])
+
+
+class _ArchiveFile:
+    """Un fisier (simbol, timeframe): header de 64 bytes urmat de inregistrari RECORD_DTYPE"""
+
+    def __init__(self, path: Path, timeframe: str, index_stride: int):
+        self.path = path
+        self.timeframe = timeframe
+        self.index_stride = index_stride
+        self._map: Optional[np.memmap] = None
+        self._count = 0
+        self._index: list = []  # timestamp-ul fiecarei a `index_stride`-a inregistrari
+
+    def _header(self) -> bytes:
+        header = MAGIC + np.array([1, timeframe_to_seconds(self.timeframe)], dtype="<u4").tobytes()
+        return header.ljust(HEADER_SIZE, b"\0")
+
+    def records(self) -> np.memmap:
+        """Memmap read-only peste inregistrarile complete; remapat doar cand fisierul a crescut"""
+        if not self.path.exists():
+            return np.empty(0, dtype=RECORD_DTYPE)
+
+        # O inregistrare scrisa partial (writer in curs sau oprit brusc) nu este inca vizibila
+        size = self.path.stat().st_size
+        if size < HEADER_SIZE:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        count = (size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        if self._map is None or count != self._count:
+            if self._map is None:
+                with open(self.path, "rb") as f:
+                    if f.read(len(MAGIC)) != MAGIC:
+                        raise ValueError(f"Not a candle archive: {self.path}")
+            self._map = np.memmap(self.path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE,
+                                  shape=(count,)) if count > 0 else np.empty(0, dtype=RECORD_DTYPE)
+            if count < self._count:
+                self._index.clear()
+            self._count = count
+            # Indexul rar se extinde doar cu intrarile noi
+            timestamps = self._map["timestamp"]
+            self._index.extend(timestamps[len(self._index) * self.index_stride::self.index_stride].tolist())
+        return self._map
+
+    def last_timestamp(self) -> Optional[int]:
+        records = self.records()
+        return int(records["timestamp"][-1]) if len(records) else None
+
+    def append(self, candles: np.ndarray) -> int:
+        """Adauga lumanarile mai noi decat ultima inregistrare; returneaza cate au fost scrise"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # "a+b": creeaza fisierul daca lipseste, iar scrierile ajung mereu la final
+        with open(self.path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)  # eliberat la inchiderea fisierului
+
+            # Dimensiunea se citeste dupa lock: alt writer poate sa fi scris intre timp header-ul sau inregistrari
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER_SIZE:
+                # Fisier nou sau header incomplet: header-ul se scrie sub lock
+                f.truncate(0)
+                f.write(self._header())
+                size = HEADER_SIZE
+            else:
+                f.seek(0)
+                if f.read(len(MAGIC)) != MAGIC:
+                    raise ValueError(f"Not a candle archive: {self.path}")
+                tail = (size - HEADER_SIZE) % RECORD_DTYPE.itemsize
+                if tail:
+                    # Inregistrare incompleta lasata de un writer oprit brusc
+                    size -= tail
+                    f.truncate(size)
+
+            if size > HEADER_SIZE:
+                f.seek(size - RECORD_DTYPE.itemsize)
+                last = int(np.frombuffer(f.read(RECORD_DTYPE.itemsize), dtype=RECORD_DTYPE)["timestamp"][0])
+                candles = candles[candles["timestamp"] > last]
+            if len(candles):
+                f.write(candles.tobytes())
+            return len(candles)
+
+    def read(self, start: Optional[float] = None, end: Optional[float] = None) -> np.ndarray:
+        """Lumanarile cu timestamp in [start, end), ca view fara copiere peste memmap"""
+        records = self.records()
+        timestamps = records["timestamp"]
+        return records[self._locate(timestamps, start, 0):self._locate(timestamps, end, len(records))]
+
+    def _locate(self, timestamps: np.ndarray, value: Optional[float], default: int) -> int:
+        if value is None:
+            return default
+        # Indexul rar restrange cautarea la un singur bloc din fisier
+        block = max(bisect_right(self._index, value) - 1, 0)
+        low = block * self.index_stride
+        high = min(low + self.index_stride, len(timestamps))
+        return low + int(np.searchsorted(timestamps[low:high], value))
+
+
+class CandleArchive:
+    """Arhiva append-only per (simbol, timeframe); mai multe procese pot citi concurent"""
+
+    def __init__(self, root: str = "data/candles", index_stride: int = 4096):
+        self.root = Path(root)
+        self.index_stride = index_stride
+        self._files: Dict[Tuple[str, str], _ArchiveFile] = {}
+
+        # Metrics
+        self.appended = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["CandleArchive"]:
+        archive_config = config.get('data', {}).get('archive', {})
+        if not archive_config.get('enabled', False):
+            return None
+        return cls(
+            root=archive_config.get('path', 'data/candles'),
+            index_stride=archive_config.get('index_stride', 4096)
+        )
+
+    def _file(self, symbol: str, timeframe: str) -> _ArchiveFile:
+        key = (symbol.upper(), timeframe)
+        archive_file = self._files.get(key)
+        if archive_file is None:
+            path = self.root / key[0] / f"{timeframe}.candles"
+            archive_file = self._files[key] = _ArchiveFile(path, timeframe, self.index_stride)
+        return archive_file
+
+    def append(self, symbol: str, timeframe: str, candles: np.ndarray) -> int:
+        """Lumanari inchise, ca matrice (6, n) din CandleStore sau array RECORD_DTYPE"""
+        if candles.dtype != RECORD_DTYPE:
+            columns = np.asarray(candles, dtype=np.float64)
+            records = np.empty(columns.shape[1], dtype=RECORD_DTYPE)
+            for index, name in enumerate(RECORD_DTYPE.names):
+                records[name] = columns[index]
+            candles = records
+
+        try:
+            written = self._file(symbol, timeframe).append(candles)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error archiving {symbol} {timeframe} candles: {e}")
+            return 0
+        self.appended += written
+        return written
+
+    def read(self, symbol: str, timeframe: str, start: Optional[float] = None,
+             end: Optional[float] = None) -> np.ndarray:
+        """Interval [start, end) in secunde epoch; view read-only peste fisier"""
+        return self._file(symbol, timeframe).read(start, end)
+
+    def last_timestamp(self, symbol: str, timeframe: str) -> Optional[int]:
+        return self._file(symbol, timeframe).last_timestamp()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "root": str(self.root),
+            "open_files": len(self._files),
+            "appended": self.appended,
+        }
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Candle Store
+Istoric OHLCV in memorie: ring buffer NumPy prealocat per (simbol, timeframe)
+"""
+
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .timeframes import candle_open_time
+
+COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+TIMESTAMP, OPEN, HIGH, LOW, CLOSE, VOLUME = range(len(COLUMNS))
+
+
+class OHLCVRingBuffer:
+    """Coloane OHLCV prealocate, append O(1), ferestre contigue fara copiere.
+
+    Fiecare lumanare este scrisa de doua ori (pozitia `i` si `i + capacity`), astfel
+    incat ultimele `n` lumanari formeaza mereu un slice contiguu al bufferului.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.capacity = capacity
+        self._data = np.zeros((len(COLUMNS), 2 * capacity), dtype=np.float64)
+        self._head = capacity - 1  # ultima pozitie scrisa
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        return float(self._data[TIMESTAMP, self._head]) if self._size else None
+
+    def append(self, timestamp: float, open_: float, high: float, low: float,
+               close: float, volume: float) -> bool:
+        """Adauga o lumanare; aceeasi deschidere suprascrie lumanarea live. False daca e mai veche"""
+        last = self.last_timestamp
+        if last is not None and timestamp < last:
+            return False
+        if last is None or timestamp > last:
+            self._head = (self._head + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+        row = (timestamp, open_, high, low, close, volume)
+        self._data[:, self._head] = row
+        self._data[:, self._head + self.capacity] = row
+        return True
+
+    def extend(self, rows: Iterable[Sequence[float]]) -> int:
+        """Adauga lumanari [timestamp, open, high, low, close, volume]; returneaza cate au fost acceptate"""
+        return sum(self.append(*row[:len(COLUMNS)]) for row in rows)
+
+    def window(self, n: Optional[int] = None) -> np.ndarray:
+        """Ultimele `n` lumanari ca view read-only de forma (6, n), in ordine cronologica"""
+        n = self._size if n is None else max(0, min(n, self._size))
+        end = self._head + self.capacity + 1
+        view = self._data[:, end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        return self.window(n)[COLUMNS.index(name)]
+
+    def clear(self) -> None:
+        self._head = self.capacity - 1
+        self._size = 0
+
+
+class CandleStore:
+    """Ring buffer-e OHLCV indexate pe (simbol, timeframe), cu istoric maxim configurabil"""
+
+    def __init__(self, max_history: int = 1000, max_history_per_timeframe: Optional[Dict[str, int]] = None):
+        self.max_history = max_history
+        self.max_history_per_timeframe = max_history_per_timeframe or {}
+        self._buffers: Dict[Tuple[str, str], OHLCVRingBuffer] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "CandleStore":
+        store_config = config.get('data', {}).get('candle_store', {})
+        return cls(
+            max_history=store_config.get('max_history', 1000),
+            max_history_per_timeframe=store_config.get('max_history_per_timeframe', {})
+        )
+
+    def capacity_for(self, timeframe: str) -> int:
+        return self.max_history_per_timeframe.get(timeframe, self.max_history)
+
+    def buffer(self, symbol: str, timeframe: str) -> OHLCVRingBuffer:
+        key = (symbol.upper(), timeframe)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = OHLCVRingBuffer(self.capacity_for(timeframe))
+        return buffer
+
+    def ingest(self, symbol: str, timeframe: str, rows: Iterable[Sequence[float]]) -> int:
+        """Lumanari in formatul ccxt ([timestamp ms, open, high, low, close, volume])"""
+        buffer = self.buffer(symbol, timeframe)
+        return sum(buffer.append(row[0] / 1000.0, *row[1:len(COLUMNS)]) for row in rows)
+
+    def window(self, symbol: str, timeframe: str, limit: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Coloanele ultimelor `limit` lumanari, ca view-uri fara copiere"""
+        window = self.buffer(symbol, timeframe).window(limit)
+        return {name: window[index] for index, name in enumerate(COLUMNS)}
+
+    def count(self, symbol: str, timeframe: str) -> int:
+        buffer = self._buffers.get((symbol.upper(), timeframe))
+        return len(buffer) if buffer else 0
+
+    def last_timestamp(self, symbol: str, timeframe: str) -> Optional[float]:
+        buffer = self._buffers.get((symbol.upper(), timeframe))
+        return buffer.last_timestamp if buffer else None
+
+    def has_live_candle(self, symbol: str, timeframe: str, now: Optional[float] = None) -> bool:
+        """True daca ultima lumanare stocata este cea curenta (inca deschisa)"""
+        return self.last_timestamp(symbol, timeframe) == candle_open_time(timeframe, now)
+
+    def clear(self) -> None:
+        self._buffers.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "series": len(self._buffers),
+            "candles": sum(len(buffer) for buffer in self._buffers.values()),
+            "allocated_bytes": sum(buffer._data.nbytes for buffer in self._buffers.values()),
+            "max_history": self.max_history,
+        }
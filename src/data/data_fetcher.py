@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Data Fetcher
+Date OHLCV de pe exchange, servite din CandleStore; reteaua doar pentru lumanarile lipsa de 1m,
+timeframe-urile superioare sunt derivate incremental din ele
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .candle_archive import CandleArchive
+from .candle_store import CLOSE, COLUMNS, TIMESTAMP, CandleStore
+from .indicators import TechnicalIndicators
+from .resampler import TimeframeRollup
+from .timeframes import candle_open_time, timeframe_to_seconds
+
+# (simbol, timeframe, since in ms sau None, limit) -> lumanari [timestamp ms, open, high, low, close, volume]
+OHLCVSource = Callable[[str, str, Optional[int], int], Awaitable[List[Sequence[float]]]]
+
+
+class DataFetcher:
+    """Citire prin cache: lumanarile inchise se descarca o singura data, lumanarea live periodic"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, source: Optional[OHLCVSource] = None):
+        config = config or {}
+        data_config = config.get('data', {})
+
+        self.candle_store = CandleStore.from_config(config)
+        self.indicators = TechnicalIndicators.from_config(config)
+        self.archive = CandleArchive.from_config(config)
+        self.exchange_id = data_config.get('exchange', 'binance')
+        self.default_limit = data_config.get('default_limit', 200)
+        self.live_refresh_seconds = data_config.get('live_refresh_seconds', 5)
+        self.page_size = data_config.get('max_candles_per_request', 1000)
+
+        # Un singur flux de baza; timeframe-urile din resample_timeframes sunt agregate din el
+        self.base_timeframe = data_config.get('base_timeframe', '1m')
+        base_seconds = timeframe_to_seconds(self.base_timeframe)
+        base_span = self.candle_store.capacity_for(self.base_timeframe) * base_seconds
+        self.resample_timeframes = set()
+        for timeframe in data_config.get('resample_timeframes', []):
+            seconds = timeframe_to_seconds(timeframe)
+            # Intervalul curent trebuie sa incapa in istoricul de baza pastrat in memorie
+            if seconds > base_seconds and seconds % base_seconds == 0 and seconds <= base_span:
+                self.resample_timeframes.add(timeframe)
+            else:
+                logger.warning(f"Timeframe {timeframe} cannot be derived from {self.base_timeframe}, fetching directly")
+        self._rollups: Dict[str, Dict[str, TimeframeRollup]] = {}
+
+        self._source = source
+        self._exchange = None
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._loaded_depth: Dict[Tuple[str, str], int] = {}
+        self._refreshed_at: Dict[Tuple[str, str], float] = {}
+        self._indicators_fed: Dict[Tuple[str, str], float] = {}
+        self._archived: Dict[Tuple[str, str], Optional[float]] = {}
+
+        # Metrics
+        self.hits = 0
+        self.fetches = 0
+        self.candles_fetched = 0
+        self.resampled_bars = 0
+
+    async def _fetch_ohlcv(self, symbol: str, timeframe: str, since: Optional[int],
+                           limit: int) -> List[Sequence[float]]:
+        if self._source is not None:
+            return await self._source(symbol, timeframe, since, limit)
+
+        if self._exchange is None:
+            import ccxt.async_support as ccxt
+            self._exchange = getattr(ccxt, self.exchange_id)({"enableRateLimit": True})
+        return await self._exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+
+    async def _fetch_paged(self, symbol: str, timeframe: str, since: Optional[int],
+                           limit: int) -> List[Sequence[float]]:
+        """Ca _fetch_ohlcv, dar imparte cererile mai mari decat limita exchange-ului"""
+        if limit <= self.page_size:
+            return await self._fetch_ohlcv(symbol, timeframe, since, limit)
+
+        seconds = timeframe_to_seconds(timeframe)
+        if since is None:
+            since = (candle_open_time(timeframe) - (limit - 1) * seconds) * 1000
+        rows: List[Sequence[float]] = []
+        while len(rows) < limit:
+            count = min(self.page_size, limit - len(rows))
+            page = await self._fetch_ohlcv(symbol, timeframe, since, count)
+            rows.extend(page)
+            if len(page) < count:
+                break
+            since = int(page[-1][0]) + seconds * 1000
+        return rows
+
+    async def refresh(self, symbol: str, timeframe: str, limit: Optional[int] = None) -> None:
+        """Aduce in store ultimele `limit` lumanari, descarcand doar ce lipseste"""
+        if timeframe in self.resample_timeframes:
+            await self._refresh_resampled(symbol, timeframe, limit)
+        else:
+            await self._refresh_direct(symbol, timeframe, limit)
+
+    async def _refresh_direct(self, symbol: str, timeframe: str, limit: Optional[int] = None) -> None:
+        key = (symbol.upper(), timeframe)
+        capacity = self.candle_store.capacity_for(timeframe)
+        limit = min(limit or self.default_limit, capacity)
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            now = time.time()
+            last = self.candle_store.last_timestamp(symbol, timeframe)
+            seconds = timeframe_to_seconds(timeframe)
+            missing = None if last is None else int((candle_open_time(timeframe, now) - last) // seconds)
+
+            if self._loaded_depth.get(key, 0) >= limit and missing is not None and missing < capacity:
+                if missing == 0 and now - self._refreshed_at.get(key, 0) < self.live_refresh_seconds:
+                    self.hits += 1
+                    return
+                # Doar de la ultima lumanare stocata (posibil inca deschisa) incolo
+                rows = await self._fetch_paged(symbol, timeframe, int(last * 1000), missing + 1)
+            else:
+                rows = await self._fetch_paged(symbol, timeframe, None, limit)
+                self.candle_store.buffer(symbol, timeframe).clear()
+                self._loaded_depth[key] = limit
+
+            self.fetches += 1
+            self.candles_fetched += len(rows)
+            self.candle_store.ingest(symbol, timeframe, rows)
+            self._refreshed_at[key] = now
+            self._archive_closed(symbol, timeframe)
+
+    async def _refresh_resampled(self, symbol: str, timeframe: str, limit: Optional[int] = None) -> None:
+        """Istoricul inchis se descarca o singura data; apoi bara curenta vine din fluxul de baza"""
+        key = (symbol.upper(), timeframe)
+        limit = min(limit or self.default_limit, self.candle_store.capacity_for(timeframe))
+        rollups = self._rollups.setdefault(key[0], {})
+
+        if timeframe not in rollups or self._loaded_depth.get(key, 0) < limit:
+            async with self._locks.setdefault(key, asyncio.Lock()):
+                if timeframe not in rollups or self._loaded_depth.get(key, 0) < limit:
+                    await self._bootstrap_rollup(symbol, timeframe, limit)
+
+        await self._refresh_direct(symbol, self.base_timeframe)
+        self._feed_rollups(symbol)
+
+    async def _bootstrap_rollup(self, symbol: str, timeframe: str, limit: int) -> None:
+        key = (symbol.upper(), timeframe)
+        current_open = candle_open_time(timeframe)
+
+        # Barele inchise direct de pe exchange; bara curenta este reconstruita din lumanarile de baza
+        rows = await self._fetch_paged(symbol, timeframe, None, limit + 1)
+        self.fetches += 1
+        self.candles_fetched += len(rows)
+        self.candle_store.buffer(symbol, timeframe).clear()
+        self.candle_store.ingest(symbol, timeframe, [row for row in rows if row[0] / 1000.0 < current_open])
+
+        base_seconds = timeframe_to_seconds(self.base_timeframe)
+        needed = int((time.time() - current_open) // base_seconds) + 1
+        base_depth = max(needed, self.default_limit, self._loaded_depth.get((key[0], self.base_timeframe), 0))
+        await self._refresh_direct(symbol, self.base_timeframe, base_depth)
+
+        self._rollups[key[0]][timeframe] = TimeframeRollup(timeframe, self.base_timeframe, start=current_open)
+        self._loaded_depth[key] = limit
+
+    def _feed_rollups(self, symbol: str) -> None:
+        """Aplica lumanarile de baza noi pe toate timeframe-urile derivate ale simbolului"""
+        rollups = self._rollups.get(symbol.upper())
+        if not rollups:
+            return
+
+        window = self.candle_store.buffer(symbol, self.base_timeframe).window()
+        timestamps = window[TIMESTAMP]
+        closed = int(np.searchsorted(timestamps, candle_open_time(self.base_timeframe)))
+        for timeframe, rollup in rollups.items():
+            buffer = self.candle_store.buffer(symbol, timeframe)
+            start = 0 if rollup.last_base is None else int(np.searchsorted(timestamps, rollup.last_base, side="right"))
+            for index in range(start, len(timestamps)):
+                for bar in rollup.update(window[:, index].tolist(), closed=index < closed):
+                    buffer.append(*bar)
+                    self.resampled_bars += 1
+            self._archive_closed(symbol, timeframe)
+
+    def _archive_closed(self, symbol: str, timeframe: str) -> None:
+        """Scrie pe disc lumanarile inchise din store care nu sunt inca in arhiva"""
+        if self.archive is None:
+            return
+
+        key = (symbol.upper(), timeframe)
+        if key not in self._archived:
+            self._archived[key] = self.archive.last_timestamp(symbol, timeframe)
+        archived = self._archived[key]
+
+        window = self.candle_store.buffer(symbol, timeframe).window()
+        timestamps = window[TIMESTAMP]
+        start = 0 if archived is None else int(np.searchsorted(timestamps, archived, side="right"))
+        end = int(np.searchsorted(timestamps, candle_open_time(timeframe)))
+        if start < end:
+            self.archive.append(symbol, timeframe, window[:, start:end])
+            self._archived[key] = float(timestamps[end - 1])
+
+    def get_history(self, symbol: str, timeframe: str, start: Optional[float] = None,
+                    end: Optional[float] = None) -> np.ndarray:
+        """Lumanari inchise din arhiva de pe disc (backtesting), fara cereri catre exchange"""
+        if self.archive is None:
+            raise RuntimeError("Candle archive is disabled (data.archive.enabled)")
+        return self.archive.read(symbol, timeframe, start, end)
+
+    async def get_candles(self, symbol: str, timeframe: str = "5m",
+                          limit: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Coloanele OHLCV ca view-uri NumPy fara copiere (valide pana la urmatorul refresh)"""
+        await self.refresh(symbol, timeframe, limit)
+        return self.candle_store.window(symbol, timeframe, limit or self.default_limit)
+
+    async def get_symbol_data(self, symbol: str, timeframe: str = "5m", indicators: Optional[List[str]] = None,
+                              limit: Optional[int] = None) -> Dict[str, Any]:
+        """Date OHLCV serializabile (liste) pentru API si pre-screen"""
+        candles = await self.get_candles(symbol, timeframe, limit)
+        data: Dict[str, Any] = {"symbol": symbol, "timeframe": timeframe}
+        data.update({name: column.tolist() for name, column in candles.items()})
+        data["price"] = data["close"][-1] if data["close"] else None
+        if indicators and set(indicators) - set(COLUMNS) - {"price"}:
+            data["indicators"] = self.get_indicators(symbol, timeframe)
+        return data
+
+    def get_indicators(self, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """Indicatorii pe ultima lumanare: lumanarile inchise noi avanseaza starea, cea live e doar un tick"""
+        key = (symbol.upper(), timeframe)
+        window = self.candle_store.buffer(symbol, timeframe).window()
+        if not window.shape[1]:
+            return {}
+        timestamps, closes = window[TIMESTAMP], window[CLOSE]
+        closed = int(np.searchsorted(timestamps, candle_open_time(timeframe)))
+
+        fed = self._indicators_fed.get(key)
+        start = 0 if fed is None else int(np.searchsorted(timestamps, fed, side="right"))
+        if fed is None or (start == 0 and timestamps[0] - fed > timeframe_to_seconds(timeframe)):
+            # Prima citire sau istoric pierdut intre refresh-uri: reconstruim starea
+            self.indicators.warm_up(symbol, timeframe, closes[:closed].tolist())
+        else:
+            for close in closes[start:closed].tolist():
+                self.indicators.update(symbol, timeframe, close)
+        if closed:
+            self._indicators_fed[key] = float(timestamps[closed - 1])
+
+        if closed < len(closes):
+            return self.indicators.update(symbol, timeframe, float(closes[-1]), closed=False)
+        return self.indicators.latest(symbol, timeframe)
+
+    async def get_current_price(self, symbol: str) -> Optional[float]:
+        """Ultimul pret, din lumanarea de 1m curenta"""
+        await self.refresh(symbol, "1m", 1)
+        window = self.candle_store.buffer(symbol, "1m").window(1)
+        return float(window[CLOSE, -1]) if window.shape[1] else None
+
+    async def close(self) -> None:
+        if self._exchange is not None:
+            try:
+                await self._exchange.close()
+            except Exception as e:
+                logger.error(f"Error closing exchange connection: {e}")
+            self._exchange = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "fetches": self.fetches,
+            "candles_fetched": self.candles_fetched,
+            "resampled_bars": self.resampled_bars,
+            "resampled_timeframes": sorted(self.resample_timeframes),
+            "candle_store": self.candle_store.get_metrics(),
+            "archive": self.archive.get_metrics() if self.archive else None,
+        }
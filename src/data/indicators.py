@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Technical Indicators
+RSI, MACD, Bollinger, EMA si SMA: formule batch, batch vectorizat pe simboluri si motor incremental O(1)
+"""
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Sumele pe fereastra sunt tinute exact, ca intregi in unitati de 2**-1074 (cel mai mic float):
+# adaugarea/scoaterea unei valori nu acumuleaza erori, deci rezultatul nu depinde de istoric
+_SCALE_BITS = 1074
+
+
+def _fixed(value: float) -> int:
+    numerator, denominator = float(value).as_integer_ratio()
+    return numerator << (_SCALE_BITS - denominator.bit_length() + 1)
+
+
+def _mean(total: int, count: int) -> float:
+    """Media exacta, rotunjita corect (impartirea int/int din Python este corect rotunjita)"""
+    return total / (count << _SCALE_BITS)
+
+
+def _pstdev(total: int, total_squares: int, count: int) -> float:
+    """Deviatia standard a populatiei din sumele exacte"""
+    variance = (count * total_squares - total * total) / (count * count << (2 * _SCALE_BITS))
+    return math.sqrt(variance)
+
+
+def _ema_step(previous: Optional[float], value: float, alpha: float) -> float:
+    # Seed cu prima valoare, ca in pre-screen
+    return value if previous is None else alpha * value + (1 - alpha) * previous
+
+
+def _wilder_step(previous: float, value: float, period: int) -> float:
+    return (previous * (period - 1) + value) / period
+
+
+def _rsi_value(avg_gain: float, avg_loss: float) -> float:
+    if avg_loss == 0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+class _EMA:
+    def __init__(self, period: int):
+        self.alpha = 2.0 / (period + 1)
+        self.value: Optional[float] = None
+
+    def update(self, value: float) -> float:
+        self.value = _ema_step(self.value, value, self.alpha)
+        return self.value
+
+    def peek(self, value: float) -> float:
+        return _ema_step(self.value, value, self.alpha)
+
+
+class _RollingWindow:
+    """Suma (si optional suma patratelor) pe ultimele `period` valori, exacte"""
+
+    def __init__(self, period: int, squares: bool = False):
+        self.period = period
+        self.squares = squares
+        self._values: Deque[int] = deque()
+        self.total = 0
+        self.total_squares = 0
+
+    def update(self, value: float) -> None:
+        fixed = _fixed(value)
+        self._values.append(fixed)
+        self.total += fixed
+        if self.squares:
+            self.total_squares += fixed * fixed
+        if len(self._values) > self.period:
+            oldest = self._values.popleft()
+            self.total -= oldest
+            if self.squares:
+                self.total_squares -= oldest * oldest
+
+    def peek(self, value: float) -> Tuple[int, int, int]:
+        """(suma, suma patratelor, numar) daca `value` ar fi adaugata"""
+        fixed = _fixed(value)
+        total, total_squares, count = self.total + fixed, self.total_squares, len(self._values) + 1
+        if self.squares:
+            total_squares += fixed * fixed
+        if count > self.period:
+            oldest = self._values[0]
+            total, count = total - oldest, self.period
+            if self.squares:
+                total_squares -= oldest * oldest
+        return total, total_squares, count
+
+    def snapshot(self) -> Tuple[int, int, int]:
+        return self.total, self.total_squares, len(self._values)
+
+
+class _RSI:
+    """RSI Wilder: media simpla a primelor `period` variatii, apoi smoothing"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.previous_close: Optional[float] = None
+        self.changes = 0
+        self._seed_gain = 0
+        self._seed_loss = 0
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+
+    def _advance(self, close: float) -> Tuple[int, int, Optional[float], Optional[float]]:
+        if self.previous_close is None:
+            return self._seed_gain, self._seed_loss, None, None
+        gain = max(close - self.previous_close, 0.0)
+        loss = max(self.previous_close - close, 0.0)
+        if self.avg_gain is not None:
+            return (self._seed_gain, self._seed_loss,
+                    _wilder_step(self.avg_gain, gain, self.period), _wilder_step(self.avg_loss, loss, self.period))
+
+        seed_gain, seed_loss = self._seed_gain + _fixed(gain), self._seed_loss + _fixed(loss)
+        if self.changes + 1 == self.period:
+            return seed_gain, seed_loss, _mean(seed_gain, self.period), _mean(seed_loss, self.period)
+        return seed_gain, seed_loss, None, None
+
+    def update(self, close: float) -> Optional[float]:
+        self._seed_gain, self._seed_loss, self.avg_gain, self.avg_loss = self._advance(close)
+        if self.previous_close is not None:
+            self.changes += 1
+        self.previous_close = close
+        return None if self.avg_gain is None else _rsi_value(self.avg_gain, self.avg_loss)
+
+    def peek(self, close: float) -> Optional[float]:
+        _, _, avg_gain, avg_loss = self._advance(close)
+        return None if avg_gain is None else _rsi_value(avg_gain, avg_loss)
+
+
+class IndicatorState:
+    """Starea incrementala a tuturor indicatorilor pentru o serie (simbol, timeframe)"""
+
+    def __init__(self, settings: "IndicatorSettings"):
+        self.settings = settings
+        self.candles = 0
+        self._rsi = _RSI(settings.rsi_period)
+        self._macd_fast = _EMA(settings.macd_fast)
+        self._macd_slow = _EMA(settings.macd_slow)
+        self._macd_signal = _EMA(settings.macd_signal)
+        self._ema_short = _EMA(settings.ema_short)
+        self._ema_long = _EMA(settings.ema_long)
+        self._bollinger = _RollingWindow(settings.bb_period, squares=True)
+        self._sma = _RollingWindow(settings.sma_period)
+        self.last: Dict[str, Optional[float]] = {}
+
+    def _snapshot(self, rsi: Optional[float], fast: float, slow: float, macd_signal: float, ema_short: float,
+                  ema_long: float, bollinger: Tuple[int, int, int],
+                  sma: Tuple[int, int, int]) -> Dict[str, Optional[float]]:
+        settings = self.settings
+        macd = fast - slow
+        snapshot: Dict[str, Optional[float]] = {
+            "rsi": rsi,
+            "macd": macd,
+            "macd_signal": macd_signal,
+            "macd_histogram": macd - macd_signal,
+            "ema_short": ema_short,
+            "ema_long": ema_long,
+            "bb_upper": None,
+            "bb_middle": None,
+            "bb_lower": None,
+            "sma": _mean(sma[0], sma[2]) if sma[2] == settings.sma_period else None,
+        }
+        total, total_squares, count = bollinger
+        if count == settings.bb_period:
+            middle = _mean(total, count)
+            deviation = settings.bb_std_dev * _pstdev(total, total_squares, count)
+            snapshot.update(bb_upper=middle + deviation, bb_middle=middle, bb_lower=middle - deviation)
+        return snapshot
+
+    def update(self, close: float) -> Dict[str, Optional[float]]:
+        """Lumanare inchisa: actualizeaza starea"""
+        rsi = self._rsi.update(close)
+        fast, slow = self._macd_fast.update(close), self._macd_slow.update(close)
+        macd_signal = self._macd_signal.update(fast - slow)
+        self._bollinger.update(close)
+        self._sma.update(close)
+        self.candles += 1
+        self.last = self._snapshot(
+            rsi, fast, slow, macd_signal,
+            self._ema_short.update(close), self._ema_long.update(close),
+            self._bollinger.snapshot(), self._sma.snapshot()
+        )
+        return self.last
+
+    def peek(self, price: float) -> Dict[str, Optional[float]]:
+        """Tick pe lumanarea live: valorile daca lumanarea s-ar inchide la `price`, fara a modifica starea"""
+        fast, slow = self._macd_fast.peek(price), self._macd_slow.peek(price)
+        return self._snapshot(
+            self._rsi.peek(price), fast, slow, self._macd_signal.peek(fast - slow),
+            self._ema_short.peek(price), self._ema_long.peek(price),
+            self._bollinger.peek(price), self._sma.peek(price)
+        )
+
+
+class IndicatorSettings:
+    """Perioadele indicatorilor din analysis.indicators"""
+
+    def __init__(self, indicators_config: Optional[Dict[str, Any]] = None):
+        indicators_config = indicators_config or {}
+        rsi = indicators_config.get("rsi", {})
+        macd = indicators_config.get("macd", {})
+        bollinger = indicators_config.get("bollinger_bands", {})
+        averages = indicators_config.get("moving_averages", {})
+
+        self.rsi_period = rsi.get("period", 14)
+        self.macd_fast = macd.get("fast", 12)
+        self.macd_slow = macd.get("slow", 26)
+        self.macd_signal = macd.get("signal", 9)
+        self.bb_period = bollinger.get("period", 20)
+        self.bb_std_dev = bollinger.get("std_dev", 2)
+        self.ema_short = averages.get("ema_short", 9)
+        self.ema_long = averages.get("ema_long", 21)
+        self.sma_period = averages.get("sma", 50)
+
+
+class TechnicalIndicators:
+    """Indicatori tehnici: formule batch pe serii si stare incrementala per (simbol, timeframe)"""
+
+    def __init__(self, indicators_config: Optional[Dict[str, Any]] = None):
+        self.settings = IndicatorSettings(indicators_config)
+        self._states: Dict[Tuple[str, str], IndicatorState] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "TechnicalIndicators":
+        return cls(config.get('analysis', {}).get('indicators', {}))
+
+    # -------------------------------------------------------------------------
+    # Formule batch (referinta pentru motorul incremental)
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def ema(values: Sequence[float], period: int) -> List[float]:
+        alpha = 2.0 / (period + 1)
+        series: List[float] = []
+        previous = None
+        for value in values:
+            previous = _ema_step(previous, value, alpha)
+            series.append(previous)
+        return series
+
+    @staticmethod
+    def sma(values: Sequence[float], period: int) -> Optional[float]:
+        """Media ultimelor `period` valori (suma exacta)"""
+        if len(values) < period:
+            return None
+        return _mean(sum(_fixed(value) for value in values[-period:]), period)
+
+    @staticmethod
+    def rsi(closes: Sequence[float], period: int = 14) -> Optional[float]:
+        """RSI cu smoothing Wilder"""
+        if len(closes) <= period:
+            return None
+        gains = [max(closes[i] - closes[i - 1], 0.0) for i in range(1, len(closes))]
+        losses = [max(closes[i - 1] - closes[i], 0.0) for i in range(1, len(closes))]
+        avg_gain = _mean(sum(_fixed(gain) for gain in gains[:period]), period)
+        avg_loss = _mean(sum(_fixed(loss) for loss in losses[:period]), period)
+        for gain, loss in zip(gains[period:], losses[period:]):
+            avg_gain = _wilder_step(avg_gain, gain, period)
+            avg_loss = _wilder_step(avg_loss, loss, period)
+        return _rsi_value(avg_gain, avg_loss)
+
+    @classmethod
+    def macd(cls, closes: Sequence[float], fast: int = 12, slow: int = 26,
+             signal: int = 9) -> Tuple[float, float, float]:
+        """(macd, signal, histogram) pe ultima lumanare"""
+        macd_line = [f - s for f, s in zip(cls.ema(closes, fast), cls.ema(closes, slow))]
+        signal_line = cls.ema(macd_line, signal)
+        return macd_line[-1], signal_line[-1], macd_line[-1] - signal_line[-1]
+
+    @staticmethod
+    def bollinger_bands(closes: Sequence[float], period: int = 20,
+                        std_dev: float = 2) -> Optional[Tuple[float, float, float]]:
+        """(upper, middle, lower) cu deviatia standard a populatiei"""
+        if len(closes) < period:
+            return None
+        window = [_fixed(close) for close in closes[-period:]]
+        total, total_squares = sum(window), sum(value * value for value in window)
+        middle = _mean(total, period)
+        deviation = std_dev * _pstdev(total, total_squares, period)
+        return middle + deviation, middle, middle - deviation
+
+    def compute(self, closes: Sequence[float]) -> Dict[str, Optional[float]]:
+        """Toti indicatorii pe ultima lumanare, recalculati pe toata seria"""
+        if not closes:
+            return {}
+        settings = self.settings
+        macd, macd_signal, histogram = self.macd(closes, settings.macd_fast, settings.macd_slow, settings.macd_signal)
+        bands = self.bollinger_bands(closes, settings.bb_period, settings.bb_std_dev) or (None, None, None)
+        return {
+            "rsi": self.rsi(closes, settings.rsi_period),
+            "macd": macd,
+            "macd_signal": macd_signal,
+            "macd_histogram": histogram,
+            "ema_short": self.ema(closes, settings.ema_short)[-1],
+            "ema_long": self.ema(closes, settings.ema_long)[-1],
+            "bb_upper": bands[0],
+            "bb_middle": bands[1],
+            "bb_lower": bands[2],
+            "sma": self.sma(closes, settings.sma_period),
+        }
+
+    # -------------------------------------------------------------------------
+    # Batch vectorizat pe mai multe simboluri
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def stack_histories(histories: Sequence[Sequence[float]],
+                        length: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Istorice de lungimi diferite -> matrice (simboluri x timp) aliniata la dreapta si masca"""
+        length = length or max((len(history) for history in histories), default=0)
+        closes = np.full((len(histories), length), np.nan)
+        mask = np.zeros((len(histories), length), dtype=bool)
+        for row, history in enumerate(histories):
+            tail = np.asarray(history[-length:], dtype=np.float64) if length else np.empty(0)
+            if len(tail):
+                closes[row, -len(tail):] = tail
+                mask[row, -len(tail):] = True
+        return closes, mask
+
+    def compute_batch(self, closes: np.ndarray, mask: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Toti indicatorii pe ultima coloana, pentru toate simbolurile intr-o singura trecere.
+
+        `closes` are forma (simboluri x timp), cu istoricul aliniat la dreapta; `mask` marcheaza
+        valorile valide (implicit cele diferite de NaN). Rezultatele sunt vectori per simbol,
+        NaN unde istoricul e insuficient; egale cu `compute` pana la rotunjirea sumelor.
+        """
+        settings = self.settings
+        closes = np.asarray(closes, dtype=np.float64)
+        mask = ~np.isnan(closes) if mask is None else np.asarray(mask, dtype=bool)
+        symbols, length = closes.shape
+
+        # EMA-urile (MACD fast/slow, scurt, lung) avanseaza impreuna: o singura operatie pe pas
+        alphas = np.array([2.0 / (period + 1) for period in (
+            settings.macd_fast, settings.macd_slow, settings.ema_short, settings.ema_long
+        )])[:, None]
+        signal_alpha = 2.0 / (settings.macd_signal + 1)
+        emas = np.full((len(alphas), symbols), np.nan)
+        macd_signal = np.full(symbols, np.nan)
+
+        rsi_period = settings.rsi_period
+        previous = np.full(symbols, np.nan)
+        changes = np.zeros(symbols, dtype=np.int64)
+        gain_sum, loss_sum = np.zeros(symbols), np.zeros(symbols)
+        avg_gain, avg_loss = np.full(symbols, np.nan), np.full(symbols, np.nan)
+
+        first = int(np.argmax(mask.any(axis=0))) if mask.any() else length
+        for t in range(first, length):
+            valid = mask[:, t]
+            price = closes[:, t]
+            started = ~np.isnan(emas[0])
+
+            stepped = np.where(started, alphas * price + (1 - alphas) * emas, price)
+            emas = np.where(valid, stepped, emas)
+            macd = emas[0] - emas[1]
+            stepped = np.where(started, signal_alpha * macd + (1 - signal_alpha) * macd_signal, macd)
+            macd_signal = np.where(valid, stepped, macd_signal)
+
+            # RSI: media simpla a primelor `period` variatii, apoi smoothing Wilder
+            has_change = valid & ~np.isnan(previous)
+            gain = np.where(has_change, np.maximum(price - previous, 0.0), 0.0)
+            loss = np.where(has_change, np.maximum(previous - price, 0.0), 0.0)
+            seeding = has_change & (changes < rsi_period)
+            gain_sum += np.where(seeding, gain, 0.0)
+            loss_sum += np.where(seeding, loss, 0.0)
+            smoothing = has_change & (changes >= rsi_period)
+            avg_gain = np.where(smoothing, (avg_gain * (rsi_period - 1) + gain) / rsi_period, avg_gain)
+            avg_loss = np.where(smoothing, (avg_loss * (rsi_period - 1) + loss) / rsi_period, avg_loss)
+            changes += has_change
+            seeded = seeding & (changes == rsi_period)
+            avg_gain = np.where(seeded, gain_sum / rsi_period, avg_gain)
+            avg_loss = np.where(seeded, loss_sum / rsi_period, avg_loss)
+            previous = np.where(valid, price, previous)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+        rsi[np.isnan(avg_gain)] = np.nan
+
+        def window_stats(period: int) -> Tuple[np.ndarray, np.ndarray]:
+            if period > length:
+                return np.full(symbols, np.nan), np.full(symbols, np.nan)
+            window = closes[:, length - period:]
+            complete = mask[:, length - period:].all(axis=1)
+            mean = np.where(complete, window.mean(axis=1), np.nan)
+            return mean, np.where(complete, window.std(axis=1), np.nan)
+
+        bb_middle, bb_std = window_stats(settings.bb_period)
+        sma, _ = window_stats(settings.sma_period)
+        macd = emas[0] - emas[1]
+        return {
+            "rsi": rsi,
+            "macd": macd,
+            "macd_signal": macd_signal,
+            "macd_histogram": macd - macd_signal,
+            "ema_short": emas[2],
+            "ema_long": emas[3],
+            "bb_upper": bb_middle + settings.bb_std_dev * bb_std,
+            "bb_middle": bb_middle,
+            "bb_lower": bb_middle - settings.bb_std_dev * bb_std,
+            "sma": sma,
+        }
+
+    # -------------------------------------------------------------------------
+    # Motor incremental
+    # -------------------------------------------------------------------------
+
+    def state(self, symbol: str, timeframe: str) -> IndicatorState:
+        key = (symbol.upper(), timeframe)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = IndicatorState(self.settings)
+        return state
+
+    def update(self, symbol: str, timeframe: str, close: float, closed: bool = True) -> Dict[str, Optional[float]]:
+        """O(1): `closed` = lumanarea s-a inchis (starea avanseaza); altfel tick pe lumanarea live"""
+        state = self.state(symbol, timeframe)
+        return state.update(close) if closed else state.peek(close)
+
+    def warm_up(self, symbol: str, timeframe: str, closes: Sequence[float]) -> Dict[str, Optional[float]]:
+        """Initializeaza starea din istoricul de lumanari inchise"""
+        self._states.pop((symbol.upper(), timeframe), None)
+        state = self.state(symbol, timeframe)
+        for close in closes:
+            state.update(close)
+        return state.last
+
+    def latest(self, symbol: str, timeframe: str) -> Dict[str, Optional[float]]:
+        state = self._states.get((symbol.upper(), timeframe))
+        return state.last if state else {}
+
+    def reset(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> None:
+        if symbol is None:
+            self._states.clear()
+            return
+        self._states.pop((symbol.upper(), timeframe), None)
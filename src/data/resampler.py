@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Timeframe Resampler
+Agregarea incrementala a lumanarilor de baza (1m) in timeframe-uri superioare
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from .timeframes import candle_open_time, timeframe_to_seconds
+
+Bar = Tuple[float, float, float, float, float, float]  # (open time, open, high, low, close, volume)
+
+
+def _merge(bar: Optional[List[float]], open_time: float, candle: Sequence[float]) -> List[float]:
+    _, open_, high, low, close, volume = candle
+    if bar is None:
+        return [open_time, open_, high, low, close, volume]
+    return [bar[0], bar[1], max(bar[2], high), min(bar[3], low), close, bar[5] + volume]
+
+
+class TimeframeRollup:
+    """Bara curenta a unui timeframe superior, actualizata O(1) la fiecare lumanare de baza.
+
+    Bara se inchide odata cu ultima lumanare de baza din interval (sau la prima lumanare
+    dintr-un interval nou, daca lipsesc lumanari). Lumanarea de baza inca deschisa este
+    aplicata doar pe o copie, ca tick-urile repetate sa nu dubleze volumul.
+    """
+
+    def __init__(self, timeframe: str, base_timeframe: str = "1m", start: Optional[float] = None):
+        self.timeframe = timeframe
+        self.base_timeframe = base_timeframe
+        self.seconds = timeframe_to_seconds(timeframe)
+        self.base_seconds = timeframe_to_seconds(base_timeframe)
+        if self.seconds <= self.base_seconds or self.seconds % self.base_seconds:
+            raise ValueError(f"Cannot resample {base_timeframe} into {timeframe}")
+
+        self.start = start
+        self.last_base: Optional[float] = None  # ultima lumanare de baza inchisa, deja agregata
+        self._bar: Optional[List[float]] = None
+        self.closed_bars = 0
+
+    def update(self, candle: Sequence[float], closed: bool = True) -> List[Bar]:
+        """Aplica o lumanare de baza; returneaza barele de scris in store (cele inchise primele)"""
+        timestamp = candle[0]
+        if (self.start is not None and timestamp < self.start) or \
+                (self.last_base is not None and timestamp <= self.last_base):
+            return []
+
+        open_time = candle_open_time(self.timeframe, timestamp)
+        bars: List[Bar] = []
+        if self._bar is not None and open_time != self._bar[0]:
+            # Lumanari de baza lipsa la finalul intervalului anterior
+            bars.append(tuple(self._bar))
+            self._bar = None
+            self.closed_bars += 1
+
+        if not closed:
+            bars.append(tuple(_merge(self._bar, open_time, candle)))
+            return bars
+
+        self.last_base = timestamp
+        self._bar = _merge(self._bar, open_time, candle)
+        bars.append(tuple(self._bar))
+        if timestamp + self.base_seconds >= open_time + self.seconds:
+            # Ultima lumanare de baza din interval: bara se inchide exact pe granita
+            self._bar = None
+            self.closed_bars += 1
+        return bars
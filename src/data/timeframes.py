@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Crypto MCP Assistant - Timeframes
+Conversii intre timeframe-uri si aliniere la inchiderea lumanarilor (UTC)
+"""
+
+import time
+from typing import Optional
+
+# Durata fiecarui timeframe in secunde
+TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "3m": 180,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "2h": 7200,
+    "4h": 14400,
+    "6h": 21600,
+    "12h": 43200,
+    "1d": 86400,
+    "1w": 604800,
+}
+
+
+def timeframe_to_seconds(timeframe: str) -> int:
+    """Returneaza durata unui timeframe in secunde"""
+    try:
+        return TIMEFRAME_SECONDS[timeframe]
+    except KeyError:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+
+def candle_open_time(timeframe: str, timestamp: Optional[float] = None) -> int:
+    """Timestamp-ul de deschidere al lumanarii care contine `timestamp`"""
+    seconds = timeframe_to_seconds(timeframe)
+    now = time.time() if timestamp is None else timestamp
+    if timeframe == "1w":
+        # Lumanarile saptamanale incep lunea (epoch-ul Unix cade joi)
+        offset = 4 * 86400
+        return int((now - offset) // seconds * seconds + offset)
+    return int(now // seconds * seconds)
+
+
+def candle_close_time(timeframe: str, timestamp: Optional[float] = None) -> int:
+    """Timestamp-ul la care se inchide lumanarea curenta"""
+    return candle_open_time(timeframe, timestamp) + timeframe_to_seconds(timeframe)
@@ -0,0 +1,57 @@
+"""
+CryptoAIAgent: admiterea in scheduler inainte de checkout-ul din pool
+"""
+
+import asyncio
+
+import pytest
+
+for module in ("dotenv", "loguru", "yaml", "numpy"):
+    pytest.importorskip(module)
+
+from src.core.agent_pool import MCPAgentPool
+from src.core.ai_agent import CryptoAIAgent
+from src.core.llm_scheduler import LLMCapacityScheduler
+from src.core.model_router import DEEP
+
+
+class BlockingAgent:
+    def __init__(self, release: asyncio.Event):
+        self.release = release
+
+    async def run(self, prompt):
+        if "scan" in prompt:
+            await self.release.wait()
+        return f"answer to {prompt}"
+
+
+def test_interactive_request_is_not_blocked_by_scans_holding_agents(monkeypatch):
+    async def main():
+        agent = CryptoAIAgent()
+        release = asyncio.Event()
+
+        async def ready_components(*names):
+            return []
+
+        monkeypatch.setattr(agent, "ready_components", ready_components)
+        agent.llm_scheduler = LLMCapacityScheduler(max_concurrent=2, reserved_interactive=1)
+        agent.agent_pools = {DEEP: MCPAgentPool(factory=lambda: BlockingAgent(release), size=2)}
+
+        scans = [asyncio.create_task(agent._run_scan(f"scan {index}", DEEP)) for index in range(4)]
+        await asyncio.sleep(0.05)
+
+        # Un singur slot pentru scanari: celelalte asteapta admiterea fara sa tina un agent
+        assert agent.agent_pools[DEEP].get_metrics()["in_use"] == 1
+        answer = await asyncio.wait_for(agent._run_manual_analysis("chat"), 1.0)
+
+        release.set()
+        await asyncio.gather(*scans)
+        return answer
+
+    assert asyncio.run(main()) == "answer to chat"
+
+
+def test_pool_has_an_agent_per_admission_slot():
+    agent = CryptoAIAgent()
+    for pool in agent.agent_pools.values():
+        assert pool.size >= agent.llm_scheduler.max_concurrent
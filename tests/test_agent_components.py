@@ -0,0 +1,116 @@
+"""
+CryptoAIAgent: etapele async asteapta componentele lazy fara sa blocheze event loop-ul
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+
+for module in ("dotenv", "loguru", "yaml", "numpy"):
+    pytest.importorskip(module)
+
+from src.core.ai_agent import CryptoAIAgent, TradingSignal
+from src.core.lazy import LazyComponent
+from src.core.model_router import FAST
+
+
+class RiskManager:
+    async def evaluate_signal_risk(self, signal):
+        return {"approved": True, "risk_score": 0.3}
+
+    async def calculate_position_size(self, symbol, entry_price, stop_loss):
+        return 250.0
+
+
+class Notifier:
+    def __init__(self):
+        self.sent = []
+
+    async def send_trading_update(self, signals, market_overview):
+        self.sent.append([signal.symbol for signal in signals])
+
+
+def make_signal():
+    return TradingSignal(symbol="BTCUSDT", action="BUY", confidence=0.8, entry_price=100.0, stop_loss=95.0,
+                         take_profit=110.0, timeframe="5m", reasoning="", timestamp=datetime.now(),
+                         risk_score=0.0, position_size_usd=0.0)
+
+
+def slow_component(agent, name, instance):
+    """Inlocuieste componenta cu una al carei factory blocheaza un thread pana la `release`"""
+    release = threading.Event()
+
+    def factory():
+        release.wait(5)
+        return instance
+
+    agent._components[name] = LazyComponent(name, factory)
+    return release
+
+
+async def ticks_while(coroutine, release):
+    """Numarul de tick-uri ale loop-ului cat timp componenta se initializeaza"""
+    task = asyncio.create_task(coroutine)
+    ticks = 0
+    for _ in range(5):
+        await asyncio.sleep(0.01)
+        ticks += 1
+    assert not task.done()
+    release.set()
+    return ticks, await asyncio.wait_for(task, 1.0)
+
+
+def test_evaluate_signal_awaits_risk_manager():
+    async def main():
+        agent = CryptoAIAgent()
+        release = slow_component(agent, "risk_manager", RiskManager())
+        return await ticks_while(agent._evaluate_signal(make_signal()), release)
+
+    ticks, signal = asyncio.run(main())
+    assert ticks == 5
+    assert signal.risk_score == 0.3
+    assert signal.position_size_usd > 0
+
+
+def test_notifications_await_notifier():
+    notifier = Notifier()
+
+    async def main():
+        agent = CryptoAIAgent()
+        release = slow_component(agent, "discord_notifier", notifier)
+        return await ticks_while(agent._send_notifications([make_signal()], {}), release)
+
+    ticks, _ = asyncio.run(main())
+    assert ticks == 5
+    assert notifier.sent == [["BTCUSDT"]]
+
+
+def test_pre_screen_escalates_everything_when_data_fetcher_fails():
+    def broken():
+        raise RuntimeError("exchange unreachable")
+
+    async def main():
+        agent = CryptoAIAgent()
+        agent.config.setdefault('analysis', {})['pre_screen'] = {'enabled': True, 'timeframe': '5m'}
+        agent._components["data_fetcher"] = LazyComponent("data_fetcher", broken)
+        return await agent._pre_screen_symbols(["BTCUSDT", "ETHUSDT"])
+
+    assert asyncio.run(main()) == ["BTCUSDT", "ETHUSDT"]
+
+
+def test_batch_split_awaits_fast_llm():
+    class LLM:
+        max_tokens = 600
+
+    async def main():
+        agent = CryptoAIAgent()
+        agent.config.setdefault('analysis', {})['batch_scan'] = {'max_symbols_per_batch': 10,
+                                                                 'output_tokens_per_symbol': 150}
+        release = slow_component(agent, agent._llm_component(FAST), LLM())
+        return await ticks_while(agent._split_symbol_batches([f"S{i}" for i in range(10)]), release)
+
+    ticks, batches = asyncio.run(main())
+    assert ticks == 5
+    assert [len(batch) for batch in batches] == [4, 4, 2]
@@ -0,0 +1,151 @@
+"""
+MCPAgentPool: checkout/return, asteptare cand pool-ul e plin si izolarea istoricului intre request-uri
+"""
+
+import asyncio
+import itertools
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from src.core.agent_pool import MCPAgentPool
+
+
+class FakeAgent:
+    ids = itertools.count()
+
+    def __init__(self, broken_reset=False):
+        self.id = next(self.ids)
+        self.history = []
+        self.initialized = False
+        self.broken_reset = broken_reset
+
+    async def initialize(self):
+        self.initialized = True
+
+    def clear_conversation_history(self):
+        if self.broken_reset:
+            raise RuntimeError("memory locked")
+        self.history.clear()
+
+
+def test_agents_are_created_lazily_and_reused():
+    async def main():
+        pool = MCPAgentPool(factory=FakeAgent, size=2)
+        async with pool.agent() as first:
+            assert first.initialized
+        async with pool.agent() as second:
+            pass
+        return first, second, pool.get_metrics()
+
+    first, second, metrics = asyncio.run(main())
+    assert first is second
+    assert (metrics["created"], metrics["idle"], metrics["in_use"], metrics["checkouts"]) == (1, 1, 0, 2)
+
+
+def test_checkout_waits_for_a_returned_agent_when_full():
+    async def main():
+        pool = MCPAgentPool(factory=FakeAgent, size=1)
+        held = await pool.checkout()
+        waiter = asyncio.create_task(pool.checkout())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        assert pool.get_metrics()["in_use"] == 1
+
+        await pool.release(held)
+        assert await asyncio.wait_for(waiter, 1.0) is held
+        return pool.get_metrics()
+
+    metrics = asyncio.run(main())
+    assert metrics["created"] == 1
+    assert metrics["wait_time_max_ms"] >= 10
+
+
+def test_waiters_are_served_in_order():
+    async def main():
+        pool = MCPAgentPool(factory=FakeAgent, size=1)
+        held = await pool.checkout()
+        order = []
+
+        async def use(name):
+            async with pool.agent():
+                order.append(name)
+
+        tasks = [asyncio.create_task(use(name)) for name in "abc"]
+        await asyncio.sleep(0)
+        await pool.release(held)
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(main()) == ["a", "b", "c"]
+
+
+def test_history_is_cleared_on_return():
+    async def main():
+        pool = MCPAgentPool(factory=FakeAgent, size=1)
+        async with pool.agent() as agent:
+            agent.history.append("BTCUSDT secret")
+        async with pool.agent() as again:
+            return agent, again
+
+    agent, again = asyncio.run(main())
+    assert again is agent
+    assert again.history == []
+
+
+def test_agent_is_replaced_when_history_cannot_be_cleared():
+    created = []
+
+    def factory():
+        agent = FakeAgent(broken_reset=not created)
+        created.append(agent)
+        return agent
+
+    async def main():
+        pool = MCPAgentPool(factory=factory, size=1)
+        async with pool.agent() as broken:
+            broken.history.append("leaked")
+        async with pool.agent() as replacement:
+            return broken, replacement, pool.get_metrics()
+
+    broken, replacement, metrics = asyncio.run(main())
+    assert replacement is not broken
+    assert replacement.history == []
+    assert metrics["created"] == 1
+
+
+def test_failed_creation_does_not_consume_capacity():
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("mcp server unavailable")
+        return FakeAgent()
+
+    async def main():
+        pool = MCPAgentPool(factory=factory, size=1)
+        with pytest.raises(RuntimeError):
+            await pool.checkout()
+        agent = await asyncio.wait_for(pool.checkout(), 1.0)
+        return agent, pool.get_metrics()
+
+    agent, metrics = asyncio.run(main())
+    assert isinstance(agent, FakeAgent)
+    assert metrics["created"] == 1
+
+
+def test_warm_up_precreates_agents():
+    async def main():
+        pool = MCPAgentPool(factory=FakeAgent, size=3)
+        await pool.warm_up(2)
+        return pool.get_metrics()
+
+    metrics = asyncio.run(main())
+    assert (metrics["created"], metrics["idle"]) == (2, 2)
+
+
+def test_size_must_be_positive():
+    with pytest.raises(ValueError):
+        MCPAgentPool(factory=FakeAgent, size=0)
@@ -0,0 +1,55 @@
+"""
+CryptoAIAgent: selectia simbolurilor de scanat (evenimente de piata vs heartbeat) si raspunsurile batch
+"""
+
+import asyncio
+
+import pytest
+
+for module in ("dotenv", "loguru", "yaml", "numpy"):
+    pytest.importorskip(module)
+
+from src.core.ai_agent import CryptoAIAgent
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    agent = CryptoAIAgent()
+    agent.config.setdefault('analysis', {}).update(multi_timeframe={'enabled': False}, batch_scan={'enabled': False})
+    agent.screened = []
+
+    async def pre_screen(symbols):
+        agent.screened.append(list(symbols))
+        return symbols[:1]
+
+    async def scan_symbol(mcp_agent, symbol, timeframes=None, tier=None):
+        return {"symbol": symbol}
+
+    monkeypatch.setattr(agent, "_pre_screen_symbols", pre_screen)
+    monkeypatch.setattr(agent, "_scan_symbol", scan_symbol)
+    monkeypatch.setattr(agent, "_get_priority_symbols", lambda: ["BTCUSDT", "ETHUSDT", "SOLUSDT"])
+    return agent
+
+
+def scanned(agent, symbols):
+    async def main():
+        return sorted([opportunity["symbol"] async for opportunity in agent._iter_opportunities(None, symbols)])
+    return asyncio.run(main())
+
+
+def test_event_triggered_symbols_skip_pre_screen(agent):
+    assert scanned(agent, ["SOLUSDT", "ETHUSDT"]) == ["ETHUSDT", "SOLUSDT"]
+    assert agent.screened == []
+
+
+def test_heartbeat_scan_is_pre_screened(agent):
+    assert scanned(agent, None) == ["BTCUSDT"]
+    assert agent.screened == [["BTCUSDT", "ETHUSDT", "SOLUSDT"]]
+
+
+def test_batch_response_confidence_scales(agent):
+    response = ('[{"symbol": "BTCUSDT", "action": "BUY", "confidence": 7}, '
+                '{"symbol": "ETHUSDT", "action": "SELL", "confidence": 85}, '
+                '{"symbol": "SOLUSDT", "action": "HOLD", "confidence": 0.4}]')
+    parsed = agent._parse_batch_response(response, ["BTCUSDT", "ETHUSDT", "SOLUSDT"])
+    assert [opportunity["confidence"] for opportunity in parsed] == pytest.approx([0.7, 0.85, 0.4])
@@ -0,0 +1,76 @@
+"""
+cached_analysis: raspunsuri reutilizate in lumanarea curenta; timeframe-urile necunoscute ruleaza necache-uite
+"""
+
+import asyncio
+
+import pytest
+
+for module in ("dotenv", "loguru", "yaml", "numpy"):
+    pytest.importorskip(module)
+
+from src.core.ai_agent import CryptoAIAgent
+from src.core.model_router import DEEP, FAST, ModelRouter, ModelTier
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    agent = CryptoAIAgent()
+    calls = []
+
+    async def run_manual_analysis(query, memory=None, tier=DEEP):
+        calls.append(query)
+        return f"analysis {len(calls)}"
+
+    monkeypatch.setattr(agent, "_run_manual_analysis", run_manual_analysis)
+    agent.calls = calls
+    return agent
+
+
+def test_same_candle_is_served_from_cache(agent):
+    async def main():
+        first = await agent.cached_analysis("q", "analyze_symbol", "BTCUSDT", "1h")
+        second = await agent.cached_analysis("q", "analyze_symbol", "btcusdt", "1h")
+        return first, second
+
+    assert asyncio.run(main()) == ("analysis 1", "analysis 1")
+    assert len(agent.calls) == 1
+
+
+@pytest.mark.parametrize("timeframe", ["7m", None])
+def test_unsupported_timeframe_runs_uncached(agent, timeframe):
+    async def main():
+        return [await agent.cached_analysis("q", "analyze_symbol", "BTCUSDT", timeframe) for _ in range(2)]
+
+    assert asyncio.run(main()) == ["analysis 1", "analysis 2"]
+    assert agent.response_cache.get_metrics()["entries"] == 0
+
+
+@pytest.fixture
+def routed_agent(agent, monkeypatch):
+    agent.model_router = ModelRouter({FAST: ModelTier(FAST, "small"), DEEP: ModelTier(DEEP, "large")})
+    tiers = []
+
+    async def run_manual_analysis(query, memory=None, tier=DEEP):
+        tiers.append(tier)
+        # Raspunsul modelului rapid e la limita benzii de escaladare
+        return "BUY confidence 0.6" if tier == FAST else "BUY confidence 0.9"
+
+    monkeypatch.setattr(agent, "_run_manual_analysis", run_manual_analysis)
+    agent.tiers = tiers
+    return agent
+
+
+def test_signal_request_escalates_borderline_fast_answer(routed_agent):
+    response = asyncio.run(routed_agent.cached_analysis("q", "generate_signal", "BTCUSDT", "5m",
+                                                        tier=FAST, escalate=True))
+    assert response == "BUY confidence 0.9"
+    assert routed_agent.tiers == [FAST, DEEP]
+    assert routed_agent.model_router.escalations == 1
+
+
+def test_informational_fast_request_is_not_escalated(routed_agent):
+    response = asyncio.run(routed_agent.cached_analysis("q", "market_overview", "MARKET", "5m", tier=FAST))
+    assert response == "BUY confidence 0.6"
+    assert routed_agent.tiers == [FAST]
+    assert routed_agent.model_router.escalations == 0
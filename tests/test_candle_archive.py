@@ -0,0 +1,99 @@
+"""
+CandleArchive: round-trip pe disc, append idempotent, citiri de interval si recuperarea dupa scrieri partiale
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("loguru")
+
+from src.data.candle_archive import HEADER_SIZE, MAGIC, RECORD_DTYPE, CandleArchive
+
+START = 1_704_067_200
+
+
+def make_records(count, first=0):
+    records = np.empty(count, dtype=RECORD_DTYPE)
+    minutes = np.arange(first, first + count)
+    records["timestamp"] = START + minutes * 60
+    records["open"] = 100.0 + minutes
+    records["high"] = records["open"] + 2
+    records["low"] = records["open"] - 2
+    records["close"] = records["open"] + 1
+    records["volume"] = minutes % 7 + 0.5
+    return records
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return CandleArchive(str(tmp_path), index_stride=16)
+
+
+def test_round_trip(archive, tmp_path):
+    records = make_records(100)
+    assert archive.append("btcusdt", "1m", records) == 100
+
+    # Alta instanta (ca un alt proces) citeste acelasi fisier
+    reader = CandleArchive(str(tmp_path), index_stride=16)
+    np.testing.assert_array_equal(reader.read("BTCUSDT", "1m"), records)
+    assert reader.last_timestamp("BTCUSDT", "1m") == START + 99 * 60
+
+    path = tmp_path / "BTCUSDT" / "1m.candles"
+    assert path.stat().st_size == HEADER_SIZE + 100 * RECORD_DTYPE.itemsize
+    assert path.read_bytes()[:len(MAGIC)] == MAGIC
+
+
+def test_append_skips_candles_already_archived(archive):
+    archive.append("BTCUSDT", "1m", make_records(50))
+    assert archive.append("BTCUSDT", "1m", make_records(30, first=40)) == 20
+    assert archive.append("BTCUSDT", "1m", make_records(10, first=10)) == 0
+    np.testing.assert_array_equal(archive.read("BTCUSDT", "1m"), make_records(70))
+
+
+def test_accepts_candle_store_columns(archive):
+    records = make_records(5)
+    columns = np.vstack([records[name].astype(np.float64) for name in RECORD_DTYPE.names])
+    assert archive.append("BTCUSDT", "5m", columns) == 5
+    np.testing.assert_array_equal(archive.read("BTCUSDT", "5m"), records)
+
+
+def test_range_read_across_index_blocks(archive):
+    records = make_records(200)
+    archive.append("BTCUSDT", "1m", records)
+
+    for start, end in ((0, 200), (15, 17), (16, 48), (33, 34), (190, 250)):
+        view = archive.read("BTCUSDT", "1m", START + start * 60, START + end * 60)
+        np.testing.assert_array_equal(view, records[start:min(end, 200)])
+    assert len(archive.read("BTCUSDT", "1m", START + 30 * 60 + 1, START + 31 * 60)) == 0
+
+
+def test_reader_sees_later_appends(archive, tmp_path):
+    reader = CandleArchive(str(tmp_path), index_stride=16)
+    assert len(reader.read("BTCUSDT", "1m")) == 0
+
+    archive.append("BTCUSDT", "1m", make_records(20))
+    assert len(reader.read("BTCUSDT", "1m")) == 20
+    archive.append("BTCUSDT", "1m", make_records(20, first=20))
+    np.testing.assert_array_equal(reader.read("BTCUSDT", "1m", START + 35 * 60), make_records(5, first=35))
+
+
+def test_torn_tail_is_hidden_then_truncated(archive, tmp_path):
+    archive.append("BTCUSDT", "1m", make_records(10))
+    path = tmp_path / "BTCUSDT" / "1m.candles"
+    with open(path, "ab") as f:
+        f.write(make_records(1, first=10).tobytes()[:20])
+
+    reader = CandleArchive(str(tmp_path))
+    assert len(reader.read("BTCUSDT", "1m")) == 10
+
+    assert archive.append("BTCUSDT", "1m", make_records(5, first=10)) == 5
+    np.testing.assert_array_equal(reader.read("BTCUSDT", "1m"), make_records(15))
+
+
+def test_foreign_file_is_not_overwritten(archive, tmp_path):
+    path = tmp_path / "BTCUSDT" / "1m.candles"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not an archive".ljust(HEADER_SIZE + 10, b"x"))
+
+    assert archive.append("BTCUSDT", "1m", make_records(3)) == 0
+    assert path.read_bytes().startswith(b"not an archive")
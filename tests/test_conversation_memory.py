@@ -0,0 +1,108 @@
+"""
+BoundedConversationMemory si SessionMemoryStore: bugetul de tokeni (window/summary), TTL si limita de sesiuni
+"""
+
+import pytest
+
+from src.core import conversation_memory
+from src.core.conversation_memory import (SUMMARY, BoundedConversationMemory, PromptTokenMetrics,
+                                          SessionMemoryStore, estimate_tokens)
+
+
+def exchange(memory, index, size=400):
+    memory.add_exchange(f"q{index} " + "x" * size, f"a{index} " + "y" * size)
+
+
+def test_window_mode_keeps_recent_messages_within_budget():
+    memory = BoundedConversationMemory(max_tokens=300)
+    for index in range(20):
+        exchange(memory, index)
+        assert memory.tokens <= 300
+
+    prompt = memory.build_prompt("intrebare")
+    assert "q19" in prompt and "a19" in prompt
+    assert "q0 " not in prompt
+    assert "Rezumatul" not in prompt
+    assert prompt.endswith("Intrebarea curenta:\nintrebare")
+
+
+def test_summary_mode_is_bounded():
+    memory = BoundedConversationMemory(max_tokens=300, mode=SUMMARY, summary_tokens=100,
+                                       summary_chars_per_message=80)
+    for index in range(50):
+        exchange(memory, index)
+        assert memory.tokens <= 300 + 100
+
+    prompt = memory.build_prompt("intrebare")
+    summary = prompt.split("\n\n")[0]
+    assert summary.startswith("Rezumatul conversatiei anterioare:")
+    # Rezumatul pastreaza cele mai recente mesaje eliminate, trunchiate
+    assert "q0 " not in summary
+    assert all(len(line) <= len("assistant: ") + 80 for line in summary.splitlines()[1:])
+    assert estimate_tokens("\n".join(summary.splitlines()[1:])) <= 100
+
+
+def test_empty_memory_returns_query_unchanged():
+    memory = BoundedConversationMemory()
+    assert memory.build_prompt("BTCUSDT?") == "BTCUSDT?"
+    exchange(memory, 1, size=10)
+    memory.clear()
+    assert memory.tokens == 0
+    assert memory.build_prompt("BTCUSDT?") == "BTCUSDT?"
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        BoundedConversationMemory(mode="vector")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(conversation_memory.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_sessions_are_isolated(clock):
+    store = SessionMemoryStore()
+    store.get("alice").add_exchange("BTC?", "BUY")
+    assert store.get("bob").build_prompt("ETH?") == "ETH?"
+    assert store.get("alice") is store.get("alice")
+    assert len(store) == 2
+
+
+def test_idle_sessions_expire(clock):
+    store = SessionMemoryStore(session_ttl=60)
+    store.get("old").add_exchange("q", "a")
+    clock[0] += 30
+    store.get("recent").add_exchange("q", "a")
+    clock[0] += 40
+
+    store.get("new")
+    assert len(store) == 2
+    # Sesiunea expirata incepe de la zero
+    assert store.get("old").tokens == 0
+
+
+def test_session_cap_drops_least_recently_used(clock):
+    store = SessionMemoryStore(max_sessions=2)
+    first = store.get("a")
+    store.get("b")
+    store.get("a")  # "b" devine cea mai veche
+    store.get("c")
+    assert len(store) == 2
+    assert store.get("a") is first
+
+
+def test_memory_kwargs_are_applied(clock):
+    store = SessionMemoryStore(max_tokens=50, mode=SUMMARY, summary_tokens=10)
+    memory = store.get("s")
+    assert (memory.max_tokens, memory.mode, memory.summary_tokens) == (50, SUMMARY, 10)
+
+
+def test_prompt_token_metrics():
+    metrics = PromptTokenMetrics()
+    metrics.record("x" * 400)
+    metrics.record("x" * 800)
+    assert metrics.get_metrics() == {"calls": 2, "avg_prompt_tokens": 150.0,
+                                     "max_prompt_tokens": 200, "last_prompt_tokens": 200}
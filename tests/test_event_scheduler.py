@@ -0,0 +1,87 @@
+"""
+MarketEventScheduler: momentum, volum proiectat pe progresul lumanarii live si baseline din lumanari inchise
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.event_scheduler import MarketEventScheduler
+
+T = 1_000_000.0  # dupa cooldown-ul initial
+
+
+@pytest.fixture
+def scheduler():
+    return MarketEventScheduler(volume_multiplier=1.5, min_momentum_pct=0.5, momentum_window=60,
+                                cooldown=60, volume_smoothing=0.5, min_candle_progress=0.2)
+
+
+def test_momentum_trigger_and_cooldown(scheduler):
+    assert scheduler.on_tick("BTCUSDT", 100.0, timestamp=T) is None
+    assert scheduler.on_tick("BTCUSDT", 100.6, timestamp=T + 10) == "momentum +0.60%"
+    # Referinta e resetata la declansare; in cooldown nu se mai declanseaza
+    assert scheduler.on_tick("BTCUSDT", 101.5, timestamp=T + 20) is None
+    assert scheduler.on_tick("BTCUSDT", 102.5, timestamp=T + 75) is not None
+
+
+def test_momentum_window_drops_old_prices(scheduler):
+    scheduler.on_tick("BTCUSDT", 100.0, timestamp=T)
+    assert scheduler.on_tick("BTCUSDT", 100.3, timestamp=T + 50) is None
+    # Pretul de la t=0 a iesit din fereastra: referinta devine 100.3
+    assert scheduler.on_tick("BTCUSDT", 100.6, timestamp=T + 70) is None
+
+
+def test_baseline_updated_once_per_closed_candle(scheduler):
+    for tick in range(5):
+        scheduler.on_tick("BTCUSDT", 100.0, volume=1.0, timestamp=tick, closed_volume=10.0,
+                          candle_open=0, candle_progress=0.5)
+    state = scheduler._states["BTCUSDT"]
+    assert state.volume_baseline == 10.0
+
+    scheduler.on_tick("BTCUSDT", 100.0, volume=1.0, timestamp=T + 6, closed_volume=20.0,
+                      candle_open=60, candle_progress=0.1)
+    assert state.volume_baseline == 15.0
+
+    # Volumele partiale ale lumanarii live nu intra in baseline
+    scheduler.on_tick("BTCUSDT", 100.0, volume=3.0, timestamp=T + 7, closed_volume=20.0,
+                      candle_open=60, candle_progress=0.5)
+    assert state.volume_baseline == 15.0
+
+
+def test_partial_volume_is_projected_by_candle_progress(scheduler):
+    scheduler.on_tick("BTCUSDT", 100.0, timestamp=T, closed_volume=10.0, candle_open=0)
+
+    # La jumatatea lumanarii, 6 -> 12 proiectat: sub 1.5x
+    assert scheduler.on_tick("BTCUSDT", 100.0, volume=6.0, timestamp=T + 1, candle_progress=0.5) is None
+    # 8 la jumatate -> 16 proiectat: peste 15
+    assert scheduler.on_tick("BTCUSDT", 100.0, volume=8.0, timestamp=T + 2, candle_progress=0.5) == "volume 1.6x"
+
+
+def test_projection_is_capped_early_in_the_candle(scheduler):
+    scheduler.on_tick("BTCUSDT", 100.0, timestamp=T, closed_volume=10.0, candle_open=0)
+    # Progres 1%: proiectia foloseste min_candle_progress (0.2), nu x100
+    assert scheduler.on_tick("BTCUSDT", 100.0, volume=2.0, timestamp=T + 1, candle_progress=0.01) is None
+    assert scheduler.on_tick("BTCUSDT", 100.0, volume=3.0, timestamp=T + 2, candle_progress=0.01) == "volume 1.5x"
+
+
+def test_flat_feed_never_triggers(scheduler):
+    triggers = 0
+    for second in range(0, 3600, 5):
+        candle_open = second // 60 * 60
+        progress = (second - candle_open) / 60
+        if scheduler.on_tick("BTCUSDT", 100.0, volume=10.0 * max(progress, 0.01), timestamp=T + second,
+                             closed_volume=10.0, candle_open=candle_open - 60, candle_progress=progress):
+            triggers += 1
+    assert triggers == 0
+
+
+def test_wait_returns_triggered_symbols_or_heartbeat(scheduler):
+    async def main():
+        assert await scheduler.wait(0.01) == []
+        scheduler.on_tick("ETHUSDT", 100.0, timestamp=T)
+        scheduler.on_tick("ETHUSDT", 99.0, timestamp=T + 1)
+        return await scheduler.wait(1)
+
+    assert asyncio.run(main()) == ["ETHUSDT"]
+    assert scheduler.get_metrics()["heartbeats"] == 1
@@ -0,0 +1,77 @@
+"""
+TechnicalIndicators: motorul incremental e identic cu formulele batch recalculate pe toata seria
+"""
+
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.data.indicators import TechnicalIndicators
+
+
+def random_walk(length, seed=7, start=40_000.0):
+    rng = random.Random(seed)
+    closes, price = [], start
+    for _ in range(length):
+        price *= math.exp(rng.gauss(0, 0.002))
+        closes.append(round(price, 2))
+    return closes
+
+
+@pytest.fixture
+def indicators():
+    return TechnicalIndicators()
+
+
+def test_incremental_matches_batch_at_every_candle(indicators):
+    closes = random_walk(300)
+    for index, close in enumerate(closes):
+        incremental = indicators.update("BTCUSDT", "1m", close)
+        assert incremental == indicators.compute(closes[:index + 1]), f"diverged at candle {index}"
+
+
+def test_live_tick_matches_batch_without_advancing_state(indicators):
+    closes = random_walk(120)
+    indicators.warm_up("BTCUSDT", "5m", closes)
+    before = dict(indicators.latest("BTCUSDT", "5m"))
+
+    for price in (closes[-1] * 1.01, closes[-1] * 0.98):
+        assert indicators.update("BTCUSDT", "5m", price, closed=False) == indicators.compute(closes + [price])
+    assert indicators.latest("BTCUSDT", "5m") == before
+    assert indicators.state("BTCUSDT", "5m").candles == len(closes)
+
+
+def test_warm_up_resets_previous_state(indicators):
+    indicators.warm_up("ETHUSDT", "1h", random_walk(80, seed=1))
+    closes = random_walk(80, seed=2)
+    assert indicators.warm_up("ETHUSDT", "1h", closes) == indicators.compute(closes)
+
+
+def test_insufficient_history_returns_none(indicators):
+    closes = random_walk(10)
+    values = indicators.warm_up("BTCUSDT", "1m", closes)
+    assert values["rsi"] is None and values["sma"] is None and values["bb_middle"] is None
+    assert values == indicators.compute(closes)
+
+
+def test_flat_series_rsi_and_bands(indicators):
+    values = indicators.warm_up("BTCUSDT", "1m", [100.0] * 60)
+    assert values["rsi"] == 100.0
+    assert values["bb_upper"] == values["bb_middle"] == values["bb_lower"] == 100.0
+
+
+def test_vectorized_batch_matches_scalar(indicators):
+    histories = [random_walk(length, seed=seed) for seed, length in ((1, 200), (2, 60), (3, 30), (4, 5))]
+    closes, mask = indicators.stack_histories(histories)
+    batch = indicators.compute_batch(closes, mask)
+
+    for row, history in enumerate(histories):
+        expected = indicators.compute(history)
+        for name, value in expected.items():
+            if value is None:
+                assert np.isnan(batch[name][row]), f"{name} row {row}"
+            else:
+                assert batch[name][row] == pytest.approx(value, rel=1e-9, abs=1e-9), f"{name} row {row}"
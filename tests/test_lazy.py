@@ -0,0 +1,79 @@
+"""
+LazyComponent: initializarea din thread nu blocheaza event loop-ul
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from src.core.lazy import FAILED, READY, LazyComponent
+
+
+def test_aget_does_not_block_loop_during_warm_up():
+    release = threading.Event()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        release.wait(5)
+        return "instance"
+
+    async def main():
+        component = LazyComponent("slow", factory)
+        warm_up = asyncio.create_task(component.warm_up())
+        getter = asyncio.create_task(component.aget())
+
+        # Loop-ul ramane liber cat timp factory-ul ruleaza in thread
+        ticks = 0
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert ticks == 5
+        assert not getter.done()
+
+        release.set()
+        assert await getter == "instance"
+        assert await warm_up is True
+        return component
+
+    component = asyncio.run(main())
+    assert component.state == READY
+    assert component.get() == "instance"
+    assert len(calls) == 1
+
+
+def test_cancelled_caller_does_not_cancel_initialization():
+    release = threading.Event()
+
+    async def main():
+        component = LazyComponent("slow", lambda: release.wait(5) and "instance")
+        first = asyncio.create_task(component.aget())
+        await asyncio.sleep(0.01)
+        first.cancel()
+        second = asyncio.create_task(component.aget())
+        release.set()
+        return await second
+
+    assert asyncio.run(main()) == "instance"
+
+
+def test_failed_initialization_is_retried():
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("unavailable")
+        return "instance"
+
+    async def main():
+        component = LazyComponent("flaky", factory)
+        assert await component.warm_up() is False
+        assert component.state == FAILED
+        return await component.aget()
+
+    assert asyncio.run(main()) == "instance"
+    assert len(attempts) == 2
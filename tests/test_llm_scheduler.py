@@ -0,0 +1,136 @@
+"""
+LLMCapacityScheduler: ordinea pe prioritati, EDF in cadrul clasei, slotul rezervat si deadline-uri
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from src.core.llm_scheduler import (BACKGROUND, INTERACTIVE, SIGNAL, DeadlineExceeded,
+                                    LLMCapacityScheduler)
+
+
+async def admitted_order(scheduler, requests):
+    """Ocupa toate sloturile, pune request-urile in coada, apoi elibereaza cate un slot pe rand"""
+    for _ in range(scheduler.max_concurrent):
+        await scheduler.acquire(INTERACTIVE)
+
+    order = []
+
+    async def request(name, priority_class, deadline):
+        await scheduler.acquire(priority_class, deadline)
+        order.append(name)
+
+    tasks = [asyncio.create_task(request(*item)) for item in requests]
+    await asyncio.sleep(0.01)
+    assert order == []
+
+    for _ in requests:
+        scheduler.release()
+        await asyncio.sleep(0.01)
+    await asyncio.gather(*tasks)
+    return order
+
+
+def test_priority_order_across_classes():
+    async def main():
+        scheduler = LLMCapacityScheduler(max_concurrent=1, reserved_interactive=0)
+        return await admitted_order(scheduler, [
+            ("background", BACKGROUND, None),
+            ("signal", SIGNAL, None),
+            ("interactive", INTERACTIVE, None),
+        ])
+
+    assert asyncio.run(main()) == ["interactive", "signal", "background"]
+
+
+def test_earliest_deadline_first_within_class():
+    async def main():
+        scheduler = LLMCapacityScheduler(max_concurrent=1, reserved_interactive=0)
+        return await admitted_order(scheduler, [
+            ("late", SIGNAL, 30),
+            ("no deadline", SIGNAL, None),
+            ("early", SIGNAL, 10),
+            ("middle", SIGNAL, 20),
+        ])
+
+    assert asyncio.run(main()) == ["early", "middle", "late", "no deadline"]
+
+
+def test_reserved_slot_is_only_for_interactive():
+    async def main():
+        scheduler = LLMCapacityScheduler(max_concurrent=2, reserved_interactive=1)
+        await scheduler.acquire(SIGNAL)
+
+        # Al doilea slot e rezervat: scanarea asteapta, chatul e admis imediat
+        scan = asyncio.create_task(scheduler.acquire(SIGNAL))
+        await asyncio.sleep(0.01)
+        assert not scan.done()
+        await asyncio.wait_for(scheduler.acquire(INTERACTIVE), 0.5)
+        assert scheduler.get_metrics()["in_flight"] == 2
+
+        scheduler.release()
+        scheduler.release()
+        await asyncio.wait_for(scan, 0.5)
+        return scheduler.get_metrics()
+
+    metrics = asyncio.run(main())
+    assert metrics["classes"][SIGNAL]["admitted"] == 2
+    assert metrics["classes"][INTERACTIVE]["admitted"] == 1
+
+
+def test_reservation_never_blocks_a_single_slot():
+    scheduler = LLMCapacityScheduler(max_concurrent=1, reserved_interactive=3)
+    assert scheduler.reserved_interactive == 0
+
+
+def test_deadline_exceeded_and_slot_not_leaked():
+    async def main():
+        scheduler = LLMCapacityScheduler(max_concurrent=1, reserved_interactive=0)
+        await scheduler.acquire(INTERACTIVE)
+        with pytest.raises(DeadlineExceeded):
+            await scheduler.acquire(BACKGROUND, deadline=0.05)
+
+        scheduler.release()
+        async with scheduler.slot(SIGNAL, deadline=0.5):
+            pass
+        return scheduler.get_metrics()
+
+    metrics = asyncio.run(main())
+    assert metrics["classes"][BACKGROUND]["expired"] == 1
+    assert metrics["in_flight"] == 0
+
+
+def test_class_deadline_from_config():
+    async def main():
+        scheduler = LLMCapacityScheduler(max_concurrent=1, reserved_interactive=0, deadlines={SIGNAL: 0.05})
+        await scheduler.acquire(INTERACTIVE)
+        with pytest.raises(DeadlineExceeded):
+            await scheduler.acquire(SIGNAL)
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_does_not_take_a_slot():
+    async def main():
+        scheduler = LLMCapacityScheduler(max_concurrent=1, reserved_interactive=0)
+        await scheduler.acquire(INTERACTIVE)
+        waiter = asyncio.create_task(scheduler.acquire(SIGNAL))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.sleep(0.01)
+
+        scheduler.release()
+        await asyncio.wait_for(scheduler.acquire(BACKGROUND), 0.5)
+        return scheduler.get_metrics()
+
+    metrics = asyncio.run(main())
+    assert metrics["in_flight"] == 1
+    assert metrics["classes"][SIGNAL]["admitted"] == 0
+
+
+def test_unknown_priority_class():
+    with pytest.raises(ValueError):
+        asyncio.run(LLMCapacityScheduler().acquire("urgent"))
@@ -0,0 +1,79 @@
+"""
+ModelRouter: rutare pe niveluri, escaladare si LLM-ul stub determinist
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from src.core.model_router import DEEP, FAST, STUB_RESPONSE, ModelRouter
+from src.core.response_parser import parse_response
+
+CONFIG = {
+    "llm": {
+        "router": {
+            "enabled": True,
+            "provider": "stub",
+            "tiers": {
+                "fast": {"model": "llama-3.1-8b-instant", "max_tokens": 1000},
+                "deep": {"model": "llama-3.1-70b-versatile", "max_tokens": 2000},
+            },
+            "escalation": {"min_confidence": 0.5, "max_confidence": 0.75},
+        }
+    }
+}
+
+
+@pytest.fixture
+def router(monkeypatch):
+    monkeypatch.delenv("LLM_PROVIDER", raising=False)
+    return ModelRouter.from_config(CONFIG)
+
+
+def test_stub_llm_is_deterministic(router):
+    pytest.importorskip("langchain_core")
+
+    async def ask(llm):
+        return [(await llm.ainvoke(prompt)).content for prompt in ("Analizeaza BTCUSDT", "Analizeaza ETHUSDT")]
+
+    fast, deep = router.create_llm(FAST), router.create_llm(DEEP)
+    assert asyncio.run(ask(fast)) == [STUB_RESPONSE, STUB_RESPONSE]
+    assert asyncio.run(ask(deep)) == [STUB_RESPONSE, STUB_RESPONSE]
+
+
+def test_stub_response_parses_as_hold_without_escalation(router):
+    parsed = parse_response(STUB_RESPONSE)
+    assert (parsed.action, parsed.confidence) == ("HOLD", 0.5)
+    assert not router.should_escalate(parsed.action, parsed.confidence)
+
+
+def test_provider_env_override(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "stub")
+    config = {"llm": {"router": {**CONFIG["llm"]["router"], "provider": "groq"}}}
+    assert ModelRouter.from_config(config).provider == "stub"
+
+
+def test_injected_factory_receives_tier(router):
+    router.llm_factory = lambda tier, callbacks: (tier.name, tier.model, tier.max_tokens)
+    assert router.create_llm(FAST) == (FAST, "llama-3.1-8b-instant", 1000)
+
+
+@pytest.mark.parametrize("action, confidence, expected", [
+    ("BUY", 0.6, True),
+    ("SELL", 0.5, True),
+    ("BUY", 0.75, False),
+    ("BUY", 0.4, False),
+    ("HOLD", 0.6, False),
+])
+def test_escalation_band(router, action, confidence, expected):
+    assert router.should_escalate(action, confidence) is expected
+
+
+def test_disabled_router_uses_deep_tier_only():
+    config = {"llm": {"router": {**CONFIG["llm"]["router"], "enabled": False}}}
+    router = ModelRouter.from_config(config)
+    assert router.resolve(FAST) == DEEP
+    assert router.active_tiers() == [DEEP]
+    assert not router.should_escalate("BUY", 0.6)
@@ -0,0 +1,123 @@
+"""
+AsyncStagePipeline: backpressure pe cozile limitate, ordinea elementelor si propagarea erorilor
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from src.core.pipeline import AsyncStagePipeline
+
+
+async def source(items, produced=None):
+    for item in items:
+        if produced is not None:
+            produced.append(item)
+        yield item
+
+
+def test_single_worker_stages_keep_order():
+    async def double(item):
+        await asyncio.sleep(0.001 * (item % 3))
+        return item * 2
+
+    async def shift(item):
+        return item + 1
+
+    pipeline = AsyncStagePipeline(queue_size=2).add_stage("double", double).add_stage("shift", shift)
+    assert asyncio.run(pipeline.run(source(range(20)))) == [i * 2 + 1 for i in range(20)]
+
+    metrics = pipeline.get_metrics()
+    assert not metrics["running"]
+    assert metrics["stages"]["double"]["processed"] == 20
+    assert metrics["stages"]["shift"]["processed"] == 20
+
+
+def test_none_drops_item():
+    async def even_only(item):
+        return item if item % 2 == 0 else None
+
+    pipeline = AsyncStagePipeline().add_stage("filter", even_only)
+    assert asyncio.run(pipeline.run(source(range(10)))) == [0, 2, 4, 6, 8]
+    assert pipeline.get_metrics()["stages"]["filter"]["dropped"] == 5
+
+
+def test_bounded_queues_apply_backpressure():
+    produced = []
+    lead = []
+
+    async def slow(item):
+        # Cat de mult a avansat sursa fata de elementul procesat acum
+        lead.append(len(produced) - item)
+        await asyncio.sleep(0.002)
+        return item
+
+    pipeline = AsyncStagePipeline(queue_size=2).add_stage("slow", slow)
+    asyncio.run(pipeline.run(source(range(30), produced)))
+    # Elementul in lucru + coada plina + cel blocat in put()
+    assert max(lead) <= 2 + 2
+
+
+def test_live_metrics_while_running():
+    release = None
+    snapshots = []
+
+    async def blocked(item):
+        await release.wait()
+        return item
+
+    async def main():
+        nonlocal release
+        release = asyncio.Event()
+        pipeline = AsyncStagePipeline(queue_size=5).add_stage("blocked", blocked)
+        task = asyncio.create_task(pipeline.run(source(range(4))))
+        await asyncio.sleep(0.01)
+        snapshots.append(pipeline.get_metrics())
+        release.set()
+        await task
+        snapshots.append(pipeline.get_metrics())
+
+    asyncio.run(main())
+    running, done = snapshots
+    assert running["running"]
+    # Un element in lucru, trei in coada plus marcajul de sfarsit al sursei
+    assert running["stages"]["blocked"]["queue_depth"] == 4
+    assert running["stages"]["blocked"]["processed"] == 0
+    assert not done["running"]
+    assert done["stages"]["blocked"]["processed"] == 4
+    assert done["stages"]["blocked"]["throughput_per_second"] > 0
+
+
+def test_handler_error_is_counted_and_pipeline_continues():
+    async def fragile(item):
+        if item == 3:
+            raise ValueError("bad item")
+        return item
+
+    pipeline = AsyncStagePipeline().add_stage("fragile", fragile, workers=2)
+    assert sorted(asyncio.run(pipeline.run(source(range(6))))) == [0, 1, 2, 4, 5]
+    stage = pipeline.get_metrics()["stages"]["fragile"]
+    assert stage["errors"] == 1
+    assert stage["dropped"] == 1
+
+
+def test_source_error_propagates_and_stops_stages():
+    async def broken_source():
+        yield 1
+        raise RuntimeError("feed lost")
+
+    async def passthrough(item):
+        return item
+
+    async def main():
+        pipeline = AsyncStagePipeline().add_stage("a", passthrough).add_stage("b", passthrough)
+        with pytest.raises(RuntimeError, match="feed lost"):
+            await asyncio.wait_for(pipeline.run(broken_source()), timeout=1)
+        assert not pipeline.running
+        # Nicio etapa nu ramane agatata dupa eroare
+        current = asyncio.current_task()
+        assert all(task.done() for task in asyncio.all_tasks() if task is not current)
+
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""
+QuantPreScreen: praguri pe formulele TechnicalIndicators si volum live proiectat pe progresul lumanarii
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.core.pre_screen import QuantPreScreen
+from src.data.indicators import TechnicalIndicators
+
+CONFIG = {
+    "rsi": {"period": 14, "overbought": 70, "oversold": 30},
+    "macd": {"fast": 12, "slow": 26, "signal": 9},
+    "bollinger_bands": {"period": 20, "std_dev": 2},
+    "volume": {"threshold_multiplier": 1.5, "period": 20},
+}
+
+
+@pytest.fixture
+def screen():
+    return QuantPreScreen(CONFIG)
+
+
+def quiet(length=60, start=100.0, step=0.5):
+    """Zigzag urmat de un platou: RSI ~50, fara cross MACD, fara breakout Bollinger"""
+    half = length // 2
+    return [start + (step if i % 2 else -step) for i in range(half)] + [start] * (length - half)
+
+
+def test_insufficient_history_passes(screen):
+    result = screen.evaluate("BTCUSDT", quiet(screen.min_history - 1))
+    assert result.passed
+    assert result.triggers == ["insufficient_history"]
+
+
+def test_flat_series_is_filtered(screen):
+    closes = quiet()
+    result = screen.evaluate("BTCUSDT", closes, [10.0] * 60)
+    assert not result.passed
+    assert result.triggers == []
+
+
+def test_metrics_match_indicator_engine(screen):
+    closes = [100.0 + (i % 7) * 0.3 + i * 0.05 for i in range(80)]
+    result = screen.evaluate("BTCUSDT", closes)
+    assert result.metrics["rsi"] == TechnicalIndicators.rsi(closes, 14)
+    assert result.metrics["macd_histogram"] == TechnicalIndicators.macd(closes, 12, 26, 9)[2]
+    upper, _, lower = TechnicalIndicators.bollinger_bands(closes, 20, 2)
+    assert (result.metrics["bb_upper"], result.metrics["bb_lower"]) == (upper, lower)
+
+
+def test_rsi_and_bollinger_breakout(screen):
+    closes = quiet(60)[:-1] + [110.0]
+    result = screen.evaluate("BTCUSDT", closes)
+    assert "bb_upper_break" in result.triggers
+    assert "rsi_overbought" in result.triggers
+
+    closes = quiet(60)[:-1] + [90.0]
+    result = screen.evaluate("BTCUSDT", closes)
+    assert "bb_lower_break" in result.triggers
+    assert "rsi_oversold" in result.triggers
+
+
+def test_closed_candle_volume_spike(screen):
+    volumes = [10.0] * 59 + [20.0]
+    result = screen.evaluate("BTCUSDT", quiet(), volumes)
+    assert result.triggers == ["volume_spike"]
+    assert result.metrics["volume_ratio"] == pytest.approx(2.0)
+
+
+def test_partial_live_candle_is_projected(screen):
+    # La 25% din lumanare volumul partial (5) ar fi sub baseline (10), dar proiectat inseamna 20
+    volumes = [10.0] * 59 + [5.0]
+    assert not screen.evaluate("BTCUSDT", quiet(), volumes).passed
+
+    result = screen.evaluate("BTCUSDT", quiet(), volumes, candle_progress=0.25)
+    assert result.triggers == ["volume_spike"]
+    assert result.metrics["volume_ratio"] == pytest.approx(2.0)
+
+
+def test_early_candle_projection_is_capped(screen):
+    # La inceputul lumanarii proiectia e limitata de min_candle_progress (0.2 -> x5, nu x100)
+    volumes = [10.0] * 59 + [2.0]
+    result = screen.evaluate("BTCUSDT", quiet(), volumes, candle_progress=0.01)
+    assert result.metrics["volume_ratio"] == pytest.approx(1.0)
+    assert not result.passed
+
+    # Lumanare depasita (feed intarziat): fara extrapolare sub volumul real
+    result = screen.evaluate("BTCUSDT", quiet(), [10.0] * 59 + [10.0], candle_progress=3.0)
+    assert result.metrics["volume_ratio"] == pytest.approx(1.0)
@@ -0,0 +1,73 @@
+"""
+TimeframeRollup: barele superioare agregate din lumanarile de 1m
+"""
+
+import pytest
+
+from src.data.resampler import TimeframeRollup
+
+START = 1_704_067_200  # 2024-01-01 00:00 UTC, aliniat la orice timeframe pana la 1d
+
+
+def candle(minute, close=100.0, volume=1.0):
+    return (START + minute * 60, close - 0.5, close + 1.0, close - 1.0, close, volume)
+
+
+def test_five_minute_bar_closes_with_its_last_base_candle():
+    rollup = TimeframeRollup("5m")
+    bars = [rollup.update(candle(minute, close=100.0 + minute, volume=minute + 1)) for minute in range(5)]
+
+    assert all(len(written) == 1 for written in bars)
+    assert bars[-1][0] == (START, 99.5, 105.0, 99.0, 104.0, 15.0)
+    assert rollup.closed_bars == 1
+
+
+def test_live_candle_does_not_double_count_volume():
+    rollup = TimeframeRollup("5m")
+    rollup.update(candle(0, volume=2.0))
+    for volume in (1.0, 3.0, 4.0):
+        (bar,) = rollup.update(candle(1, volume=volume), closed=False)
+        assert bar[5] == 2.0 + volume
+
+    (bar,) = rollup.update(candle(1, volume=4.0))
+    assert bar[5] == 6.0
+
+
+def test_missing_candles_close_previous_bar_on_next_interval():
+    rollup = TimeframeRollup("15m")
+    rollup.update(candle(0, close=100.0))
+    rollup.update(candle(7, close=110.0))
+
+    closed, current = rollup.update(candle(16, close=120.0))
+    assert closed == (START, 99.5, 111.0, 99.0, 110.0, 2.0)
+    assert current[0] == START + 15 * 60 and current[4] == 120.0
+    assert rollup.closed_bars == 1
+
+
+def test_old_and_repeated_candles_are_ignored():
+    rollup = TimeframeRollup("5m", start=START + 5 * 60)
+    assert rollup.update(candle(4)) == []
+    assert rollup.update(candle(5))
+    assert rollup.update(candle(5)) == []
+
+
+def test_hourly_rollup_matches_full_aggregation():
+    candles = [candle(minute, close=100.0 + (minute * 7) % 13, volume=minute % 5 + 1) for minute in range(180)]
+    rollup = TimeframeRollup("1h")
+    closed = []
+    for base in candles:
+        written = rollup.update(base)
+        if rollup.closed_bars > len(closed):
+            closed.append(written[-1])
+
+    for hour, bar in enumerate(closed):
+        chunk = candles[hour * 60:(hour + 1) * 60]
+        assert bar == (chunk[0][0], chunk[0][1], max(c[2] for c in chunk), min(c[3] for c in chunk),
+                       chunk[-1][4], sum(c[5] for c in chunk))
+    assert len(closed) == 3
+
+
+@pytest.mark.parametrize("timeframe, base", [("1m", "1m"), ("3m", "5m"), ("5m", "3m")])
+def test_invalid_resampling_is_rejected(timeframe, base):
+    with pytest.raises(ValueError):
+        TimeframeRollup(timeframe, base)
@@ -0,0 +1,86 @@
+"""
+AnalysisResponseCache: expirare la inchiderea lumanarii, LRU pe numar de intrari si pe bytes
+"""
+
+import pytest
+
+from src.core import response_cache
+from src.core.response_cache import AnalysisResponseCache
+
+T = 1_700_000_400.0  # inceputul unei lumanari de 5m
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [T]
+    monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+    return now
+
+
+def key(symbol, timeframe="5m", template="analyze_symbol"):
+    return AnalysisResponseCache.make_key(template, symbol, timeframe, T)
+
+
+def test_entry_expires_at_candle_close(clock):
+    cache = AnalysisResponseCache()
+    cache.set(key("BTCUSDT"), "analysis")
+    clock[0] = T + 299
+    assert cache.get(key("BTCUSDT")) == "analysis"
+    clock[0] = T + 300
+    assert cache.get(key("BTCUSDT")) is None
+    assert cache.get_metrics()["entries"] == 0
+
+
+def test_expired_entries_are_dropped_on_set(clock):
+    cache = AnalysisResponseCache()
+    cache.set(key("BTCUSDT", "5m"), "short")
+    cache.set(key("ETHUSDT", "1h"), "long")
+    clock[0] = T + 300
+    cache.set(key("SOLUSDT", "1h"), "new")
+    metrics = cache.get_metrics()
+    assert metrics["entries"] == 2
+    assert metrics["evictions"] == 0
+    assert cache.get(key("ETHUSDT", "1h")) == "long"
+
+
+def test_lru_eviction_by_entries(clock):
+    cache = AnalysisResponseCache(max_entries=2)
+    cache.set(key("BTCUSDT"), "a")
+    cache.set(key("ETHUSDT"), "b")
+    assert cache.get(key("BTCUSDT")) == "a"  # ETHUSDT devine cea mai veche
+    cache.set(key("SOLUSDT"), "c")
+    assert cache.get(key("ETHUSDT")) is None
+    assert cache.get(key("BTCUSDT")) == "a"
+    assert cache.get_metrics()["evictions"] == 1
+
+
+def test_lru_eviction_by_bytes(clock):
+    cache = AnalysisResponseCache(max_bytes=250)
+    cache.set(key("BTCUSDT"), "a", size=100)
+    cache.set(key("ETHUSDT"), "b", size=100)
+    cache.set(key("SOLUSDT"), "c", size=100)
+    metrics = cache.get_metrics()
+    assert (metrics["entries"], metrics["bytes"], metrics["evictions"]) == (2, 200, 1)
+    assert cache.get(key("BTCUSDT")) is None
+
+    # O valoare mai mare decat tot bugetul nu goleste cache-ul
+    cache.set(key("XRPUSDT"), "huge", size=251)
+    assert cache.get_metrics()["entries"] == 2
+
+
+def test_overwrite_keeps_byte_accounting(clock):
+    cache = AnalysisResponseCache()
+    for size in (100, 40, 70):
+        cache.set(key("BTCUSDT"), "a", size=size)
+    assert cache.get_metrics()["bytes"] == 70
+    clock[0] = T + 300
+    cache.set(key("ETHUSDT", "1h"), "b", size=10)
+    assert cache.get_metrics()["bytes"] == 10
+
+
+def test_expiry_heap_stays_bounded(clock):
+    cache = AnalysisResponseCache(max_entries=10)
+    for i in range(1000):
+        cache.set(key(f"S{i % 50}", "1h"), i, size=1)
+    assert len(cache._expiry) <= 2 * cache.max_entries + 64
+    assert cache.get_metrics()["entries"] == 10
@@ -0,0 +1,59 @@
+"""
+parse_response: campuri text, nivele de pret si confidence din raspunsurile LLM
+"""
+
+import pytest
+
+from src.core.response_parser import parse_response
+
+
+def test_levels_and_keywords():
+    parsed = parse_response(
+        "BTCUSDT in uptrend, high volume. Support at 62,000 si resistance at 64,800. Recomandare: BUY.\n"
+        "Entry: $63,250.50, stop loss: 61,800, take profit: 65,500. Confidence: 78%."
+    )
+    assert (parsed.action, parsed.trend, parsed.volume_status) == ("BUY", "uptrend", "high")
+    assert (parsed.entry_price, parsed.stop_loss, parsed.take_profit) == (63250.5, 61800.0, 65500.0)
+    assert (parsed.support, parsed.resistance) == (62000.0, 64800.0)
+    assert parsed.confidence == pytest.approx(0.78)
+
+
+@pytest.mark.parametrize("text", ["Stop loss at 5%", "stop-loss: 5 %", "take profit 8/10"])
+def test_percent_levels_are_not_prices(text):
+    parsed = parse_response(text)
+    assert parsed.stop_loss == 0.0 and parsed.take_profit == 0.0
+
+
+def test_percent_level_falls_through_to_absolute_price():
+    assert parse_response("Stop loss at 5% below entry, stop loss: 61,800").stop_loss == 61800.0
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Confidence 8/10", 0.8),
+    ("confidence: 7 / 10", 0.7),
+    ("confidence 85/100", 0.85),
+    ("confidence: 78%", 0.78),
+    ("confidence 0.65", 0.65),
+    ("confidence score 80", 0.8),
+    ("confidence: 7", 0.7),
+    ("confidence 8.5", 0.85),
+    ("confidence 10", 1.0),
+])
+def test_confidence_forms(text, expected):
+    assert parse_response(text).explicit_confidence == pytest.approx(expected)
+
+
+def test_pipe_confidence_on_ten_point_scale():
+    assert parse_response("BUY|100|95|110|8|breakout").explicit_confidence == pytest.approx(0.8)
+    assert parse_response("BUY|100|95|110|80|breakout").explicit_confidence == pytest.approx(0.8)
+
+
+def test_pipe_format_takes_priority():
+    parsed = parse_response("Entry: 1\nSELL|100|110|80|70%|momentum")
+    assert (parsed.action, parsed.entry_price, parsed.stop_loss, parsed.take_profit) == ("SELL", 100.0, 110.0, 80.0)
+    assert parsed.confidence == pytest.approx(0.7)
+
+
+def test_keyword_defaults():
+    parsed = parse_response("nothing to see here")
+    assert (parsed.sentiment, parsed.trend, parsed.action, parsed.confidence) == ("neutral", "sideways", "HOLD", 0.6)
@@ -0,0 +1,71 @@
+"""
+SignalDedupIndex: cooldown pentru semnale similare si benzile de pret vecine
+"""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.signal_dedup import SignalDedupIndex
+
+
+def make_signal(price, symbol="BTCUSDT", action="BUY", timeframe="5m"):
+    return SimpleNamespace(symbol=symbol, action=action, entry_price=price, timeframe=timeframe)
+
+
+@pytest.fixture
+def dedup():
+    return SignalDedupIndex(cooldown=300, price_band_pct=0.5)
+
+
+def test_repeat_within_cooldown_is_suppressed(dedup):
+    assert not dedup.is_duplicate(make_signal(60_000), now=0)
+    assert dedup.is_duplicate(make_signal(60_010), now=100)
+    assert dedup.get_metrics()["suppressed"] == 1
+
+
+def test_cooldown_expiry_allows_signal_again(dedup):
+    assert not dedup.is_duplicate(make_signal(60_000), now=0)
+    assert not dedup.is_duplicate(make_signal(60_000), now=300)
+    assert dedup.is_duplicate(make_signal(60_000), now=599)
+
+
+def test_neighbour_band_is_suppressed(dedup):
+    price = 60_000
+    band = dedup.price_band(price)
+    # Primul pret din banda urmatoare, chiar peste granita
+    upper = price
+    while dedup.price_band(upper) == band:
+        upper *= 1.0001
+    assert dedup.price_band(upper) == band + 1
+
+    assert not dedup.is_duplicate(make_signal(price), now=0)
+    assert dedup.is_duplicate(make_signal(upper), now=1)
+
+
+def test_prices_two_bands_apart_are_distinct(dedup):
+    assert not dedup.is_duplicate(make_signal(60_000), now=0)
+    # ~1.5% mai sus: cel putin doua benzi de 0.5%
+    assert not dedup.is_duplicate(make_signal(60_900), now=1)
+
+
+@pytest.mark.parametrize("other", [
+    make_signal(60_000, symbol="ETHUSDT"),
+    make_signal(60_000, action="SELL"),
+    make_signal(60_000, timeframe="1h"),
+])
+def test_different_symbol_action_or_timeframe_is_new(dedup, other):
+    assert not dedup.is_duplicate(make_signal(60_000), now=0)
+    assert not dedup.is_duplicate(other, now=1)
+
+
+@pytest.mark.parametrize("band", [0, 500, 2300])
+def test_band_width_is_relative(dedup, band):
+    # Mijlocul benzii: fiecare +0.5% muta pretul exact o banda mai sus, la orice nivel de pret
+    price = math.exp((band + 0.5) * math.log1p(0.005))
+    assert [dedup.price_band(price * 1.005 ** step) for step in range(4)] == [band, band + 1, band + 2, band + 3]
+
+
+def test_non_positive_price_has_band_zero(dedup):
+    assert dedup.price_band(0) == 0
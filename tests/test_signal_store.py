@@ -0,0 +1,83 @@
+"""
+SignalStore: cautare pe interval, paginare, expirare si limita de memorie
+"""
+
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.signal_store import SignalStore
+
+BASE = 1_700_000_000
+
+
+def make_signal(symbol="BTCUSDT", offset=0, action="BUY", confidence=0.8, timeframe="5m"):
+    return SimpleNamespace(symbol=symbol, action=action, confidence=confidence, timeframe=timeframe,
+                           timestamp=datetime.fromtimestamp(BASE + offset))
+
+
+@pytest.fixture
+def store():
+    store = SignalStore(max_signals=100, default_hold_candles=12)
+    for offset in range(10):
+        store.add(make_signal("BTCUSDT" if offset % 2 == 0 else "ETHUSDT", offset * 60,
+                              action="BUY" if offset < 5 else "SELL", confidence=offset / 10))
+    return store
+
+
+def offsets(signals):
+    return [int(signal.timestamp.timestamp()) - BASE for signal in signals]
+
+
+def test_range_query_is_inclusive_and_newest_first(store):
+    signals, total = store.query(since=BASE + 120, until=BASE + 300)
+    assert offsets(signals) == [300, 240, 180, 120]
+    assert total == 4
+
+    signals, _ = store.query(since=BASE + 120, until=BASE + 300, newest_first=False)
+    assert offsets(signals) == [120, 180, 240, 300]
+
+
+def test_symbol_action_and_confidence_filters(store):
+    signals, total = store.query(symbol="btcusdt", action="buy")
+    assert offsets(signals) == [240, 120, 0]
+    assert total == 3
+
+    _, total = store.query(min_confidence=0.7)
+    assert total == 3
+
+
+def test_pagination_reports_total(store):
+    first, total = store.query(limit=4)
+    second, _ = store.query(offset=4, limit=4)
+    last, _ = store.query(offset=8, limit=4)
+    assert total == 10
+    assert offsets(first + second + last) == [540, 480, 420, 360, 300, 240, 180, 120, 60, 0]
+
+
+def test_expiry_uses_timeframe_ttl(store):
+    fast = store.add(make_signal("SOLUSDT", 600, timeframe="1m"))
+    assert fast and len(store) == 11
+
+    # 1m: 12 lumanari; 5m: 60 de minute
+    assert store.expire(now=time.time() + 13 * 60) == 1
+    assert store.latest("SOLUSDT") is None
+    assert store.expire(now=time.time() + 61 * 60) == 10
+    assert store.query() == ([], 0)
+
+
+def test_configured_hold_time_overrides_candles():
+    store = SignalStore.from_config({"strategies": {"scalping": {"timeframes": ["1m"], "max_hold_time": 300}}})
+    assert store.ttl_for("1m") == 300
+    assert store.ttl_for("1h") == 3600 * 12
+    assert store.ttl_for(None) == 3600
+
+
+def test_memory_limit_evicts_oldest():
+    store = SignalStore(max_signals=3)
+    for offset in (300, 0, 200, 100):
+        store.add(make_signal(offset=offset))
+    assert offsets(store.all()) == [300, 200, 100]
+    assert store.get_metrics()["evicted"] == 1
@@ -0,0 +1,113 @@
+"""
+SingleFlight: un singur apel per cheie, task comun protejat de anularea unui apelant, erori pentru toti
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_execution():
+    calls = []
+
+    async def main():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            calls.append(1)
+            await release.wait()
+            return "result"
+
+        waiters = [asyncio.create_task(flight.do("BTCUSDT", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert flight.get_metrics()["in_flight"] == 1
+        release.set()
+        return await asyncio.gather(*waiters), flight.get_metrics()
+
+    results, metrics = asyncio.run(main())
+    assert results == ["result"] * 3
+    assert calls == [1]
+    assert metrics == {"in_flight": 0, "executions": 1, "coalesced": 2}
+
+
+def test_different_keys_run_separately():
+    async def main():
+        flight = SingleFlight()
+
+        async def value(v):
+            await asyncio.sleep(0)
+            return v
+
+        return await asyncio.gather(flight.do("a", lambda: value(1)), flight.do("b", lambda: value(2)))
+
+    assert asyncio.run(main()) == [1, 2]
+
+
+def test_cancelling_one_waiter_does_not_cancel_shared_task():
+    async def main():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert await second == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(main())
+
+
+def test_execution_continues_when_all_waiters_leave():
+    finished = []
+
+    async def main():
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            finished.append(1)
+            return "result"
+
+        waiter = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0.05)
+        return flight.get_metrics()
+
+    assert asyncio.run(main())["in_flight"] == 0
+    assert finished == [1]
+
+
+def test_error_reaches_every_waiter_and_key_is_released():
+    attempts = []
+
+    async def main():
+        flight = SingleFlight()
+
+        async def failing():
+            attempts.append(1)
+            await asyncio.sleep(0)
+            raise RuntimeError("mcp down")
+
+        results = await asyncio.gather(*(flight.do("key", failing) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        # Eroarea nu ramane in cache: urmatorul apel reincearca
+        async def ok():
+            return "recovered"
+        return await flight.do("key", ok)
+
+    assert asyncio.run(main()) == "recovered"
+    assert attempts == [1]
@@ -0,0 +1,48 @@
+"""
+Cold start: importul si constructia CryptoAIAgent raman sub buget (LLM, MCP si restul sunt lazy)
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+for module in ("dotenv", "loguru", "yaml", "numpy"):
+    pytest.importorskip(module)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", 1.0))
+
+# Ruleaza intr-un interpretor nou, ca sa masuram un cold start real
+MEASURE = """
+import time
+started = time.perf_counter()
+from src.core.ai_agent import CryptoAIAgent
+imported = time.perf_counter()
+agent = CryptoAIAgent()
+constructed = time.perf_counter()
+print(f"{imported - started:.4f} {constructed - imported:.4f}")
+"""
+
+
+def test_cold_start_within_budget():
+    result = subprocess.run([sys.executable, "-c", MEASURE], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+    import_seconds, construct_seconds = map(float, result.stdout.split()[-2:])
+    total = import_seconds + construct_seconds
+    assert total <= BUDGET_SECONDS, (
+        f"import {import_seconds * 1000:.0f} ms + construct {construct_seconds * 1000:.0f} ms "
+        f"exceeds the {BUDGET_SECONDS * 1000:.0f} ms budget"
+    )
+
+
+def test_construction_does_not_initialize_heavy_components():
+    from src.core.ai_agent import CryptoAIAgent
+    from src.core.lazy import PENDING
+
+    agent = CryptoAIAgent()
+    for name in ("llm", "mcp_client", "data_fetcher"):
+        assert agent.readiness()["components"][name]["state"] == PENDING
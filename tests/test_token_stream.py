@@ -0,0 +1,99 @@
+"""
+TokenStream: tokenii retinuti pana la hold_chars, RESET pentru pasii cu tool call, izolare per task
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from src.core import token_stream
+from src.core.token_stream import RESET, TokenStream
+
+
+def drain(stream):
+    async def main():
+        stream.close()
+        return [token async for token in stream]
+    return asyncio.run(main())
+
+
+def test_final_answer_tokens_are_streamed_in_order():
+    stream = TokenStream(hold_chars=5)
+    for token in ("BTC", "USDT", ": ", "BUY"):
+        stream.push(token, run_id="final")
+    stream.finish_run("final")
+    assert drain(stream) == ["BTC", "USDT", ": ", "BUY"]
+
+
+def test_tokens_are_held_back_until_hold_chars():
+    async def main():
+        stream = TokenStream(hold_chars=10)
+        stream.push("abc", run_id=1)
+        held = stream._queue.qsize()
+        stream.push("defghij", run_id=1)
+        flushed = stream._queue.qsize()
+        stream.push("k", run_id=1)
+        return held, flushed, stream._queue.qsize()
+
+    assert asyncio.run(main()) == (0, 2, 3)
+
+
+def test_tool_call_within_hold_window_is_dropped_silently():
+    stream = TokenStream(hold_chars=80)
+    stream.push("Let me check", run_id="step")
+    stream.push("", run_id="step", tool_call=True)
+    stream.push("ignored", run_id="step")
+    stream.finish_run("step")
+    stream.push("Final answer", run_id="final")
+    stream.finish_run("final")
+    assert drain(stream) == ["Final answer"]
+
+
+def test_tool_call_after_streaming_sends_reset():
+    stream = TokenStream(hold_chars=3)
+    stream.push("Thinking", run_id="step")
+    stream.finish_run("step", tool_call=True)
+    stream.push("Answer", run_id="final")
+    stream.finish_run("final")
+    assert drain(stream) == ["Thinking", RESET, "Answer"]
+
+
+def test_active_stream_is_isolated_per_task():
+    async def request(name):
+        stream = TokenStream(hold_chars=1)
+        stream.activate()
+        await asyncio.sleep(0)
+        # Callback-ul LLM ruleaza in contextul task-ului care a facut request-ul
+        token_stream._current_stream.get().push(f"token for {name}", run_id=name)
+        stream.close()
+        return [token async for token in stream]
+
+    async def main():
+        results = await asyncio.gather(request("alice"), request("bob"))
+        return results, token_stream._current_stream.get()
+
+    results, outside = asyncio.run(main())
+    assert results == [["token for alice"], ["token for bob"]]
+    assert outside is None
+
+
+def test_langchain_callback_routes_tokens_to_active_stream():
+    pytest.importorskip("langchain_core")
+    handler = token_stream.stream_callback_handler()
+    tool_chunk = SimpleNamespace(message=SimpleNamespace(tool_call_chunks=[{"name": "get_price"}]))
+    text_chunk = SimpleNamespace(message=SimpleNamespace(tool_call_chunks=[]))
+    final = SimpleNamespace(generations=[[SimpleNamespace(message=SimpleNamespace(tool_calls=[]))]])
+
+    async def main():
+        stream = TokenStream(hold_chars=1)
+        stream.activate()
+        await handler.on_llm_new_token("", chunk=tool_chunk, run_id="step")
+        await handler.on_llm_new_token("Final", chunk=text_chunk, run_id="final")
+        await handler.on_llm_end(final, run_id="final")
+        stream.close()
+        return [token async for token in stream]
+
+    assert asyncio.run(main()) == ["Final"]
@@ -0,0 +1,177 @@
+"""
+MCPToolCallCache: TTL per server/tool, erorile nu se pastreaza, apelurile identice sunt comasate
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from src.core import tool_cache
+from src.core.tool_cache import MCPToolCallCache
+
+
+class Tool:
+    """Tool MCP fals care numara apelurile"""
+
+    def __init__(self, is_error=False, delay=0.0):
+        self.calls = 0
+        self.is_error = is_error
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(isError=self.is_error, content=f"result {self.calls}")
+
+
+@pytest.fixture
+def cache():
+    return MCPToolCallCache(server_ttls={"binance": 5.0, "news": 0.0},
+                            tool_ttls={"binance": {"place_order": 0}}, max_entries=2)
+
+
+def call(cache, server, tool, arguments, fn, times=2):
+    async def main():
+        return [await cache.call(server, tool, arguments, fn) for _ in range(times)]
+    return asyncio.run(main())
+
+
+def test_ttl_zero_bypasses_cache(cache):
+    tool = Tool()
+    call(cache, "news", "latest", {}, tool)
+    assert tool.calls == 2
+    assert cache.get_metrics()["bypassed"] == 2
+    assert cache.get_metrics()["entries"] == 0
+
+
+def test_tool_ttl_overrides_server_ttl(cache):
+    tool = Tool()
+    call(cache, "binance", "place_order", {"symbol": "BTCUSDT"}, tool)
+    assert tool.calls == 2
+    assert cache.ttl_for("binance", "get_price") == 5.0
+    assert cache.ttl_for("unknown", "tool") == 0.0
+
+
+def test_results_cached_until_ttl(cache, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(tool_cache.time, "monotonic", lambda: now[0])
+    tool = Tool()
+
+    first, second = call(cache, "binance", "get_price", {"symbol": "BTCUSDT"}, tool)
+    assert first is second
+    assert tool.calls == 1
+
+    now[0] = 105.0
+    call(cache, "binance", "get_price", {"symbol": "BTCUSDT"}, tool, times=1)
+    assert tool.calls == 2
+    metrics = cache.get_metrics()
+    assert (metrics["hits"], metrics["misses"]) == (1, 2)
+    assert metrics["servers"]["binance"] == {"hits": 1, "misses": 2}
+
+
+def test_argument_order_does_not_change_key(cache):
+    tool = Tool()
+
+    async def main():
+        await cache.call("binance", "get_klines", {"symbol": "BTCUSDT", "interval": "5m"}, tool)
+        await cache.call("binance", "get_klines", {"interval": "5m", "symbol": "BTCUSDT"}, tool)
+
+    asyncio.run(main())
+    assert tool.calls == 1
+
+
+def test_error_results_are_not_cached(cache):
+    tool = Tool(is_error=True)
+    call(cache, "binance", "get_price", {"symbol": "BTCUSDT"}, tool)
+    assert tool.calls == 2
+    assert cache.get_metrics()["entries"] == 0
+
+
+def test_exceptions_are_not_cached(cache):
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("server restarted")
+        return SimpleNamespace(isError=False, content="ok")
+
+    async def main():
+        with pytest.raises(ConnectionError):
+            await cache.call("binance", "get_price", {}, flaky)
+        return await cache.call("binance", "get_price", {}, flaky)
+
+    assert asyncio.run(main()).content == "ok"
+    assert len(attempts) == 2
+
+
+def test_concurrent_identical_calls_are_coalesced(cache):
+    tool = Tool(delay=0.01)
+
+    async def main():
+        return await asyncio.gather(*(cache.call("binance", "get_price", {"symbol": "ETHUSDT"}, tool)
+                                      for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert tool.calls == 1
+    assert all(result is results[0] for result in results)
+    metrics = cache.get_metrics()
+    assert (metrics["misses"], metrics["coalesced"]) == (1, 4)
+
+
+def test_lru_eviction(cache):
+    tool = Tool()
+
+    async def main():
+        for symbol in ("BTCUSDT", "ETHUSDT", "BTCUSDT", "SOLUSDT", "BTCUSDT"):
+            await cache.call("binance", "get_price", {"symbol": symbol}, tool)
+
+    asyncio.run(main())
+    # BTCUSDT a fost folosit recent, ETHUSDT e scos la inserarea lui SOLUSDT
+    assert tool.calls == 3
+    assert cache.get_metrics()["evictions"] == 1
+
+
+def test_install_wraps_existing_and_new_sessions(cache):
+    tool = Tool()
+
+    class Connector:
+        async def call_tool(self, name, arguments=None):
+            return await tool()
+
+    class Client:
+        def __init__(self):
+            self.sessions = {"binance": SimpleNamespace(connector=Connector())}
+
+        async def create_session(self, server_name):
+            return SimpleNamespace(connector=Connector())
+
+    async def main():
+        client = Client()
+        cache.install(client)
+        existing = client.sessions["binance"].connector
+        created = (await client.create_session("binance")).connector
+        await existing.call_tool("get_price", {"symbol": "BTCUSDT"})
+        await created.call_tool("get_price", {"symbol": "BTCUSDT"})
+        # Instalarea repetata nu impacheteaza de doua ori
+        cache.wrap_session("binance", client.sessions["binance"])
+        await existing.call_tool("get_price", {"symbol": "BTCUSDT"})
+
+    asyncio.run(main())
+    assert tool.calls == 1
+    assert cache.get_metrics()["hits"] == 2
+
+
+def test_from_mcp_config():
+    assert MCPToolCallCache.from_mcp_config({"features": {"caching": False}}) is None
+    cache = MCPToolCallCache.from_mcp_config({
+        "features": {"caching": True},
+        "mcpServers": {"binance": {"cacheTtl": 3, "cacheToolTtls": {"get_klines": 30}}, "news": {}},
+        "serverConfigs": {"cacheMaxEntries": 50},
+    })
+    assert (cache.ttl_for("binance", "get_price"), cache.ttl_for("binance", "get_klines")) == (3.0, 30)
+    assert cache.ttl_for("news", "latest") == 0.0
+    assert cache.max_entries == 50
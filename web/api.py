@@ -5,49 +5,81 @@ API server pentru interfata web si integrari externe
 """
 
 import asyncio
+import json
 import sys
 import os
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
 
 if sys.platform.startswith('win'):
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, WebSocket
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, WebSocket, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 from loguru import logger
 
 # Local imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.core.ai_agent import CryptoAIAgent, TradingSignal
-from src.trading.binance_client import BinanceClient
-from src.trading.portfolio_tracker import PortfolioTracker
-from src.data.data_fetcher import DataFetcher
+from src.core.response_parser import parse_response
+from src.core.model_router import DEEP, FAST
+from src.data.timeframes import TIMEFRAME_SECONDS
+
+if TYPE_CHECKING:
+    from src.trading.binance_client import BinanceClient
+    from src.trading.portfolio_tracker import PortfolioTracker
+    from src.data.data_fetcher import DataFetcher
 
 # Global agent instance
 agent: Optional[CryptoAIAgent] = None
-portfolio_tracker: Optional[PortfolioTracker] = None
-data_fetcher: Optional[DataFetcher] = None
-binance_client: Optional[BinanceClient] = None
+portfolio_tracker: Optional["PortfolioTracker"] = None
+data_fetcher: Optional["DataFetcher"] = None
+binance_client: Optional["BinanceClient"] = None
+warmup_task: Optional[asyncio.Task] = None
+
+def _create_binance_client() -> "BinanceClient":
+    from src.trading.binance_client import BinanceClient
+    return BinanceClient()
+
+async def warm_up_components() -> None:
+    """Initializeaza componentele grele in fundal; progresul e raportat pe /health"""
+    global portfolio_tracker, data_fetcher, binance_client
+    
+    await agent.start_warm_up()
+    
+    # API-ul foloseste aceleasi instante ca agentul
+    try:
+        portfolio_tracker, data_fetcher = await agent.ready_components("portfolio_tracker", "data_fetcher")
+    except Exception as e:
+        logger.error(f"Error initializing data components: {e}")
+    
+    try:
+        binance_client = await asyncio.to_thread(_create_binance_client)
+    except Exception as e:
+        logger.error(f"Error initializing Binance client: {e}")
+    
+    logger.info("Background warm-up completed")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle management pentru FastAPI app"""
-    global agent, portfolio_tracker, data_fetcher, binance_client
+    global agent, warmup_task
     
     # Startup
     logger.info("Starting Crypto MCP Assistant API...")
     try:
-        agent = CryptoAIAgent()
-        portfolio_tracker = PortfolioTracker()
-        data_fetcher = DataFetcher()
-        binance_client = BinanceClient()
+        # Constructia agentului e ieftina; LLM, MCP si restul se initializeaza in fundal.
+        # Launcher-ul (scripts/start_assistant.py) injecteaza agentul loop-ului de trading.
+        owns_agent = agent is None
+        if owns_agent:
+            agent = CryptoAIAgent()
+        warmup_task = asyncio.create_task(warm_up_components())
         
-        logger.info("All components initialized successfully")
+        logger.info("API ready, components warming up in background")
     except Exception as e:
         logger.error(f"Error during startup: {e}")
         raise
@@ -57,7 +89,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Crypto MCP Assistant API...")
     try:
-        if agent:
+        if warmup_task and not warmup_task.done():
+            warmup_task.cancel()
+        if agent and owns_agent:
             await agent.stop_trading_session()
         logger.info("Shutdown completed successfully")
     except Exception as e:
@@ -87,6 +121,7 @@ security = HTTPBearer(auto_error=False)
 class ChatRequest(BaseModel):
     message: str = Field(..., description="Mesajul utilizatorului")
     context: Optional[str] = Field(None, description="Context additional")
+    session_id: Optional[str] = Field(None, description="ID sesiune pentru istoricul conversatiei")
 
 class TradingSignalRequest(BaseModel):
     symbol: str = Field(..., description="Simbolul crypto (ex: BTCUSDT)")
@@ -134,6 +169,23 @@ async def get_current_agent() -> CryptoAIAgent:
         raise HTTPException(status_code=503, detail="Agent not initialized")
     return agent
 
+def validate_symbol(current_agent: CryptoAIAgent, symbol: str) -> str:
+    """Valideaza simbolul folosind registry-ul compilat al agentului"""
+    symbol = symbol.upper()
+    current_agent.symbol_registry.maybe_reload()
+    if not current_agent.symbol_registry.is_known(symbol):
+        raise HTTPException(status_code=400, detail=f"Unknown symbol: {symbol}")
+    return symbol
+
+def validate_timeframe(current_agent: Optional[CryptoAIAgent], timeframe: Optional[str]) -> str:
+    """Valideaza timeframe-ul (lipsa = timeframe-ul primar din configuratie)"""
+    if timeframe is None:
+        config = current_agent.config if current_agent else {}
+        return config.get('analysis', {}).get('timeframes', {}).get('primary', '5m')
+    if timeframe not in TIMEFRAME_SECONDS:
+        raise HTTPException(status_code=400, detail=f"Unknown timeframe: {timeframe}")
+    return timeframe
+
 async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verificare token pentru autentificare (optional)"""
     # Implement proper authentication in production
@@ -151,9 +203,34 @@ async def health_check():
             "portfolio_tracker": portfolio_tracker is not None,
             "data_fetcher": data_fetcher is not None,
             "binance_client": binance_client is not None
-        }
+        },
+        "readiness": agent.readiness() if agent else {"status": "starting"},
+        "agent_pools": {tier: pool.get_metrics() for tier, pool in agent.agent_pools.items()} if agent else None,
+        "model_router": agent.model_router.get_metrics() if agent else None,
+        "llm_scheduler": agent.llm_scheduler.get_metrics() if agent else None,
+        "signal_pipeline": agent.signal_pipeline.get_metrics() if agent and agent.signal_pipeline else None,
+        "signal_store": agent.signal_store.get_metrics() if agent else None,
+        "signal_dedup": agent.signal_dedup.get_metrics() if agent else None,
+        "analysis_cache": agent.response_cache.get_metrics() if agent else None,
+        "timeframe_cache": agent.timeframe_cache.get_metrics() if agent else None,
+        "single_flight": agent.single_flight.get_metrics() if agent else None,
+        "market_data": data_fetcher.get_metrics() if data_fetcher else None,
+        "tool_cache": agent.tool_cache.get_metrics() if agent and agent.tool_cache else None,
+        "prompt_tokens": agent.prompt_metrics.get_metrics() if agent else None,
+        "llm_calls": agent.llm_metrics.get_metrics() if agent else None,
+        "chat_sessions": len(agent.chat_sessions) if agent else None
     }
 
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Metrici Prometheus (apeluri LLM: latenta, asteptare, tokeni, pasi MCP, cost)"""
+    try:
+        from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+    except ImportError:
+        raise HTTPException(status_code=503, detail="prometheus-client is not installed")
+    
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 # Main endpoints
 @app.get("/")
 async def root():
@@ -176,7 +253,7 @@ async def chat_with_agent(
 ):
     """Chat cu agentul AI pentru analiza crypto"""
     try:
-        response = await current_agent.manual_analysis(request.message)
+        response = await current_agent.manual_analysis(request.message, session_id=request.session_id)
         
         return APIResponse(
             success=True,
@@ -187,12 +264,40 @@ async def chat_with_agent(
         logger.error(f"Error in chat endpoint: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/v1/chat/stream")
+async def chat_with_agent_stream(
+    request: ChatRequest,
+    current_agent: CryptoAIAgent = Depends(get_current_agent)
+):
+    """Chat cu agentul AI, raspunsul e trimis token cu token (Server-Sent Events)"""
+    async def events():
+        try:
+            async for event, text in current_agent.stream_analysis(request.message, session_id=request.session_id):
+                if event == "token":
+                    yield f"data: {json.dumps({'token': text})}\n\n"
+                elif event == "reset":
+                    yield "event: reset\ndata: {}\n\n"
+                else:
+                    yield f"event: done\ndata: {json.dumps({'response': text, 'context': request.context})}\n\n"
+        except Exception as e:
+            logger.error(f"Error in streaming chat endpoint: {e}")
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/api/v1/analyze", response_model=APIResponse)
 async def analyze_symbol(
     request: TradingSignalRequest,
     current_agent: CryptoAIAgent = Depends(get_current_agent)
 ):
     """Analiza detaliata pentru un simbol specific"""
+    request.symbol = validate_symbol(current_agent, request.symbol)
+    request.timeframe = validate_timeframe(current_agent, request.timeframe)
+    
     try:
         query = f"""
         Analizeaza {request.symbol} pe timeframe {request.timeframe}:
@@ -205,7 +310,14 @@ async def analyze_symbol(
         Vreau o analiza detaliata cu nivele concrete de intrare, stop loss si take profit.
         """
         
-        analysis = await current_agent.manual_analysis(query)
+        analysis = await current_agent.cached_analysis(
+            query,
+            template="analyze_symbol",
+            symbol=request.symbol,
+            timeframe=request.timeframe,
+            force_refresh=request.force_analysis,
+            tier=DEEP  # Analiza detaliata - direct pe modelul mare
+        )
         
         return APIResponse(
             success=True,
@@ -232,6 +344,9 @@ async def generate_trading_signal(
     current_agent: CryptoAIAgent = Depends(get_current_agent)
 ):
     """Genereaza semnal de trading pentru un simbol"""
+    request.symbol = validate_symbol(current_agent, request.symbol)
+    request.timeframe = validate_timeframe(current_agent, request.timeframe)
+    
     try:
         # Generate signal using the agent's signal generator
         query = f"""
@@ -246,7 +361,15 @@ async def generate_trading_signal(
         Format: ACTION|ENTRY_PRICE|STOP_LOSS|TAKE_PROFIT|CONFIDENCE|REASONING
         """
         
-        response = await current_agent.manual_analysis(query)
+        response = await current_agent.cached_analysis(
+            query,
+            template="generate_signal",
+            symbol=request.symbol,
+            timeframe=request.timeframe,
+            force_refresh=request.force_analysis,
+            tier=FAST,
+            escalate=True  # Escaladat la modelul mare doar pentru confidence la limita
+        )
         
         # Parse response to extract signal data
         signal_data = _parse_signal_response(response, request.symbol)
@@ -262,11 +385,26 @@ async def generate_trading_signal(
 
 @app.get("/api/v1/signals/active", response_model=APIResponse)
 async def get_active_signals(
+    symbol: Optional[str] = Query(None, description="Filtru simbol (ex: BTCUSDT)"),
+    action: Optional[str] = Query(None, description="Filtru actiune: BUY, SELL, HOLD"),
+    min_confidence: Optional[float] = Query(None, ge=0.0, le=1.0, description="Confidence minim"),
+    since: Optional[datetime] = Query(None, description="Semnale generate dupa acest moment"),
+    until: Optional[datetime] = Query(None, description="Semnale generate inainte de acest moment"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
     current_agent: CryptoAIAgent = Depends(get_current_agent)
 ):
-    """Obtine semnalele active de trading"""
+    """Obtine semnalele active de trading (paginat, cele mai noi primele)"""
     try:
-        active_signals = await current_agent.get_active_signals()
+        active_signals, total = current_agent.signal_store.query(
+            symbol=symbol,
+            action=action,
+            min_confidence=min_confidence,
+            since=since.timestamp() if since else None,
+            until=until.timestamp() if until else None,
+            offset=offset,
+            limit=limit
+        )
         
         signals_data = [
             {
@@ -286,8 +424,14 @@ async def get_active_signals(
         
         return APIResponse(
             success=True,
-            data={"signals": signals_data, "count": len(signals_data)},
-            message=f"Retrieved {len(signals_data)} active signals"
+            data={
+                "signals": signals_data,
+                "count": len(signals_data),
+                "total": total,
+                "offset": offset,
+                "limit": limit
+            },
+            message=f"Retrieved {len(signals_data)} of {total} active signals"
         )
     except Exception as e:
         logger.error(f"Error getting active signals: {e}")
@@ -348,6 +492,8 @@ async def portfolio_operations(
 @app.post("/api/v1/market/data", response_model=APIResponse)
 async def get_market_data(request: MarketDataRequest):
     """Obtine date de piata pentru simbolurile specificate"""
+    request.timeframe = validate_timeframe(agent, request.timeframe)
+    
     try:
         if not data_fetcher:
             raise HTTPException(status_code=503, detail="Data fetcher not available")
@@ -355,6 +501,9 @@ async def get_market_data(request: MarketDataRequest):
         market_data = {}
         
         for symbol in request.symbols:
+            if agent and not agent.symbol_registry.is_known(symbol):
+                market_data[symbol] = {"error": f"Unknown symbol: {symbol}"}
+                continue
             try:
                 data = await data_fetcher.get_symbol_data(
                     symbol=symbol,
@@ -393,7 +542,13 @@ async def get_market_overview(
         Concentreaza-te pe informatii actionabile pentru trading.
         """
         
-        overview = await current_agent.manual_analysis(query)
+        overview = await current_agent.cached_analysis(
+            query,
+            template="market_overview",
+            symbol="MARKET",
+            timeframe="5m",
+            tier=FAST
+        )
         
         return APIResponse(
             success=True,
@@ -469,37 +624,23 @@ async def websocket_market_updates(websocket: WebSocket):
 def _parse_signal_response(response: str, symbol: str) -> Dict[str, Any]:
     """Parse raspunsul AI pentru a extrage datele semnalului"""
     try:
-        # Simple parsing logic - in production this would be more sophisticated
-        lines = response.strip().split('\n')
+        parsed = parse_response(response)
         
-        # Look for action keywords
-        action = "HOLD"
-        confidence = 0.5
-        entry_price = 0.0
-        stop_loss = 0.0
-        take_profit = 0.0
-        reasoning = response
-        
-        response_lower = response.lower()
-        
-        if "buy" in response_lower or "long" in response_lower:
-            action = "BUY"
-            confidence = 0.7
-        elif "sell" in response_lower or "short" in response_lower:
-            action = "SELL"
-            confidence = 0.7
-        
-        if "strong" in response_lower or "confident" in response_lower:
-            confidence = min(confidence + 0.2, 1.0)
+        if parsed.explicit_confidence is not None:
+            confidence = parsed.explicit_confidence
+        else:
+            confidence = 0.7 if parsed.action in ("BUY", "SELL") else 0.5
+            if parsed.strong_language:
+                confidence = min(confidence + 0.2, 1.0)
         
         return {
             "symbol": symbol,
-            "action": action,
+            "action": parsed.action,
             "confidence": confidence,
-            "entry_price": entry_price,
-            "stop_loss": stop_loss,
-            "take_profit": take_profit,
-            "reasoning": reasoning,
+            "entry_price": parsed.entry_price,
+            "stop_loss": parsed.stop_loss,
+            "take_profit": parsed.take_profit,
+            "reasoning": response,
             "timestamp": datetime.now(),
             "risk_score": 1.0 - confidence
         }
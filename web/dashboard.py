@@ -15,6 +15,7 @@ import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import time
+import uuid
 
 # Configuration
 API_BASE_URL = "http://localhost:8000/api/v1"
@@ -120,10 +121,14 @@ def fetch_portfolio_summary():
 
 def send_chat_message(message: str) -> str:
     """Send chat message to AI agent"""
+    # Fiecare utilizator Streamlit are propriul istoric de conversatie pe server
+    if "chat_session_id" not in st.session_state:
+        st.session_state.chat_session_id = str(uuid.uuid4())
+    
     try:
         response = requests.post(
             f"{API_BASE_URL}/chat",
-            json={"message": message},
+            json={"message": message, "session_id": st.session_state.chat_session_id},
             timeout=30
         )
         if response.status_code == 200:
@@ -133,6 +138,47 @@ def send_chat_message(message: str) -> str:
     except Exception as e:
         return f"Error: {str(e)}"
 
+def stream_chat_message(message: str, placeholder) -> str:
+    """Send chat message and render the AI response as tokens arrive"""
+    if "chat_session_id" not in st.session_state:
+        st.session_state.chat_session_id = str(uuid.uuid4())
+    
+    text = ""
+    try:
+        # Timeout-ul de citire se aplica intre tokeni, nu pe toata analiza
+        with requests.post(
+            f"{API_BASE_URL}/chat/stream",
+            json={"message": message, "session_id": st.session_state.chat_session_id},
+            stream=True,
+            timeout=(5, 30)
+        ) as response:
+            if response.status_code != 200:
+                return f"Error: {response.status_code}"
+            
+            event = "message"
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                elif line.startswith("data:"):
+                    payload = json.loads(line[len("data:"):])
+                    if event == "done":
+                        return payload.get("response", text) or "No response"
+                    if event == "error":
+                        return f"Error: {payload.get('error')}"
+                    if event == "reset":
+                        # Textul primit era dintr-un pas intermediar al agentului
+                        text = ""
+                        placeholder.markdown("▌")
+                        continue
+                    text += payload.get("token", "")
+                    placeholder.markdown(text + "▌")
+                elif not line:
+                    event = "message"
+    except Exception as e:
+        return f"Error: {str(e)}"
+    
+    return text or "No response"
+
 def generate_signal(symbol: str, timeframe: str = "5m") -> Dict:
     """Generate trading signal for symbol"""
     try:
@@ -625,15 +671,14 @@ def show_ai_chat():
                     "content": user_input
                 })
                 
-                # Get AI response
-                with st.spinner("AI is thinking..."):
-                    response = send_chat_message(user_input)
-                    
-                    # Add AI response
-                    st.session_state.chat_history.append({
-                        "role": "assistant",
-                        "content": response
-                    })
+                # Get AI response (streamed)
+                response = stream_chat_message(user_input, st.empty())
+                
+                # Add AI response
+                st.session_state.chat_history.append({
+                    "role": "assistant",
+                    "content": response
+                })
                 
                 st.experimental_rerun()
     